@@ -1,151 +1,805 @@
-import asyncio
-import uuid
-from datetime import datetime, timedelta
-from typing import Dict, Optional
-import os
-import sys
-import traceback
-from enum import Enum
-
-# Add src to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from src.crew import NewsResearchCrew
-from api.models import JobStatus
-
-class JobManager:
-    def __init__(self):
-        self.jobs: Dict[str, Dict] = {}
-        self.max_concurrent_jobs = 3
-        self.job_timeout_minutes = 15
-    
-    def create_job(self, topic: str, llm_provider: str = "google") -> str:
-        """Create a new research job"""
-        job_id = f"news_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
-        
-        self.jobs[job_id] = {
-            "id": job_id,
-            "topic": topic,
-            "llm_provider": llm_provider,
-            "status": JobStatus.pending,
-            "progress": 0.0,
-            "current_step": "Initializing...",
-            "created_at": datetime.now(),
-            "started_at": None,
-            "completed_at": None,
-            "error_message": None,
-            "result": None,
-            "research_file": None,
-            "report_file": None,
-        }
-        
-        return job_id
-    
-    async def execute_job(self, job_id: str):
-        """Execute a research job in the background"""
-        if job_id not in self.jobs:
-            return
-        
-        job = self.jobs[job_id]
-        
-        try:
-            # Update job status
-            job["status"] = JobStatus.running
-            job["started_at"] = datetime.now()
-            job["current_step"] = "Setting up research crew..."
-            job["progress"] = 10.0
-            
-            # Set LLM provider
-            os.environ['LLM_PROVIDER'] = job["llm_provider"]
-            
-            # Update progress
-            job["current_step"] = "Initializing agents and tools..."
-            job["progress"] = 20.0
-            
-            # Create and run crew
-            crew = NewsResearchCrew(job["topic"])
-            
-            job["current_step"] = "Researching news articles..."
-            job["progress"] = 40.0
-            
-            # Execute research (this might take a few minutes)
-            result = crew.run()
-            
-            job["current_step"] = "Generating final report..."
-            job["progress"] = 80.0
-            
-            # Find generated files
-            topic_clean = job["topic"].replace(' ', '_').lower()
-            output_files = [f for f in os.listdir("outputs") if topic_clean in f.lower()]
-            
-            research_files = [f for f in output_files if "research" in f]
-            report_files = [f for f in output_files if "final_report" in f or "report" in f]
-            
-            job["research_file"] = f"outputs/{research_files[0]}" if research_files else None
-            job["report_file"] = f"outputs/{report_files[0]}" if report_files else None
-            
-            # Complete job
-            job["status"] = JobStatus.completed
-            job["completed_at"] = datetime.now()
-            job["current_step"] = "Research completed successfully!"
-            job["progress"] = 100.0
-            job["result"] = str(result) if result else "Research completed"
-            
-        except Exception as e:
-            # Handle errors
-            job["status"] = JobStatus.failed
-            job["completed_at"] = datetime.now()
-            job["error_message"] = str(e)
-            job["current_step"] = f"Error: {str(e)}"
-            job["progress"] = 0.0
-            
-            # Log error for debugging
-            print(f"Job {job_id} failed: {str(e)}")
-            traceback.print_exc()
-    
-    def get_job_status(self, job_id: str) -> Optional[Dict]:
-        """Get current job status"""
-        return self.jobs.get(job_id)
-    
-    def get_job_results(self, job_id: str) -> Optional[Dict]:
-        """Get job results with file content"""
-        job = self.jobs.get(job_id)
-        if not job or job["status"] != JobStatus.completed:
-            return job
-        
-        # Read file contents
-        try:
-            if job["research_file"] and os.path.exists(job["research_file"]):
-                with open(job["research_file"], 'r', encoding='utf-8') as f:
-                    job["research_content"] = f.read()
-            
-            if job["report_file"] and os.path.exists(job["report_file"]):
-                with open(job["report_file"], 'r', encoding='utf-8') as f:
-                    job["report_content"] = f.read()
-                    
-        except Exception as e:
-            print(f"Error reading files for job {job_id}: {str(e)}")
-        
-        return job
-    
-    def cleanup_old_jobs(self, max_age_hours: int = 24):
-        """Clean up old completed jobs"""
-        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
-        
-        jobs_to_remove = []
-        for job_id, job in self.jobs.items():
-            if job["completed_at"] and job["completed_at"] < cutoff_time:
-                jobs_to_remove.append(job_id)
-        
-        for job_id in jobs_to_remove:
-            del self.jobs[job_id]
-        
-        return len(jobs_to_remove)
-    
-    def get_running_jobs_count(self) -> int:
-        """Get count of currently running jobs"""
-        return sum(1 for job in self.jobs.values() if job["status"] == JobStatus.running)
-    
-    def can_start_new_job(self) -> bool:
-        """Check if we can start a new job"""
-        return self.get_running_jobs_count() < self.max_concurrent_jobs
+import asyncio
+import math
+import random
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import os
+import sys
+import traceback
+from enum import Enum
+
+# Add src to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.cancellation import CancellationToken, JobCancelled
+from src.checkpoints import CheckpointStore
+from src.batch import summarize_batch, write_batch_report
+from src.tasks import normalize_topic, output_paths
+from src import profiling, tracing
+from api.models import JobPriority, JobStatus
+from api.job_store import create_job_store
+from api.content_cache import ContentCache
+from api.events import FINISHED_STATUSES, JobEventBroadcaster
+from api.metrics import JOB_DURATION_SECONDS, JOB_QUEUE_WAIT_SECONDS, JOBS_SUBMITTED
+from api.workers import create_worker_backend
+
+# Stored as integers so the queue can order by them
+PRIORITY_LEVELS = {JobPriority.low: 0, JobPriority.normal: 1, JobPriority.high: 2}
+PRIORITY_NAMES = {level: priority for priority, level in PRIORITY_LEVELS.items()}
+
+class QueueFull(Exception):
+    """Raised when accepting more jobs would exceed the maximum queue depth"""
+
+class JobManager:
+    def __init__(self, worker_backend: Optional[str] = None, job_store: Optional[str] = None,
+                 concurrency: Optional[int] = None):
+        self.store = create_job_store(job_store)
+        # Crews this process runs at once; 0 only queues jobs for standalone workers (worker.py)
+        self.max_concurrent_jobs = int(os.getenv('JOB_CONCURRENCY', '3')) if concurrency is None else concurrency
+        self.job_timeout_minutes = float(os.getenv('JOB_TIMEOUT_MINUTES', '15'))
+        self.max_events_per_job = 100
+        self.max_queue_depth = int(os.getenv('JOB_MAX_QUEUE_DEPTH', '100'))
+        self.result_cache_minutes = float(os.getenv('RESULT_CACHE_TTL_MINUTES', '60'))
+        # Share of executed jobs profiled without asking for it (0-100)
+        self.profile_sample_percent = float(os.getenv('JOB_PROFILE_SAMPLE_PERCENT', '0'))
+        # File contents for /results live here rather than on job records
+        self.content_cache = ContentCache(int(float(os.getenv('RESULT_CONTENT_CACHE_MB', '64')) * 1024 * 1024))
+        # Pushes job progress to SSE/WebSocket subscribers
+        self.broadcaster = JobEventBroadcaster(self)
+        self.queue_poll_seconds = 1.0
+        self.heartbeat_seconds = float(os.getenv('JOB_HEARTBEAT_SECONDS', '10'))
+        self.lease_seconds = float(os.getenv('JOB_LEASE_SECONDS', '60'))
+        self.max_attempts = int(os.getenv('JOB_MAX_ATTEMPTS', '3'))
+        self.avg_job_seconds = 180.0  # Moving average of job durations, used for queue ETAs
+        self._workers: List[asyncio.Task] = []
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._draining = False
+        
+        # API processes and standalone workers share the store. Jobs this process runs carry
+        # its worker id and are kept alive by its heartbeats, so the others leave them alone.
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        
+        # Executions running in this process, keyed by the id of the job that started them.
+        # The owner receives progress; it only differs from the execution id after the
+        # original job was cancelled while coalesced jobs were still waiting on it.
+        self._execution_owner: Dict[str, str] = {}
+        self.cancel_tokens: Dict[str, CancellationToken] = {}
+        self.backend = create_worker_backend(worker_backend, max_workers=self.max_concurrent_jobs)
+        
+        # Jobs a dead worker was running can't still be alive
+        self.recover_orphans()
+    
+    # ===== QUEUE =====
+    def start(self):
+        """Start the queue workers and heartbeat on the running event loop (idempotent)"""
+        if self._heartbeat:
+            return
+        self._wakeup = asyncio.Event()
+        self._workers = [
+            asyncio.create_task(self._worker_loop()) for _ in range(self.max_concurrent_jobs)
+        ]
+        self._heartbeat = asyncio.create_task(self._heartbeat_loop())
+        print(f"🧵 Job queue started with {self.max_concurrent_jobs} workers ({self.worker_id})")
+    
+    def submit(self):
+        """Wake the queue workers after jobs were queued"""
+        self.start()
+        self._wakeup.set()
+    
+    async def _worker_loop(self):
+        while not self._draining:
+            self._wakeup.clear()
+            job = self.store.claim_next(self.worker_id)
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.queue_poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            try:
+                await self._run_job(job)
+            except Exception as e:
+                print(f"Job {job['id']}: queue worker error: {str(e)}")
+                traceback.print_exc()
+    
+    async def _heartbeat_loop(self):
+        """Renew this process's running jobs, act on cancel requests made through other
+        processes, and recover jobs of workers that stopped heartbeating"""
+        while True:
+            try:
+                for job_id, reason in self.store.heartbeat(self.worker_id, self.max_concurrent_jobs).items():
+                    self.update_job(job_id, cancel_requested=None)
+                    self.cancel_job(job_id, reason)
+                self.recover_orphans()
+            except Exception as e:
+                print(f"Job heartbeat error: {str(e)}")
+            await asyncio.sleep(self.heartbeat_seconds)
+    
+    async def drain(self):
+        """Stop claiming jobs and wait for the running ones to finish"""
+        self._draining = True
+        if self._wakeup:
+            self._wakeup.set()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+    
+    def recover_orphans(self) -> Dict[str, JobStatus]:
+        """Re-queue (or, after JOB_MAX_ATTEMPTS claims, fail) running jobs whose lease expired
+        
+        A lease expires JOB_LEASE_SECONDS after the last heartbeat of the worker running the job.
+        """
+        stale_before = datetime.now() - timedelta(seconds=self.lease_seconds)
+        orphans = self.store.recover_orphans("Its worker stopped responding", stale_before, self.max_attempts)
+        requeued = sum(1 for status in orphans.values() if status == JobStatus.pending)
+        if requeued:
+            print(f"🔁 Re-queued {requeued} jobs of workers that stopped responding")
+            if self._wakeup:
+                self._wakeup.set()
+        if len(orphans) > requeued:
+            print(f"⚠️  Marked {len(orphans) - requeued} interrupted jobs as failed after {self.max_attempts} attempts")
+        return orphans
+    
+    def list_workers(self) -> List[Dict]:
+        """API processes and standalone workers currently heartbeating"""
+        return self.store.list_workers(datetime.now() - timedelta(seconds=self.lease_seconds))
+    
+    def _ensure_queue_capacity(self, count: int = 1):
+        queued = self.store.count(JobStatus.pending)
+        if queued + count > self.max_queue_depth:
+            raise QueueFull(f"Job queue is full ({queued}/{self.max_queue_depth} jobs waiting)")
+    
+    def get_queue_info(self, job: Dict) -> Dict:
+        """Queue position and estimated start/completion of a job"""
+        if job.get("coalesced_with") and job["status"] == JobStatus.pending:
+            job = self.store.get(job["coalesced_with"], events=0) or job
+        if job["status"] != JobStatus.pending:
+            return {"queue_position": None, "estimated_start": None, "estimated_completion": None}
+        
+        position = self.store.queue_position(job)
+        capacity = self.store.capacity(datetime.now() - timedelta(seconds=self.lease_seconds))
+        if capacity == 0:
+            # No live worker to run it
+            return {"queue_position": position, "estimated_start": None, "estimated_completion": None}
+        
+        free_workers = max(0, capacity - self.get_running_jobs_count())
+        if position <= free_workers:
+            wait_seconds = 0.0
+        else:
+            # Jobs ahead of this one drain in waves of the workers' combined capacity
+            waves = math.ceil((position - free_workers) / capacity)
+            wait_seconds = waves * self.avg_job_seconds
+        
+        estimated_start = datetime.now() + timedelta(seconds=wait_seconds)
+        return {
+            "queue_position": position,
+            "estimated_start": estimated_start,
+            "estimated_completion": estimated_start + timedelta(seconds=self.avg_job_seconds),
+        }
+    
+    # ===== JOBS =====
+    def create_job(self, topic: str, llm_provider: str = "google", parallel_angles: int = 1,
+                   incremental: bool = False, batch_id: Optional[str] = None,
+                   priority: JobPriority = JobPriority.normal, max_articles: int = 8,
+                   force_refresh: bool = False, profile: bool = False) -> str:
+        """Queue a new research job (raises QueueFull when the queue is at capacity)
+        
+        If the topic was researched within the last RESULT_CACHE_TTL_MINUTES the job
+        completes immediately with that result (unless force_refresh). A request
+        identical to a pending or running one is attached to that execution instead:
+        it gets its own job id but no crew of its own. Jobs asking for a profile
+        always run a crew of their own; JOB_PROFILE_SAMPLE_PERCENT of the other jobs
+        that run one are profiled too.
+        """
+        job_id = f"news_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        record = self._new_job_record(
+            job_id, topic, llm_provider, parallel_angles, incremental, batch_id, priority, max_articles
+        )
+        
+        # Incremental runs exist to fetch what's new, so they never reuse a result
+        cached = None if force_refresh or incremental or profile else self._find_fresh_result(record)
+        if cached:
+            now = datetime.now()
+            age_minutes = int((now - cached["completed_at"]).total_seconds() // 60)
+            record.update(
+                cached_from=cached["id"],
+                status=JobStatus.completed,
+                progress=100.0,
+                current_step=f"Served from a result completed {age_minutes} min ago",
+                started_at=now,
+                completed_at=now,
+                result=cached["result"],
+                research_file=cached["research_file"],
+                report_file=cached["report_file"],
+                tokens_used=0,
+            )
+            self.store.create(record)
+            JOBS_SUBMITTED.inc(outcome="cached")
+            return job_id
+        
+        owner = None if profile else self.store.find_inflight(record)
+        if owner:
+            record["coalesced_with"] = owner["id"]
+            record["current_step"] = "Attached to an identical job already in progress"
+            self.store.create(record)
+            
+            # The shared execution runs at the most urgent priority that asked for it
+            if owner["status"] == JobStatus.pending and record["priority"] > owner["priority"]:
+                self.update_job(owner["id"], priority=record["priority"])
+            
+            # Another process may have finished the owner meanwhile - queue on our own then
+            owner = self.store.get(owner["id"], events=0)
+            if owner is None or owner["status"] not in (JobStatus.pending, JobStatus.running):
+                self.update_job(job_id, coalesced_with=None, current_step="Queued - waiting for a worker...")
+                JOBS_SUBMITTED.inc(outcome="queued")
+            else:
+                JOBS_SUBMITTED.inc(outcome="coalesced")
+            return job_id
+        
+        if batch_id is None:
+            self._ensure_queue_capacity()
+        record["profile"] = profile or random.random() * 100 < self.profile_sample_percent
+        self.store.create(record)
+        JOBS_SUBMITTED.inc(outcome="queued")
+        
+        return job_id
+    
+    def _find_fresh_result(self, job: Dict) -> Optional[Dict]:
+        """Completed job for the same topic and provider within the freshness window"""
+        if self.result_cache_minutes <= 0:
+            return None
+        
+        cutoff = datetime.now() - timedelta(minutes=self.result_cache_minutes)
+        cached = self.store.latest_completed(job["topic_key"], job["llm_provider"], cutoff)
+        if cached and os.path.exists(cached["report_file"]):
+            return cached
+        return None
+    
+    def _new_job_record(self, job_id: str, topic: str, llm_provider: str, parallel_angles: int,
+                        incremental: bool = False, batch_id: Optional[str] = None,
+                        priority: JobPriority = JobPriority.normal, max_articles: int = 8) -> Dict:
+        return {
+            "id": job_id,
+            "topic": topic,
+            "topic_key": normalize_topic(topic),
+            "llm_provider": llm_provider,
+            "max_articles": max_articles,
+            "parallel_angles": parallel_angles,
+            "incremental": incremental,
+            "batch_id": batch_id,
+            "priority": PRIORITY_LEVELS[JobPriority(priority)],
+            "coalesced_with": None,
+            "cached_from": None,
+            "status": JobStatus.pending,
+            "progress": 0.0,
+            "current_step": "Queued - waiting for a worker...",
+            "created_at": datetime.now(),
+            "started_at": None,
+            "completed_at": None,
+            "error_message": None,
+            "result": None,
+            "research_file": None,
+            "report_file": None,
+            "tokens_used": None,
+            "worker_id": None,
+            "heartbeat_at": None,
+            "cancel_requested": None,
+            "attempts": 0,
+            "version": 0,
+            # Executions continue the trace of the request that queued the job
+            "trace_parent": tracing.current_traceparent(),
+            "profile": False,
+        }
+    
+    def update_job(self, job_id: str, **fields):
+        """Persist changes to a job record"""
+        self.store.update(job_id, **fields)
+        self.broadcaster.notify(job_id)
+    
+    async def _run_job(self, job: Dict):
+        """Run a job the queue has just claimed (already marked running)"""
+        attributes = {"job.id": job["id"], "job.attempt": job.get("attempts"), "worker.id": self.worker_id}
+        tracing.record_span(
+            "job.queued", job["created_at"].timestamp(), job["started_at"].timestamp(),
+            parent=job.get("trace_parent"), attributes=attributes,
+        )
+        with tracing.span("JobManager.execute_job", parent=job.get("trace_parent"), attributes={
+            **attributes, "job.topic": job["topic"], "llm.provider": job["llm_provider"], "worker.backend": self.backend.name,
+        }):
+            await self._execute_job(job)
+    
+    async def _execute_job(self, job: Dict):
+        """Run the job's crew on the worker backend and record how it ended"""
+        job_id = job["id"]
+        token = CancellationToken.with_timeout(self.job_timeout_minutes)
+        self.cancel_tokens[job_id] = token
+        self._execution_owner[job_id] = job_id
+        JOB_QUEUE_WAIT_SECONDS.observe((job["started_at"] - job["created_at"]).total_seconds())
+        outcome_label = "failed"
+        
+        try:
+            self.update_job(job_id, current_step="Setting up research crew...", progress=0.0)
+            # The crew records its own parameters; the queue's are needed to resume it too
+            CheckpointStore(job_id).save_metadata(priority=PRIORITY_NAMES[job["priority"]].value)
+            
+            spec = {
+                "topic": job["topic"],
+                "llm_provider": job["llm_provider"],
+                "parallel_angles": job["parallel_angles"],
+                "incremental": job["incremental"],
+                "max_articles": job["max_articles"],
+                "run_id": job_id,  # Checkpoints are kept per job
+                # Batch jobs share one LLM client and search cache per worker process
+                "shared_resources": job["batch_id"] is not None,
+                "trace_parent": tracing.current_traceparent(),
+                "profile": job["profile"],
+            }
+            
+            # Execute research off the event loop (this might take a few minutes)
+            outcome = await self.backend.run(
+                job_id, spec, lambda event: self._record_event(job_id, event), token
+            )
+            
+            # Complete job
+            completed_at = datetime.now()
+            duration = (completed_at - job["started_at"]).total_seconds()
+            self.avg_job_seconds = 0.8 * self.avg_job_seconds + 0.2 * duration
+            outcome_label = "completed"
+            self._finish_execution(
+                job_id,
+                status=JobStatus.completed,
+                completed_at=completed_at,
+                current_step="Research completed successfully!",
+                progress=100.0,
+                result=outcome["result"],
+                research_file=outcome.get("research_file"),
+                report_file=outcome.get("report_file"),
+            )
+            
+        except JobCancelled as e:
+            # Keep whatever the crew produced before it stopped
+            self._finish_execution(
+                job_id,
+                status=JobStatus.cancelled,
+                completed_at=datetime.now(),
+                error_message=str(e),
+                current_step=f"Cancelled: {str(e)}",
+                **self._partial_output_files(job),
+            )
+            outcome_label = "cancelled"
+            print(f"Job {job_id} cancelled: {str(e)}")
+            
+        except Exception as e:
+            # Handle errors
+            self._finish_execution(
+                job_id,
+                status=JobStatus.failed,
+                completed_at=datetime.now(),
+                error_message=str(e),
+                current_step=f"Error: {str(e)}",
+                progress=0.0,
+            )
+            
+            # Log error for debugging
+            print(f"Job {job_id} failed: {str(e)}")
+            traceback.print_exc()
+        
+        finally:
+            JOB_DURATION_SECONDS.observe((datetime.now() - job["started_at"]).total_seconds(), outcome=outcome_label)
+            tracing.set_attributes({"job.outcome": outcome_label})
+            self.cancel_tokens.pop(job_id, None)
+            self._execution_owner.pop(job_id, None)
+            self._wakeup.set()  # A worker slot (or batch slot) just freed up
+    
+    def _finish_execution(self, execution_id: str, **fields):
+        """Record an execution's outcome on its owner job and every job coalesced with it"""
+        owner_id = self._execution_owner.pop(execution_id, execution_id)
+        
+        # Owner first: jobs attaching after this see it finished and queue on their own
+        self.update_job(owner_id, **fields)
+        owner = self.store.get(owner_id, events=0)
+        for follower in self.store.followers(owner_id):
+            self.update_job(follower["id"], started_at=owner["started_at"] if owner else None, **fields)
+    
+    def create_batch(self, topics: List[str], llm_provider: str = "google", parallel_angles: int = 1,
+                     incremental: bool = False, concurrency: int = 3,
+                     priority: JobPriority = JobPriority.low, force_refresh: bool = False) -> Dict:
+        """Queue one job per topic, grouped under a batch (raises QueueFull if they don't all fit)"""
+        self._ensure_queue_capacity(len(topics))
+        batch_id = f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        
+        # Stored before its jobs so no worker sees them without the concurrency limit
+        batch = {
+            "id": batch_id,
+            "job_ids": [],
+            "concurrency": concurrency,
+            "created_at": datetime.now(),
+            "started_at": None,
+            "completed_at": None,
+        }
+        self.store.create_batch(batch)
+        
+        batch["job_ids"] = [
+            self.create_job(topic, llm_provider, parallel_angles, incremental, batch_id=batch_id,
+                            priority=priority, force_refresh=force_refresh)
+            for topic in topics
+        ]
+        self.store.update_batch(batch_id, job_ids=batch["job_ids"])
+        return batch
+    
+    async def execute_batch(self, batch_id: str):
+        """Queue a batch's jobs (at most `concurrency` run at once), then write the batch report"""
+        batch = self.store.get_batch(batch_id)
+        self.store.update_batch(batch_id, started_at=datetime.now())
+        self.submit()
+        
+        finished = (JobStatus.completed, JobStatus.failed, JobStatus.cancelled)
+        while True:
+            jobs = [self.store.get(job_id, events=0) for job_id in batch["job_ids"]]
+            if all(job is None or job["status"] in finished for job in jobs):
+                break
+            await asyncio.sleep(self.queue_poll_seconds)
+        self.store.update_batch(batch_id, completed_at=datetime.now())
+        
+        summary = self.get_batch_summary(batch_id)
+        write_batch_report(batch_id, summary.pop("results"), summary)
+    
+    def get_batch_summary(self, batch_id: str) -> Optional[Dict]:
+        """Per-topic results and aggregate throughput for a batch"""
+        batch = self.store.get_batch(batch_id)
+        if not batch:
+            return None
+        
+        results = []
+        for index, job_id in enumerate(batch["job_ids"]):
+            job = self.store.get(job_id, events=0)
+            if not job:
+                continue
+            duration = None
+            if job["started_at"] and job["completed_at"]:
+                duration = round((job["completed_at"] - job["started_at"]).total_seconds(), 2)
+            results.append({
+                "index": index,
+                "job_id": job_id,
+                "topic": job["topic"],
+                "status": job["status"].value,
+                "duration_seconds": duration,
+                "research_file": job["research_file"],
+                "report_file": job["report_file"],
+                "error": job["error_message"],
+            })
+        
+        end = batch["completed_at"] or datetime.now()
+        wall_seconds = (end - batch["started_at"]).total_seconds() if batch["started_at"] else 0.0
+        
+        summary = summarize_batch(
+            results,
+            wall_seconds,
+            batch_id=batch_id,
+            status="completed" if batch["completed_at"] else ("running" if batch["started_at"] else "pending"),
+            concurrency=batch["concurrency"],
+        )
+        summary["results"] = results
+        return summary
+    
+    def cancel_job(self, job_id: str, reason: str = "Job cancelled by user", force: bool = False) -> bool:
+        """Request cancellation of a pending or running job (force hard-kills process workers)
+        
+        Cancelling one of several coalesced jobs only detaches it - the shared
+        execution keeps running for the others. Jobs running in another API process
+        are flagged and cancelled by that process at its next heartbeat.
+        """
+        job = self.store.get(job_id, events=0)
+        if not job or job["status"] not in (JobStatus.pending, JobStatus.running):
+            return False
+        
+        if job["coalesced_with"]:
+            self._mark_cancelled(job_id, reason)
+            return True
+        
+        execution_id = self._local_execution(job_id)
+        if job["status"] == JobStatus.running and execution_id is None:
+            # Running in another API process, which acts on it at its next heartbeat
+            self.update_job(job_id, cancel_requested=reason, current_step="Cancelling...")
+            return True
+        
+        followers = self.store.followers(job_id)
+        if followers:
+            self._hand_over(job, followers)
+            self._mark_cancelled(job_id, reason)
+            return True
+        
+        if job["status"] == JobStatus.pending:
+            self._mark_cancelled(job_id, reason)
+            return True
+        
+        token = self.cancel_tokens.get(execution_id)
+        if token:
+            # The crew stops at its next step or tool call
+            token.cancel(reason)
+            self.update_job(job_id, current_step="Cancelling...")
+            if force and not self.backend.kill(execution_id):
+                print(f"Job {job_id}: {self.backend.name} workers can't be killed, cancelling cooperatively")
+            return True
+        
+        return False
+    
+    def _mark_cancelled(self, job_id: str, reason: str):
+        self.update_job(
+            job_id,
+            status=JobStatus.cancelled,
+            completed_at=datetime.now(),
+            error_message=reason,
+            current_step=f"Cancelled: {reason}",
+            coalesced_with=None,
+        )
+    
+    def _local_execution(self, job_id: str) -> Optional[str]:
+        """Id of the execution this process runs for `job_id`, if any"""
+        return next((execution_id for execution_id, owner in self._execution_owner.items() if owner == job_id), None)
+    
+    def _hand_over(self, owner: Dict, followers: List[Dict]):
+        """Make the oldest follower the owner of a shared execution its owner is leaving"""
+        new_owner = followers[0]["id"]
+        self.update_job(
+            new_owner,
+            coalesced_with=None,
+            status=owner["status"],
+            started_at=owner["started_at"],
+            progress=owner["progress"],
+            current_step=owner["current_step"],
+            priority=owner["priority"],
+            worker_id=owner["worker_id"],
+            heartbeat_at=owner["heartbeat_at"],
+        )
+        for follower in followers[1:]:
+            self.update_job(follower["id"], coalesced_with=new_owner)
+        
+        # A pending execution is simply queued under the new owner; a running one
+        # keeps going and reports to it from now on
+        execution_id = self._local_execution(owner["id"])
+        if execution_id:
+            self._execution_owner[execution_id] = new_owner
+    
+    def resume_job(self, job_id: str) -> bool:
+        """Re-queue a failed or cancelled job; the crew resumes from its last checkpoint
+        
+        Jobs lost in a server restart are rebuilt from their checkpoint manifest.
+        Raises QueueFull when the queue is at capacity.
+        """
+        job = self.store.get(job_id, events=0)
+        
+        if job is None:
+            manifest = CheckpointStore.load_manifest(job_id)
+            if not manifest or "topic" not in manifest:
+                return False
+        elif job["status"] not in (JobStatus.failed, JobStatus.cancelled):
+            return False
+        
+        self._ensure_queue_capacity()
+        if job is None:
+            self.store.create(self._new_job_record(
+                job_id,
+                manifest["topic"],
+                manifest.get("llm_provider", "google"),
+                manifest.get("parallel_angles", 1),
+                manifest.get("incremental", False),
+                priority=manifest.get("priority", JobPriority.normal),
+                max_articles=manifest.get("max_articles") or 8,
+            ))
+        
+        self.update_job(
+            job_id,
+            status=JobStatus.pending,
+            progress=0.0,
+            current_step="Resuming from last checkpoint...",
+            completed_at=None,
+            error_message=None,
+            attempts=0,
+        )
+        
+        return True
+    
+    def shutdown(self):
+        """Stop the queue workers and worker processes"""
+        for task in self._workers + [self._heartbeat]:
+            if task:
+                task.cancel()
+        self.backend.shutdown()
+        self.store.close()
+    
+    @staticmethod
+    def _partial_output_files(job: Dict) -> Dict:
+        """Files a stopped job wrote before it stopped (its crew's file names follow the job id)"""
+        paths = output_paths(job["topic"], job["id"])
+        return {name: path if os.path.exists(path) else None for name, path in paths.items()}
+    
+    def _record_event(self, execution_id: str, event: Dict):
+        """Apply a crew progress event to the job record (the tracker never moves progress backwards)"""
+        job_id = self._execution_owner.get(execution_id, execution_id)
+        
+        fields = {"progress": event["progress"], "current_step": event["message"]}
+        if event.get("tokens") is not None:
+            fields["tokens_used"] = event["tokens"]
+        
+        self.store.update(job_id, **fields)
+        self.store.append_event(job_id, event, self.max_events_per_job)
+        self.broadcaster.notify(job_id)
+    
+    def get_job_status(self, job_id: str) -> Optional[Dict]:
+        """Get current job status with its most recent events
+        
+        Jobs coalesced with another job report that job's live progress.
+        """
+        job = self.store.get(job_id)
+        if job and job["coalesced_with"] and job["status"] == JobStatus.pending:
+            owner = self.store.get(job["coalesced_with"])
+            if owner:
+                self._follow_owner(job, owner)
+        return job
+    
+    def get_job_statuses(self, job_ids: List[str]) -> Dict[str, Dict]:
+        """get_job_status for many jobs at once, without events (missing jobs are left out)"""
+        jobs = self.store.get_many(job_ids)
+        following = [job for job in jobs.values() if job["coalesced_with"] and job["status"] == JobStatus.pending]
+        owners = self.store.get_many([job["coalesced_with"] for job in following]) if following else {}
+        for job in following:
+            if job["coalesced_with"] in owners:
+                self._follow_owner(job, owners[job["coalesced_with"]])
+        return jobs
+    
+    @staticmethod
+    def _follow_owner(job: Dict, owner: Dict):
+        """Report the live progress of the execution a coalesced job waits on"""
+        for field in ("status", "progress", "current_step", "started_at", "tokens_used", "events"):
+            job[field] = owner[field]
+        job["owner_version"] = owner["version"]
+    
+    def status_version(self, job: Dict, queue: Optional[Dict] = None) -> str:
+        """Token that changes whenever the job's status response does (used as its ETag)
+        
+        Built from the record's version, the version of the job it is coalesced with
+        and its queue position. Estimated start times drift without changing it.
+        """
+        queue = self.get_queue_info(job) if queue is None else queue
+        version = str(job["version"])
+        if job.get("owner_version") is not None:
+            version += f".{job['owner_version']}"
+        if queue["queue_position"]:
+            version += f"-q{queue['queue_position']}"
+        return version
+    
+    async def wait_for_status_change(self, job_id: str, version: str, timeout: float) -> Optional[Dict]:
+        """Long-poll: the job's status once its version differs from `version`, or after `timeout` seconds
+        
+        Returns None if the job disappears. Finished jobs return at once.
+        """
+        job = self.get_job_status(job_id)
+        if job is None or job["status"] in FINISHED_STATUSES or self.status_version(job) != version:
+            return job
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        async with self.broadcaster.subscribe(job_id) as updates:
+            while (remaining := deadline - loop.time()) > 0:
+                try:
+                    message = await asyncio.wait_for(updates.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                job = self.get_job_status(job_id)
+                if job is None or message is None or self.status_version(job) != version:
+                    break
+        return job
+    
+    def list_jobs(self, status: Optional[JobStatus] = None, limit: int = 100, **filters) -> List[Dict]:
+        """A page of jobs, newest first unless `newest_first=False` (filters as in JobStore.page)"""
+        if filters.get("topic_prefix"):
+            filters["topic_prefix"] = normalize_topic(filters["topic_prefix"])
+        return self.store.page(status=status, limit=limit, **filters)
+    
+    def get_job_results(self, job_id: str, research: bool = True, report: bool = True) -> Optional[Dict]:
+        """Get job results with file content (a copy of the record - contents are never stored on it)
+        
+        `research` and `report` choose which contents are read. Contents too large for the
+        content cache come back as a LargeFile to stream rather than a string.
+        """
+        job = self.store.get(job_id, events=0)
+        if not job or job["status"] != JobStatus.completed:
+            return job
+        
+        # Hot results come from the content cache, cold ones from disk
+        try:
+            if research and job["research_file"]:
+                job["research_content"] = self.content_cache.read(job["research_file"])
+            
+            if report and job["report_file"]:
+                job["report_content"] = self.content_cache.read(job["report_file"])
+            
+            # Workers on other machines may not share outputs/ - the store has the report text
+            if report and job.get("report_content") is None:
+                job["report_content"] = job["result"]
+                    
+        except Exception as e:
+            print(f"Error reading files for job {job_id}: {str(e)}")
+        
+        return job
+    
+    def get_job_trace(self, job_id: str) -> Optional[Dict]:
+        """Spans recorded for a job with a critical-path and time breakdown of its executions
+        
+        Jobs coalesced with another job include that job's execution. Spans are read from
+        the file exporter's output; with only OTLP export, look the trace id up in the collector.
+        """
+        job = self.store.get(job_id, events=0)
+        if job is None:
+            return None
+        
+        job_ids = [job_id]
+        if job["coalesced_with"]:
+            job_ids.append(job["coalesced_with"])
+        
+        spans = []
+        trace_ids = []
+        for record in [job] + [self.store.get(owner, events=0) for owner in job_ids[1:]]:
+            trace_id = tracing.trace_id_of(record["trace_parent"]) if record else None
+            if trace_id and trace_id not in trace_ids:
+                trace_ids.append(trace_id)
+                spans.extend(tracing.load_spans(trace_id))
+        
+        # Keep the jobs' own spans, everything under them and the requests above them
+        by_id = {span["span_id"]: span for span in spans}
+        keep = {span["span_id"] for span in spans if span["attributes"].get("job.id") in job_ids}
+        for span in spans:
+            parent = by_id.get(span["parent_id"])
+            if parent and parent["span_id"] in keep:
+                keep.add(span["span_id"])
+        for span_id in list(keep):
+            parent_id = by_id[span_id]["parent_id"]
+            while parent_id in by_id and parent_id not in keep:
+                keep.add(parent_id)
+                parent_id = by_id[parent_id]["parent_id"]
+        spans = [span for span in spans if span["span_id"] in keep]
+        
+        executions = [span for span in spans if span["name"] == "JobManager.execute_job"]
+        queued = [span for span in spans if span["name"] == "job.queued"]
+        analysis = None
+        if executions:
+            latest = executions[-1]
+            analysis = {
+                "queued_ms": queued[-1]["duration_ms"] if queued else None,
+                **tracing.time_breakdown(spans, latest),
+                "critical_path": tracing.critical_path(spans, latest["span_id"]),
+            }
+        
+        return {
+            "job_id": job_id,
+            "trace_ids": trace_ids,
+            "exporters": tracing.exporter_names(),
+            "span_count": len(spans),
+            "analysis": analysis,
+            "spans": spans,
+        }
+    
+    def cleanup_old_jobs(self, max_age_hours: int = 24):
+        """Clean up old completed jobs"""
+        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
+        
+        jobs_to_remove = self.store.delete_completed_before(cutoff_time)
+        
+        for job_id in jobs_to_remove:
+            CheckpointStore(job_id).delete()
+            profiling.delete_profile(job_id)
+        tracing.prune_traces(max_age_hours)
+        
+        return len(jobs_to_remove)
+    
+    def get_running_jobs_count(self) -> int:
+        """Get count of currently running jobs"""
+        return self.store.count(JobStatus.running)
+    
+    def can_start_new_job(self) -> bool:
+        """Check if we can start a new job"""
+        capacity = self.store.capacity(datetime.now() - timedelta(seconds=self.lease_seconds))
+        return self.get_running_jobs_count() < capacity
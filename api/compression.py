@@ -0,0 +1,69 @@
+from typing import Dict
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # Optional: without it responses are only gzip-compressed
+    brotli = None
+
+class BrotliResponder(IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int = 5):
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    async def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if more_body:
+            return self.compressor.process(body) + self.compressor.flush()
+        return self.compressor.process(body) + self.compressor.finish()
+
+class CompressionMiddleware:
+    """Compresses responses with brotli or gzip, whichever the client prefers
+
+    Brotli is used only when the `brotli` package is installed. Like Starlette's
+    GZipMiddleware, small bodies, event streams and partial (Range) responses are
+    sent as they are.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1000, gzip_level: int = 6, brotli_quality: int = 5):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accepted = self._accepted_encodings(Headers(scope=scope).get("Accept-Encoding", ""))
+        if brotli is not None and accepted.get("br", 0) > 0 and accepted["br"] >= accepted.get("gzip", 0):
+            responder = BrotliResponder(self.app, self.minimum_size, self.brotli_quality)
+        elif accepted.get("gzip", 0) > 0:
+            responder = GZipResponder(self.app, self.minimum_size, compresslevel=self.gzip_level)
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size)
+        await responder(scope, receive, send)
+
+    @staticmethod
+    def _accepted_encodings(header: str) -> Dict[str, float]:
+        """Accept-Encoding as {encoding: q}; a wildcard stands for gzip and br"""
+        accepted = {}
+        for part in header.lower().split(","):
+            name, _, params = part.strip().partition(";")
+            q = 1.0
+            if params.strip().startswith("q="):
+                try:
+                    q = float(params.strip()[2:])
+                except ValueError:
+                    continue
+            if name == "*":
+                accepted.setdefault("gzip", q)
+                accepted.setdefault("br", q)
+            elif name:
+                accepted[name] = q
+        return accepted
@@ -0,0 +1,81 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+class LargeFile:
+    """A file too large to cache, read in chunks while its response is being sent"""
+
+    def __init__(self, path: str, size: int):
+        self.path = path
+        self.size = size
+
+    def chunks(self, chunk_size: int = 64 * 1024) -> Iterator[str]:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+class ContentCache:
+    """Byte-bounded LRU cache of result file contents
+
+    Entries are keyed by path and checked against the file's mtime and size on every
+    read, so a rewritten report (e.g. after a resume) is never served stale. Files
+    larger than `max_entry_bytes` are neither cached (that would evict everything
+    else) nor read whole: read() returns a LargeFile to stream instead.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, max_entry_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_bytes // 4 if max_entry_bytes is None else max_entry_bytes
+        self.hits = 0
+        self.misses = 0
+        self._bytes = 0
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def read(self, path: str) -> Union[str, LargeFile, None]:
+        """Contents of `path` (None if it doesn't exist), from memory when possible"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self.invalidate(path)
+            return None
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and entry[0] == version:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        if stat.st_size > self.max_entry_bytes:
+            return LargeFile(path, stat.st_size)
+
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        self._put(path, version, content, stat.st_size)
+        return content
+
+    def invalidate(self, path: str):
+        with self._lock:
+            entry = self._entries.pop(path, None)
+            if entry:
+                self._bytes -= entry[2]
+
+    def _put(self, path: str, version: Tuple[int, int], content: str, size: int):
+        with self._lock:
+            previous = self._entries.pop(path, None)
+            if previous:
+                self._bytes -= previous[2]
+            self._entries[path] = (version, content, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "bytes": self._bytes}
@@ -0,0 +1,155 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set, Tuple
+
+from api.models import JobStatus
+
+FINISHED_STATUSES = (JobStatus.completed, JobStatus.failed, JobStatus.cancelled)
+
+# Job fields sent whenever one of them changes
+SNAPSHOT_FIELDS = (
+    "status", "progress", "current_step", "tokens_used", "started_at", "completed_at",
+    "error_message", "coalesced_with", "cached_from",
+)
+
+Message = Tuple[str, Dict[str, Any]]
+
+class _Channel:
+    """Subscribers of one job and the task pumping its updates to them"""
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.source = job_id  # Job whose events are read (the owner while coalesced)
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.snapshot: Optional[Dict[str, Any]] = None
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+class JobEventBroadcaster:
+    """Fans a job's progress out to every SSE and WebSocket client watching it
+
+    One pump task per watched job reads new events and status changes from the job
+    store - so progress made by other API processes or standalone workers shows up too -
+    and copies each message to every subscriber's queue, however many there are.
+    Updates made in this process wake the pump at once; otherwise it polls every
+    `poll_seconds`. The pump stops when the job finishes or its last subscriber leaves.
+
+    Messages are (name, data) pairs: "status" (a snapshot of the job whenever it
+    changes), "progress" (a crew progress event) and finally "completed", "failed" or
+    "cancelled". Subscribers that fall behind lose their oldest messages.
+    """
+
+    def __init__(self, manager, poll_seconds: float = 1.0, queue_size: int = 100):
+        self.manager = manager
+        self.poll_seconds = poll_seconds
+        self.queue_size = queue_size
+        self._channels: Dict[str, _Channel] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @asynccontextmanager
+    async def subscribe(self, job_id: str) -> AsyncIterator[asyncio.Queue]:
+        """Queue of messages for `job_id`; None is queued after the final message"""
+        self._loop = asyncio.get_running_loop()
+        channel = self._channels.get(job_id)
+        if channel is None:
+            channel = self._channels[job_id] = _Channel(job_id)
+            channel.task = asyncio.create_task(self._pump(channel))
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        if channel.snapshot is not None:
+            # Late subscribers start from the current state
+            self._offer(queue, ("status", channel.snapshot))
+        channel.subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            channel.subscribers.discard(queue)
+            if not channel.subscribers and self._channels.get(job_id) is channel:
+                del self._channels[job_id]
+                channel.task.cancel()
+
+    def notify(self, job_id: str):
+        """Wake the pumps reading `job_id`; safe to call from any thread"""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        for channel in list(self._channels.values()):
+            if job_id in (channel.job_id, channel.source):
+                loop.call_soon_threadsafe(channel.wakeup.set)
+
+    def subscriber_count(self) -> int:
+        return sum(len(channel.subscribers) for channel in list(self._channels.values()))
+
+    async def _pump(self, channel: _Channel):
+        last_event_id = None
+        try:
+            while True:
+                channel.wakeup.clear()
+                job = self.manager.get_job_status(channel.job_id)
+                if job is None:
+                    self._close(channel, ("failed", {"job_id": channel.job_id, "error_message": "Job not found"}))
+                    return
+
+                # Jobs coalesced with another job follow that job's events
+                source = job["coalesced_with"] if job["coalesced_with"] and job["status"] not in FINISHED_STATUSES else channel.job_id
+                if source != channel.source:
+                    channel.source, last_event_id = source, None
+
+                events = self.manager.store.events_since(source, last_event_id or 0)
+                if last_event_id is not None:
+                    # Events from before the first read are covered by the snapshot
+                    for _, event in events:
+                        self._publish(channel, ("progress", event))
+                last_event_id = events[-1][0] if events else (last_event_id or 0)
+
+                snapshot = self._snapshot(job)
+                if snapshot != channel.snapshot:
+                    channel.snapshot = snapshot
+                    self._publish(channel, ("status", snapshot))
+
+                if job["status"] in FINISHED_STATUSES:
+                    self._close(channel, (JobStatus(job["status"]).value, snapshot))
+                    return
+
+                try:
+                    await asyncio.wait_for(channel.wakeup.wait(), self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"❌ Event stream for job {channel.job_id} failed: {str(e)}")
+            self._close(channel, ("failed", {"job_id": channel.job_id, "error_message": f"Event stream failed: {str(e)}"}))
+
+    @staticmethod
+    def _snapshot(job: Dict[str, Any]) -> Dict[str, Any]:
+        snapshot = {"job_id": job["id"]}
+        for field in SNAPSHOT_FIELDS:
+            value = job.get(field)
+            if isinstance(value, JobStatus):
+                value = value.value
+            elif hasattr(value, "isoformat"):
+                value = value.isoformat()
+            snapshot[field] = value
+        return snapshot
+
+    def _publish(self, channel: _Channel, message: Message):
+        for queue in list(channel.subscribers):
+            self._offer(queue, message)
+
+    def _close(self, channel: _Channel, message: Message):
+        """Send the final message, end every subscriber's stream and forget the channel"""
+        self._publish(channel, message)
+        for queue in list(channel.subscribers):
+            self._offer(queue, None)
+        if self._channels.get(channel.job_id) is channel:
+            del self._channels[channel.job_id]
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, message: Optional[Message]):
+        if queue.full():
+            try:
+                queue.get_nowait()  # Drop the oldest message for a slow subscriber
+            except asyncio.QueueEmpty:
+                pass
+        queue.put_nowait(message)
@@ -0,0 +1,934 @@
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from api.models import JobStatus
+
+# Job record fields persisted by every store (events are kept separately)
+JOB_FIELDS = (
+    "id", "topic", "topic_key", "llm_provider", "max_articles", "parallel_angles", "incremental",
+    "batch_id", "priority", "coalesced_with", "cached_from", "status", "progress", "current_step",
+    "created_at", "started_at", "completed_at", "error_message", "result", "research_file",
+    "report_file", "tokens_used", "worker_id", "heartbeat_at", "cancel_requested", "attempts",
+    "version", "trace_parent", "profile",
+)
+BATCH_FIELDS = ("id", "job_ids", "concurrency", "created_at", "started_at", "completed_at")
+DATETIME_FIELDS = ("created_at", "started_at", "completed_at", "heartbeat_at")
+BOOL_FIELDS = ("incremental", "profile")
+
+# Request fields that make two jobs produce the same report
+COALESCE_FIELDS = ("topic_key", "llm_provider", "max_articles", "parallel_angles", "incremental")
+
+class JobStore(ABC):
+    """Where JobManager keeps job records and their progress events
+
+    Records are plain dicts with JOB_FIELDS; get() adds the most recent events.
+    Stores must answer count() in O(1) rather than by scanning jobs. Pending jobs
+    form the queue: highest priority first, then oldest first, skipping jobs of
+    batches already running as many jobs as their concurrency. Jobs coalesced with
+    another job's execution (coalesced_with set) wait for it instead of queueing.
+
+    Every API process shares the store, so anything another process must see (batches,
+    coalescing, cancel requests, which worker runs a job) lives here.
+
+    Every update and appended event bumps the record's `version`, so clients can tell
+    whether anything they were shown has changed (heartbeats don't count).
+    """
+
+    @abstractmethod
+    def create(self, job: Dict[str, Any]):
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, job_id: str, events: int = 10) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_many(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Records of the jobs that exist among `job_ids`, without events"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def update(self, job_id: str, **fields):
+        raise NotImplementedError
+
+    @abstractmethod
+    def append_event(self, job_id: str, event: Dict[str, Any], max_events: int = 100):
+        raise NotImplementedError
+
+    @abstractmethod
+    def events_since(self, job_id: str, after_id: int = 0, limit: int = 100) -> List[Tuple[int, Dict[str, Any]]]:
+        """(event id, event) pairs newer than `after_id`, oldest first; ids only ever grow"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list(self, status: Optional[JobStatus] = None, topic_key: Optional[str] = None,
+             limit: int = 100) -> List[Dict[str, Any]]:
+        """Newest jobs first, without events"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def page(self, status: Optional[JobStatus] = None, llm_provider: Optional[str] = None,
+             topic_prefix: Optional[str] = None, created_after: Optional[datetime] = None,
+             created_before: Optional[datetime] = None, newest_first: bool = True,
+             after: Optional[Tuple[datetime, str]] = None, fields: Optional[List[str]] = None,
+             limit: int = 100) -> List[Dict[str, Any]]:
+        """One page of jobs matching the filters, without events
+
+        Jobs are ordered by (created_at, id) and the page starts after the `after` key
+        (the last job of the previous page). `topic_prefix` matches normalized topics.
+        Only `fields` (plus id and created_at) are loaded when given.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def count(self, status: Optional[JobStatus] = None) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_completed_before(self, cutoff: datetime) -> List[str]:
+        """Remove finished jobs completed before `cutoff`, returning their ids"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def claim_next(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """Atomically move the next queued job to running on `worker_id` and return it"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def find_inflight(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Oldest pending or running job with the same COALESCE_FIELDS that isn't itself coalesced"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def followers(self, job_id: str) -> List[Dict[str, Any]]:
+        """Pending jobs coalesced with `job_id`, oldest first"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def heartbeat(self, worker_id: str, concurrency: int) -> Dict[str, str]:
+        """Register the worker as alive and renew its running jobs' leases
+
+        Returns {job_id: reason} for its running jobs someone asked to cancel.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_workers(self, alive_since: datetime) -> List[Dict[str, Any]]:
+        """Workers that heartbeated since `alive_since` (id, concurrency, started_at, heartbeat_at)"""
+        raise NotImplementedError
+
+    def capacity(self, alive_since: datetime) -> int:
+        """Jobs all live workers can run at once"""
+        return sum(worker["concurrency"] for worker in self.list_workers(alive_since))
+
+    @abstractmethod
+    def create_batch(self, batch: Dict[str, Any]):
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def update_batch(self, batch_id: str, **fields):
+        raise NotImplementedError
+
+    @abstractmethod
+    def queue_position(self, job: Dict[str, Any]) -> int:
+        """1-based position of a pending job in the queue"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def latest_completed(self, topic_key: str, llm_provider: str, completed_after: datetime) -> Optional[Dict[str, Any]]:
+        """Most recent job that actually ran for the topic and completed after `completed_after`"""
+        raise NotImplementedError
+
+    def recover_orphans(self, reason: str, stale_before: datetime, max_attempts: int = 1) -> Dict[str, JobStatus]:
+        """Handle running jobs whose worker stopped heartbeating before `stale_before`
+
+        Jobs claimed fewer than `max_attempts` times are re-queued (their crew resumes
+        from its checkpoint), the others fail. Returns {job_id: new status}. Jobs
+        coalesced with an execution that is no longer pending or running are released
+        to queue on their own.
+        """
+        orphans = {}
+        for job in self.list(status=JobStatus.running, limit=1_000_000):
+            if job["heartbeat_at"] is not None and job["heartbeat_at"] >= stale_before:
+                continue
+            if (job["attempts"] or 0) < max_attempts:
+                orphans[job["id"]] = JobStatus.pending
+                self.update(
+                    job["id"],
+                    status=JobStatus.pending,
+                    worker_id=None,
+                    progress=0.0,
+                    current_step=f"Re-queued: {reason}",
+                )
+            else:
+                orphans[job["id"]] = JobStatus.failed
+                self.update(
+                    job["id"],
+                    status=JobStatus.failed,
+                    completed_at=datetime.now(),
+                    error_message=reason,
+                    current_step=f"Error: {reason}",
+                )
+        self.forget_workers(stale_before)
+
+        live = (JobStatus.pending, JobStatus.running)
+        for job in self.list(status=JobStatus.pending, limit=1_000_000):
+            if job["coalesced_with"]:
+                owner = self.get(job["coalesced_with"], events=0)
+                if owner is None or owner["status"] not in live:
+                    self.update(job["id"], coalesced_with=None)
+        return orphans
+
+    @abstractmethod
+    def forget_workers(self, stale_before: datetime):
+        """Drop workers that stopped heartbeating before `stale_before`"""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+class InMemoryJobStore(JobStore):
+    """Process-local store; jobs are lost on restart"""
+
+    def __init__(self):
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._events: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        self._last_event_id = 0
+        self._batches: Dict[str, Dict[str, Any]] = {}
+        self._workers: Dict[str, Dict[str, Any]] = {}
+        self._counts: Counter = Counter()
+        self._lock = threading.RLock()
+
+    def create(self, job: Dict[str, Any]):
+        with self._lock:
+            self._jobs[job["id"]] = {field: job.get(field) for field in JOB_FIELDS}
+            self._jobs[job["id"]]["version"] = job.get("version") or 0
+            self._events[job["id"]] = []
+            self._counts[JobStatus(job["status"])] += 1
+
+    def get(self, job_id: str, events: int = 10) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            recent = self._events[job_id][-events:] if events else []
+            return {**job, "events": [event for _, event in recent]}
+
+    def get_many(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {job_id: {**self._jobs[job_id], "events": []} for job_id in job_ids if job_id in self._jobs}
+
+    def update(self, job_id: str, **fields):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            if "status" in fields and fields["status"] != job["status"]:
+                self._counts[JobStatus(job["status"])] -= 1
+                self._counts[JobStatus(fields["status"])] += 1
+            job.update({k: v for k, v in fields.items() if k in JOB_FIELDS and k != "version"})
+            job["version"] += 1
+
+    def append_event(self, job_id: str, event: Dict[str, Any], max_events: int = 100):
+        with self._lock:
+            events = self._events.get(job_id)
+            if events is None:
+                return
+            self._last_event_id += 1
+            events.append((self._last_event_id, event))
+            self._jobs[job_id]["version"] += 1
+            if len(events) > max_events:
+                del events[:-max_events]
+
+    def events_since(self, job_id: str, after_id: int = 0, limit: int = 100) -> List[Tuple[int, Dict[str, Any]]]:
+        with self._lock:
+            return [entry for entry in self._events.get(job_id, []) if entry[0] > after_id][:limit]
+
+    def list(self, status: Optional[JobStatus] = None, topic_key: Optional[str] = None,
+             limit: int = 100) -> List[Dict[str, Any]]:
+        with self._lock:
+            jobs = [
+                dict(job) for job in self._jobs.values()
+                if (status is None or job["status"] == status)
+                and (topic_key is None or job["topic_key"] == topic_key)
+            ]
+        jobs.sort(key=lambda job: job["created_at"], reverse=True)
+        return jobs[:limit]
+
+    def page(self, status: Optional[JobStatus] = None, llm_provider: Optional[str] = None,
+             topic_prefix: Optional[str] = None, created_after: Optional[datetime] = None,
+             created_before: Optional[datetime] = None, newest_first: bool = True,
+             after: Optional[Tuple[datetime, str]] = None, fields: Optional[List[str]] = None,
+             limit: int = 100) -> List[Dict[str, Any]]:
+        def matches(job):
+            key = (job["created_at"], job["id"])
+            return (
+                (status is None or job["status"] == status)
+                and (llm_provider is None or job["llm_provider"] == llm_provider)
+                and (topic_prefix is None or (job["topic_key"] or "").startswith(topic_prefix))
+                and (created_after is None or job["created_at"] >= created_after)
+                and (created_before is None or job["created_at"] < created_before)
+                and (after is None or (key < after if newest_first else key > after))
+            )
+
+        with self._lock:
+            jobs = [dict(job) for job in self._jobs.values() if matches(job)]
+        jobs.sort(key=lambda job: (job["created_at"], job["id"]), reverse=newest_first)
+        return jobs[:limit]
+
+    def count(self, status: Optional[JobStatus] = None) -> int:
+        with self._lock:
+            if status is None:
+                return len(self._jobs)
+            return self._counts[JobStatus(status)]
+
+    def delete_completed_before(self, cutoff: datetime) -> List[str]:
+        with self._lock:
+            removed = [
+                job_id for job_id, job in self._jobs.items()
+                if job["completed_at"] and job["completed_at"] < cutoff
+            ]
+            for job_id in removed:
+                job = self._jobs.pop(job_id)
+                self._events.pop(job_id, None)
+                self._counts[JobStatus(job["status"])] -= 1
+            return removed
+
+    def latest_completed(self, topic_key: str, llm_provider: str, completed_after: datetime) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            matches = [
+                job for job in self._jobs.values()
+                if job["topic_key"] == topic_key and job["llm_provider"] == llm_provider
+                and job["status"] == JobStatus.completed and not job["cached_from"]
+                and job["report_file"] and job["completed_at"] >= completed_after
+            ]
+            return dict(max(matches, key=lambda job: job["completed_at"])) if matches else None
+
+    @staticmethod
+    def _queue_key(job: Dict[str, Any]):
+        return (-job["priority"], job["created_at"])
+
+    def claim_next(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            running = Counter(
+                job["batch_id"] for job in self._jobs.values()
+                if job["status"] == JobStatus.running and job["batch_id"]
+            )
+            queued = [
+                job for job in self._jobs.values()
+                if job["status"] == JobStatus.pending and not job["coalesced_with"]
+                and (not job["batch_id"] or running[job["batch_id"]] < self._batch_concurrency(job["batch_id"]))
+            ]
+            if not queued:
+                return None
+            job = min(queued, key=self._queue_key)
+            now = datetime.now()
+            self.update(
+                job["id"], status=JobStatus.running, started_at=now, worker_id=worker_id,
+                heartbeat_at=now, cancel_requested=None, attempts=(job["attempts"] or 0) + 1,
+            )
+            return dict(job)
+
+    def _batch_concurrency(self, batch_id: str) -> int:
+        batch = self._batches.get(batch_id)
+        return batch["concurrency"] if batch else 1
+
+    def find_inflight(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            matches = [
+                other for other in self._jobs.values()
+                if other["status"] in (JobStatus.pending, JobStatus.running) and not other["coalesced_with"]
+                and all(other[field] == job[field] for field in COALESCE_FIELDS)
+            ]
+            return dict(min(matches, key=lambda other: other["created_at"])) if matches else None
+
+    def followers(self, job_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            jobs = [
+                dict(job) for job in self._jobs.values()
+                if job["coalesced_with"] == job_id and job["status"] == JobStatus.pending
+            ]
+        return sorted(jobs, key=lambda job: job["created_at"])
+
+    def heartbeat(self, worker_id: str, concurrency: int) -> Dict[str, str]:
+        now = datetime.now()
+        with self._lock:
+            worker = self._workers.setdefault(worker_id, {"id": worker_id, "started_at": now})
+            worker.update(concurrency=concurrency, heartbeat_at=now)
+            cancels = {}
+            for job in self._jobs.values():
+                if job["worker_id"] == worker_id and job["status"] == JobStatus.running:
+                    job["heartbeat_at"] = now
+                    if job["cancel_requested"]:
+                        cancels[job["id"]] = job["cancel_requested"]
+            return cancels
+
+    def list_workers(self, alive_since: datetime) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(worker) for worker in self._workers.values() if worker["heartbeat_at"] >= alive_since]
+
+    def forget_workers(self, stale_before: datetime):
+        with self._lock:
+            for worker_id in [w["id"] for w in self._workers.values() if w["heartbeat_at"] < stale_before]:
+                del self._workers[worker_id]
+
+    def create_batch(self, batch: Dict[str, Any]):
+        with self._lock:
+            self._batches[batch["id"]] = {field: batch.get(field) for field in BATCH_FIELDS}
+
+    def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            batch = self._batches.get(batch_id)
+            return {**batch, "job_ids": list(batch["job_ids"])} if batch else None
+
+    def update_batch(self, batch_id: str, **fields):
+        with self._lock:
+            batch = self._batches.get(batch_id)
+            if batch is not None:
+                batch.update({k: v for k, v in fields.items() if k in BATCH_FIELDS})
+
+    def queue_position(self, job: Dict[str, Any]) -> int:
+        key = self._queue_key(job)
+        with self._lock:
+            return 1 + sum(
+                1 for other in self._jobs.values()
+                if other["status"] == JobStatus.pending and not other["coalesced_with"]
+                and self._queue_key(other) < key
+            )
+
+class SQLiteJobStore(JobStore):
+    """Persistent store in a SQLite database (WAL mode, one connection per thread)
+
+    Per-status counts live in a job_counts table kept up to date by triggers, so
+    counting running jobs doesn't touch the jobs table at all. Several API processes
+    on one host can share the database file; claims run in IMMEDIATE transactions
+    so a job is only ever claimed once.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            topic TEXT NOT NULL,
+            topic_key TEXT,
+            llm_provider TEXT,
+            max_articles INTEGER,
+            parallel_angles INTEGER,
+            incremental INTEGER,
+            batch_id TEXT,
+            priority INTEGER NOT NULL DEFAULT 1,
+            coalesced_with TEXT,
+            cached_from TEXT,
+            status TEXT NOT NULL,
+            progress REAL,
+            current_step TEXT,
+            created_at TEXT NOT NULL,
+            started_at TEXT,
+            completed_at TEXT,
+            error_message TEXT,
+            result TEXT,
+            research_file TEXT,
+            report_file TEXT,
+            tokens_used INTEGER,
+            worker_id TEXT,
+            heartbeat_at TEXT,
+            cancel_requested TEXT,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            version INTEGER NOT NULL DEFAULT 0,
+            trace_parent TEXT,
+            profile INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_jobs_status_page ON jobs (status, created_at, id);
+        CREATE INDEX IF NOT EXISTS idx_jobs_queue ON jobs (status, priority DESC, created_at);
+        CREATE INDEX IF NOT EXISTS idx_jobs_page ON jobs (created_at, id);
+        CREATE INDEX IF NOT EXISTS idx_jobs_provider_page ON jobs (llm_provider, created_at, id);
+        CREATE INDEX IF NOT EXISTS idx_jobs_topic_created ON jobs (topic_key, created_at);
+        CREATE INDEX IF NOT EXISTS idx_jobs_completed ON jobs (completed_at) WHERE completed_at IS NOT NULL;
+        CREATE INDEX IF NOT EXISTS idx_jobs_batch ON jobs (batch_id, status) WHERE batch_id IS NOT NULL;
+        CREATE INDEX IF NOT EXISTS idx_jobs_coalesced ON jobs (coalesced_with, created_at) WHERE coalesced_with IS NOT NULL;
+        CREATE INDEX IF NOT EXISTS idx_jobs_worker ON jobs (worker_id, status) WHERE worker_id IS NOT NULL;
+
+        CREATE TABLE IF NOT EXISTS workers (
+            id TEXT PRIMARY KEY,
+            concurrency INTEGER NOT NULL,
+            started_at TEXT NOT NULL,
+            heartbeat_at TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS batches (
+            id TEXT PRIMARY KEY,
+            job_ids TEXT NOT NULL,
+            concurrency INTEGER NOT NULL,
+            created_at TEXT NOT NULL,
+            started_at TEXT,
+            completed_at TEXT
+        );
+
+        CREATE TABLE IF NOT EXISTS job_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id TEXT NOT NULL,
+            event TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_job_events_job ON job_events (job_id, id);
+
+        CREATE TABLE IF NOT EXISTS job_counts (
+            status TEXT PRIMARY KEY,
+            count INTEGER NOT NULL DEFAULT 0
+        );
+
+        CREATE TRIGGER IF NOT EXISTS jobs_count_insert AFTER INSERT ON jobs BEGIN
+            UPDATE job_counts SET count = count + 1 WHERE status = NEW.status;
+        END;
+        CREATE TRIGGER IF NOT EXISTS jobs_count_update AFTER UPDATE OF status ON jobs
+        WHEN OLD.status != NEW.status BEGIN
+            UPDATE job_counts SET count = count - 1 WHERE status = OLD.status;
+            UPDATE job_counts SET count = count + 1 WHERE status = NEW.status;
+        END;
+        CREATE TRIGGER IF NOT EXISTS jobs_count_delete AFTER DELETE ON jobs BEGIN
+            UPDATE job_counts SET count = count - 1 WHERE status = OLD.status;
+            DELETE FROM job_events WHERE job_id = OLD.id;
+        END;
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        with self._write_lock, conn:
+            self._migrate(conn)
+            conn.executescript(self.SCHEMA)
+            conn.executemany(
+                "INSERT OR IGNORE INTO job_counts (status, count) VALUES (?, 0)",
+                [(status.value,) for status in JobStatus],
+            )
+
+    # Columns added after the first release, created on databases that predate them
+    MIGRATIONS = {
+        "priority": "INTEGER NOT NULL DEFAULT 1",
+        "max_articles": "INTEGER",
+        "coalesced_with": "TEXT",
+        "cached_from": "TEXT",
+        "worker_id": "TEXT",
+        "heartbeat_at": "TEXT",
+        "cancel_requested": "TEXT",
+        "attempts": "INTEGER NOT NULL DEFAULT 0",
+        "version": "INTEGER NOT NULL DEFAULT 0",
+        "trace_parent": "TEXT",
+        "profile": "INTEGER NOT NULL DEFAULT 0",
+    }
+
+    def _migrate(self, conn: sqlite3.Connection):
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+        if not columns:
+            return  # New database, SCHEMA creates everything
+        for column, definition in self.MIGRATIONS.items():
+            if column not in columns:
+                conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {definition}")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    def _write(self, sql: str, params=()) -> sqlite3.Cursor:
+        with self._write_lock:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = conn.execute(sql, params)
+                conn.execute("COMMIT")
+                return cursor
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def create(self, job: Dict[str, Any]):
+        values = [_to_db(field, job.get(field)) for field in JOB_FIELDS]
+        values[JOB_FIELDS.index("version")] = job.get("version") or 0
+        placeholders = ", ".join("?" for _ in JOB_FIELDS)
+        self._write(f"INSERT INTO jobs ({', '.join(JOB_FIELDS)}) VALUES ({placeholders})", values)
+
+    def get(self, job_id: str, events: int = 10) -> Optional[Dict[str, Any]]:
+        conn = self._conn()
+        row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+
+        job = _from_row(row)
+        job["events"] = []
+        if events:
+            rows = conn.execute(
+                "SELECT event FROM job_events WHERE job_id = ? ORDER BY id DESC LIMIT ?",
+                (job_id, events),
+            ).fetchall()
+            job["events"] = [json.loads(r["event"]) for r in reversed(rows)]
+        return job
+
+    def get_many(self, job_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        conn = self._conn()
+        jobs = {}
+        unique = list(dict.fromkeys(job_ids))
+        for start in range(0, len(unique), 500):  # Stay under SQLite's bound parameter limit
+            chunk = unique[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            for row in conn.execute(f"SELECT * FROM jobs WHERE id IN ({placeholders})", chunk):
+                job = _from_row(row)
+                job["events"] = []
+                jobs[job["id"]] = job
+        return jobs
+
+    def update(self, job_id: str, **fields):
+        fields = {k: v for k, v in fields.items() if k in JOB_FIELDS and k not in ("id", "version")}
+        if not fields:
+            return
+        assignments = ", ".join([f"{field} = ?" for field in fields] + ["version = version + 1"])
+        values = [_to_db(field, value) for field, value in fields.items()]
+        self._write(f"UPDATE jobs SET {assignments} WHERE id = ?", values + [job_id])
+
+    def append_event(self, job_id: str, event: Dict[str, Any], max_events: int = 100):
+        with self._write_lock:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT INTO job_events (job_id, event) VALUES (?, ?)",
+                    (job_id, json.dumps(event, default=str)),
+                )
+                conn.execute("UPDATE jobs SET version = version + 1 WHERE id = ?", (job_id,))
+                # Keep only the newest `max_events` rows for the job
+                conn.execute(
+                    """DELETE FROM job_events WHERE job_id = ? AND id <= (
+                        SELECT id FROM job_events WHERE job_id = ? ORDER BY id DESC LIMIT 1 OFFSET ?
+                    )""",
+                    (job_id, job_id, max_events),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def events_since(self, job_id: str, after_id: int = 0, limit: int = 100) -> List[Tuple[int, Dict[str, Any]]]:
+        rows = self._conn().execute(
+            "SELECT id, event FROM job_events WHERE job_id = ? AND id > ? ORDER BY id LIMIT ?",
+            (job_id, after_id, limit),
+        ).fetchall()
+        return [(row["id"], json.loads(row["event"])) for row in rows]
+
+    def list(self, status: Optional[JobStatus] = None, topic_key: Optional[str] = None,
+             limit: int = 100) -> List[Dict[str, Any]]:
+        clauses, params = [], []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(JobStatus(status).value)
+        if topic_key is not None:
+            clauses.append("topic_key = ?")
+            params.append(topic_key)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._conn().execute(
+            f"SELECT * FROM jobs {where} ORDER BY created_at DESC LIMIT ?", params + [limit]
+        ).fetchall()
+        return [_from_row(row) for row in rows]
+
+    def page(self, status: Optional[JobStatus] = None, llm_provider: Optional[str] = None,
+             topic_prefix: Optional[str] = None, created_after: Optional[datetime] = None,
+             created_before: Optional[datetime] = None, newest_first: bool = True,
+             after: Optional[Tuple[datetime, str]] = None, fields: Optional[List[str]] = None,
+             limit: int = 100) -> List[Dict[str, Any]]:
+        clauses, params = [], []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(JobStatus(status).value)
+        if llm_provider is not None:
+            clauses.append("llm_provider = ?")
+            params.append(llm_provider)
+        if topic_prefix:
+            # A range rather than LIKE so the topic index applies
+            clauses.append("topic_key >= ? AND topic_key < ?")
+            params += [topic_prefix, topic_prefix + "\U0010ffff"]
+        if created_after is not None:
+            clauses.append("created_at >= ?")
+            params.append(created_after.isoformat())
+        if created_before is not None:
+            clauses.append("created_at < ?")
+            params.append(created_before.isoformat())
+        if after is not None:
+            clauses.append(f"(created_at, id) {'<' if newest_first else '>'} (?, ?)")
+            params += [after[0].isoformat(), after[1]]
+
+        columns = "*"
+        if fields:
+            columns = ", ".join(dict.fromkeys(["id", "created_at"] + [f for f in fields if f in JOB_FIELDS]))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        direction = "DESC" if newest_first else "ASC"
+        rows = self._conn().execute(
+            f"SELECT {columns} FROM jobs {where} ORDER BY created_at {direction}, id {direction} LIMIT ?",
+            params + [limit],
+        ).fetchall()
+        return [_from_row(row) for row in rows]
+
+    def count(self, status: Optional[JobStatus] = None) -> int:
+        conn = self._conn()
+        if status is None:
+            return conn.execute("SELECT COALESCE(SUM(count), 0) FROM job_counts").fetchone()[0]
+        row = conn.execute("SELECT count FROM job_counts WHERE status = ?", (JobStatus(status).value,)).fetchone()
+        return row[0] if row else 0
+
+    def delete_completed_before(self, cutoff: datetime) -> List[str]:
+        with self._write_lock:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = conn.execute(
+                    "SELECT id FROM jobs WHERE completed_at IS NOT NULL AND completed_at < ?",
+                    (cutoff.isoformat(),),
+                ).fetchall()
+                removed = [row["id"] for row in rows]
+                conn.executemany("DELETE FROM jobs WHERE id = ?", [(job_id,) for job_id in removed])
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return removed
+
+    def claim_next(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        with self._write_lock:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Batch jobs only queue while their batch runs fewer jobs than its concurrency
+                row = conn.execute(
+                    """SELECT * FROM jobs WHERE status = ? AND coalesced_with IS NULL
+                       AND (batch_id IS NULL OR (
+                           SELECT COUNT(*) FROM jobs AS running
+                           WHERE running.batch_id = jobs.batch_id AND running.status = ?
+                       ) < COALESCE((SELECT concurrency FROM batches WHERE batches.id = jobs.batch_id), 1))
+                       ORDER BY priority DESC, created_at LIMIT 1""",
+                    (JobStatus.pending.value, JobStatus.running.value),
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+
+                job = _from_row(row)
+                now = datetime.now()
+                job.update(status=JobStatus.running, started_at=now, worker_id=worker_id,
+                           heartbeat_at=now, cancel_requested=None, attempts=job["attempts"] + 1,
+                           version=job["version"] + 1)
+                conn.execute(
+                    """UPDATE jobs SET status = ?, started_at = ?, worker_id = ?, heartbeat_at = ?,
+                       cancel_requested = NULL, attempts = attempts + 1, version = version + 1 WHERE id = ?""",
+                    (JobStatus.running.value, now.isoformat(), worker_id, now.isoformat(), job["id"]),
+                )
+                conn.execute("COMMIT")
+                return job
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def find_inflight(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute(
+            """SELECT * FROM jobs WHERE topic_key = ? AND llm_provider = ? AND max_articles = ?
+               AND parallel_angles = ? AND incremental = ? AND status IN (?, ?) AND coalesced_with IS NULL
+               ORDER BY created_at LIMIT 1""",
+            [_to_db(field, job[field]) for field in COALESCE_FIELDS]
+            + [JobStatus.pending.value, JobStatus.running.value],
+        ).fetchone()
+        return _from_row(row) if row else None
+
+    def followers(self, job_id: str) -> List[Dict[str, Any]]:
+        rows = self._conn().execute(
+            "SELECT * FROM jobs WHERE coalesced_with = ? AND status = ? ORDER BY created_at",
+            (job_id, JobStatus.pending.value),
+        ).fetchall()
+        return [_from_row(row) for row in rows]
+
+    def heartbeat(self, worker_id: str, concurrency: int) -> Dict[str, str]:
+        now = datetime.now().isoformat()
+        with self._write_lock:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    """INSERT INTO workers (id, concurrency, started_at, heartbeat_at) VALUES (?, ?, ?, ?)
+                       ON CONFLICT (id) DO UPDATE SET concurrency = excluded.concurrency,
+                       heartbeat_at = excluded.heartbeat_at""",
+                    (worker_id, concurrency, now, now),
+                )
+                conn.execute(
+                    "UPDATE jobs SET heartbeat_at = ? WHERE worker_id = ? AND status = ?",
+                    (now, worker_id, JobStatus.running.value),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        rows = self._conn().execute(
+            """SELECT id, cancel_requested FROM jobs
+               WHERE worker_id = ? AND status = ? AND cancel_requested IS NOT NULL""",
+            (worker_id, JobStatus.running.value),
+        ).fetchall()
+        return {row["id"]: row["cancel_requested"] for row in rows}
+
+    def list_workers(self, alive_since: datetime) -> List[Dict[str, Any]]:
+        rows = self._conn().execute(
+            "SELECT * FROM workers WHERE heartbeat_at >= ? ORDER BY started_at", (alive_since.isoformat(),)
+        ).fetchall()
+        workers = []
+        for row in rows:
+            worker = dict(row)
+            worker["started_at"] = datetime.fromisoformat(worker["started_at"])
+            worker["heartbeat_at"] = datetime.fromisoformat(worker["heartbeat_at"])
+            workers.append(worker)
+        return workers
+
+    def forget_workers(self, stale_before: datetime):
+        self._write("DELETE FROM workers WHERE heartbeat_at < ?", (stale_before.isoformat(),))
+
+    def recover_orphans(self, reason: str, stale_before: datetime, max_attempts: int = 1) -> Dict[str, JobStatus]:
+        # Runs on every heartbeat: one statement per step, each reaching only running
+        # (or coalesced) rows through the status and coalesced_with indexes
+        stale = (JobStatus.running.value, stale_before.isoformat())
+        with self._write_lock:
+            conn = self._conn()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                requeued = conn.execute(
+                    """UPDATE jobs SET status = ?, worker_id = NULL, progress = 0.0, current_step = ?,
+                       version = version + 1
+                       WHERE status = ? AND (heartbeat_at IS NULL OR heartbeat_at < ?) AND attempts < ?
+                       RETURNING id""",
+                    (JobStatus.pending.value, f"Re-queued: {reason}") + stale + (max_attempts,),
+                ).fetchall()
+                failed = conn.execute(
+                    """UPDATE jobs SET status = ?, completed_at = ?, error_message = ?, current_step = ?,
+                       version = version + 1
+                       WHERE status = ? AND (heartbeat_at IS NULL OR heartbeat_at < ?)
+                       RETURNING id""",
+                    (JobStatus.failed.value, datetime.now().isoformat(), reason, f"Error: {reason}") + stale,
+                ).fetchall()
+                conn.execute("DELETE FROM workers WHERE heartbeat_at < ?", (stale_before.isoformat(),))
+                conn.execute(
+                    """UPDATE jobs SET coalesced_with = NULL, version = version + 1
+                       WHERE coalesced_with IS NOT NULL AND status = ? AND NOT EXISTS (
+                           SELECT 1 FROM jobs AS owner
+                           WHERE owner.id = jobs.coalesced_with AND owner.status IN (?, ?)
+                       )""",
+                    (JobStatus.pending.value, JobStatus.pending.value, JobStatus.running.value),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        orphans = {row["id"]: JobStatus.pending for row in requeued}
+        orphans.update((row["id"], JobStatus.failed) for row in failed)
+        return orphans
+
+    def create_batch(self, batch: Dict[str, Any]):
+        values = [_batch_to_db(field, batch.get(field)) for field in BATCH_FIELDS]
+        placeholders = ", ".join("?" for _ in BATCH_FIELDS)
+        self._write(f"INSERT INTO batches ({', '.join(BATCH_FIELDS)}) VALUES ({placeholders})", values)
+
+    def get_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute("SELECT * FROM batches WHERE id = ?", (batch_id,)).fetchone()
+        if row is None:
+            return None
+        batch = dict(row)
+        batch["job_ids"] = json.loads(batch["job_ids"])
+        for field in ("created_at", "started_at", "completed_at"):
+            if batch[field]:
+                batch[field] = datetime.fromisoformat(batch[field])
+        return batch
+
+    def update_batch(self, batch_id: str, **fields):
+        fields = {k: v for k, v in fields.items() if k in BATCH_FIELDS and k != "id"}
+        if not fields:
+            return
+        assignments = ", ".join(f"{field} = ?" for field in fields)
+        values = [_batch_to_db(field, value) for field, value in fields.items()]
+        self._write(f"UPDATE batches SET {assignments} WHERE id = ?", values + [batch_id])
+
+    def latest_completed(self, topic_key: str, llm_provider: str, completed_after: datetime) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute(
+            """SELECT * FROM jobs WHERE topic_key = ? AND llm_provider = ? AND status = ?
+               AND cached_from IS NULL AND report_file IS NOT NULL AND completed_at >= ?
+               ORDER BY completed_at DESC LIMIT 1""",
+            (topic_key, llm_provider, JobStatus.completed.value, completed_after.isoformat()),
+        ).fetchone()
+        return _from_row(row) if row else None
+
+    def queue_position(self, job: Dict[str, Any]) -> int:
+        created_at = job["created_at"].isoformat()
+        ahead = self._conn().execute(
+            """SELECT COUNT(*) FROM jobs WHERE status = ? AND coalesced_with IS NULL
+               AND (priority > ? OR (priority = ? AND created_at < ?))""",
+            (JobStatus.pending.value, job["priority"], job["priority"], created_at),
+        ).fetchone()[0]
+        return ahead + 1
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+def _to_db(field: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if field in DATETIME_FIELDS:
+        return value.isoformat()
+    if field == "status":
+        return JobStatus(value).value
+    if field in BOOL_FIELDS:
+        return int(bool(value))
+    return value
+
+def _batch_to_db(field: str, value: Any) -> Any:
+    if field == "job_ids":
+        return json.dumps(value or [])
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def _from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    job = dict(row)
+    for field in DATETIME_FIELDS:
+        if job.get(field):
+            job[field] = datetime.fromisoformat(job[field])
+    if "status" in job:
+        job["status"] = JobStatus(job["status"])
+    for field in BOOL_FIELDS:
+        if field in job:
+            job[field] = bool(job[field])
+    return job
+
+def create_job_store(kind: Optional[str] = None, path: Optional[str] = None) -> JobStore:
+    """Build the store selected by JOB_STORE (sqlite or memory)"""
+    kind = (kind or os.getenv('JOB_STORE', 'sqlite')).lower()
+
+    if kind == 'sqlite':
+        return SQLiteJobStore(path or os.getenv('JOB_STORE_PATH', os.path.join("outputs", "jobs.db")))
+    elif kind == 'memory':
+        return InMemoryJobStore()
+    else:
+        raise ValueError(f"Unsupported job store: {kind}. Use 'sqlite' or 'memory'")
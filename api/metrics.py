@@ -0,0 +1,84 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.models import JobStatus
+from src.metrics import JOB_BUCKETS, REGISTRY
+
+# ===== API METRICS =====
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "news_http_request_duration_seconds", "Time until the response starts, per route", ["method", "route", "status"])
+JOBS_SUBMITTED = REGISTRY.counter(
+    "news_jobs_submitted_total", "Submitted jobs by how they were served (cached, coalesced or queued)", ["outcome"])
+JOB_QUEUE_WAIT_SECONDS = REGISTRY.histogram(
+    "news_job_queue_wait_seconds", "Time jobs spent queued before a worker claimed them", buckets=JOB_BUCKETS)
+JOB_DURATION_SECONDS = REGISTRY.histogram(
+    "news_job_duration_seconds", "Job execution time by outcome", ["outcome"], JOB_BUCKETS)
+JOB_QUEUE_DEPTH = REGISTRY.gauge(
+    "news_job_queue_depth", "Jobs waiting in the queue")
+JOBS_RUNNING = REGISTRY.gauge(
+    "news_jobs_running", "Jobs running on any worker")
+CONTENT_CACHE_LOOKUPS = REGISTRY.counter(
+    "news_result_content_cache_lookups_total", "Result file reads served from memory (hit) or disk (miss)", ["result"])
+CONTENT_CACHE_BYTES = REGISTRY.gauge(
+    "news_result_content_cache_bytes", "Bytes of result files held in memory")
+
+def install_job_metrics(manager):
+    """Report queue, running and cache figures of `manager` whenever /metrics is scraped"""
+    JOB_QUEUE_DEPTH.function = lambda: {(): manager.store.count(JobStatus.pending)}
+    JOBS_RUNNING.function = lambda: {(): manager.store.count(JobStatus.running)}
+    CONTENT_CACHE_LOOKUPS.function = lambda: {
+        ("hit",): manager.content_cache.hits, ("miss",): manager.content_cache.misses,
+    }
+    CONTENT_CACHE_BYTES.function = lambda: {(): manager.content_cache.stats()["bytes"]}
+
+class MetricsMiddleware:
+    """Records HTTP latency per route template (not per URL, to keep label counts bounded)
+
+    Latency is measured to the start of the response, so event streams and large
+    downloads don't skew it.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        started = False
+
+        async def send_with_metrics(message: Message):
+            nonlocal started
+            if message["type"] == "http.response.start" and not started:
+                started = True
+                self._observe(scope, message["status"], start)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        except Exception:
+            if not started:
+                self._observe(scope, 500, start)
+            raise
+
+    @staticmethod
+    def _observe(scope: Scope, status: int, start: float):
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - start,
+            method=scope["method"],
+            route=route_template(scope),
+            status=status,
+        )
+
+def route_template(scope: Scope) -> str:
+    """Path template of the matched route, e.g. /api/v1/status/{job_id}"""
+    template = getattr(scope.get("route"), "path", None)
+    if not template:
+        return "unmatched"
+    # Routes of included routers report their path without the router's prefix
+    segments = scope["path"].rstrip("/").split("/")
+    depth = len(template.rstrip("/").split("/"))
+    return "/".join(segments[:len(segments) - depth + 1]) + template
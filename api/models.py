@@ -1,103 +1,186 @@
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
-from datetime import datetime
-from enum import Enum
-
-class LLMProvider(str, Enum):
-    google = "google"
-    ollama = "ollama"
-
-class JobStatus(str, Enum):
-    pending = "pending"
-    running = "running"
-    completed = "completed"
-    failed = "failed"
-
-class NewsRequest(BaseModel):
-    topic: str = Field(..., description="News topic to research", min_length=1, max_length=200)
-    llm_provider: Optional[LLMProvider] = Field(default=LLMProvider.google, description="LLM provider to use")
-    max_articles: Optional[int] = Field(default=8, description="Maximum number of articles to fetch", ge=1, le=20)
-    
-    class Config:
-        # ✅ FIXED: Updated for Pydantic V2
-        json_schema_extra = {
-            "example": {
-                "topic": "artificial intelligence developments",
-                "llm_provider": "google",
-                "max_articles": 8
-            }
-        }
-
-class NewsResponse(BaseModel):
-    job_id: str = Field(..., description="Unique job identifier")
-    status: JobStatus = Field(..., description="Current job status")
-    message: str = Field(..., description="Status message")
-    created_at: datetime = Field(..., description="Job creation timestamp")
-    estimated_completion: Optional[datetime] = Field(None, description="Estimated completion time")
-    
-    class Config:
-        # ✅ FIXED: Updated for Pydantic V2
-        json_schema_extra = {
-            "example": {
-                "job_id": "news_20250928_210000_abc123",
-                "status": "running",
-                "message": "Research in progress...",
-                "created_at": "2025-09-28T21:00:00Z",
-                "estimated_completion": "2025-09-28T21:05:00Z"
-            }
-        }
-
-class StatusResponse(BaseModel):
-    job_id: str
-    status: JobStatus
-    progress: Optional[float] = Field(None, description="Progress percentage (0-100)")
-    current_step: Optional[str] = Field(None, description="Current processing step")
-    created_at: datetime
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
-    error_message: Optional[str] = None
-    
-class ResultsResponse(BaseModel):
-    job_id: str
-    status: JobStatus
-    topic: str
-    research_summary: Optional[str] = None
-    final_report: Optional[str] = None
-    research_file: Optional[str] = Field(None, description="Path to research markdown file")
-    report_file: Optional[str] = Field(None, description="Path to final report markdown file")
-    metadata: Optional[Dict[str, Any]] = None
-    created_at: datetime
-    completed_at: Optional[datetime] = None
-
-class ConfigResponse(BaseModel):
-    current_llm: LLMProvider
-    available_llms: List[LLMProvider]
-    newsdata_configured: bool
-    google_configured: bool
-    ollama_available: bool
-    
-class LLMSwitchRequest(BaseModel):
-    provider: LLMProvider = Field(..., description="LLM provider to switch to")
-    
-    class Config:
-        # ✅ FIXED: Updated for Pydantic V2
-        json_schema_extra = {
-            "example": {
-                "provider": "google"
-            }
-        }
-
-class ErrorResponse(BaseModel):
-    error: str
-    message: str
-    timestamp: datetime
-    
-    class Config:
-        # ✅ FIXED: Updated for Pydantic V2
-        json_schema_extra = {
-            "example": {
-                "error": "validation_error",
-                "message": "Topic is required and cannot be empty",
-                "timestamp": "2025-09-28T21:00:00Z"
-            }
-        }
+from pydantic import BaseModel, Field
+from typing import Optional, Dict, Any, List
+from datetime import datetime
+from enum import Enum
+
+class LLMProvider(str, Enum):
+    google = "google"
+    ollama = "ollama"
+    mock = "mock"
+
+class JobPriority(str, Enum):
+    low = "low"
+    normal = "normal"
+    high = "high"
+
+class JobStatus(str, Enum):
+    pending = "pending"
+    running = "running"
+    completed = "completed"
+    failed = "failed"
+    cancelled = "cancelled"
+
+class NewsRequest(BaseModel):
+    topic: str = Field(..., description="News topic to research", min_length=1, max_length=200)
+    llm_provider: Optional[LLMProvider] = Field(default=LLMProvider.google, description="LLM provider to use")
+    max_articles: Optional[int] = Field(default=8, description="Maximum number of articles to fetch", ge=1, le=20)
+    parallel_angles: Optional[int] = Field(default=1, description="Number of sub-angles to research in parallel (1 = single researcher)", ge=1, le=5)
+    incremental: bool = Field(default=False, description="Only research news since the previous run of this topic and report what changed")
+    priority: JobPriority = Field(default=JobPriority.normal, description="Queue priority; higher priority jobs start first")
+    force_refresh: bool = Field(default=False, description="Run the research even if a fresh result for this topic exists")
+    profile: bool = Field(default=False, description="Record a CPU profile and wall-clock flame data of the run (implies a fresh run of its own)")
+    
+    class Config:
+        # ✅ FIXED: Updated for Pydantic V2
+        json_schema_extra = {
+            "example": {
+                "topic": "artificial intelligence developments",
+                "llm_provider": "google",
+                "max_articles": 8,
+                "parallel_angles": 1,
+                "incremental": False
+            }
+        }
+
+class BatchRequest(BaseModel):
+    topics: List[str] = Field(..., description="News topics to research", min_length=1, max_length=500)
+    llm_provider: Optional[LLMProvider] = Field(default=LLMProvider.google, description="LLM provider to use")
+    parallel_angles: Optional[int] = Field(default=1, description="Number of sub-angles to research in parallel per topic", ge=1, le=5)
+    incremental: bool = Field(default=False, description="Only research news since each topic's previous run")
+    concurrency: int = Field(default=3, description="Topics researched at the same time", ge=1, le=10)
+    priority: JobPriority = Field(default=JobPriority.low, description="Queue priority of the batch's jobs")
+    force_refresh: bool = Field(default=False, description="Run every topic even if a fresh result exists")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "topics": ["artificial intelligence developments", "renewable energy policy"],
+                "llm_provider": "google",
+                "concurrency": 3
+            }
+        }
+
+class BatchResponse(BaseModel):
+    batch_id: str = Field(..., description="Unique batch identifier")
+    job_ids: List[str] = Field(..., description="One job per topic, in request order")
+    message: str
+    created_at: datetime
+
+class NewsResponse(BaseModel):
+    job_id: str = Field(..., description="Unique job identifier")
+    status: JobStatus = Field(..., description="Current job status")
+    message: str = Field(..., description="Status message")
+    created_at: datetime = Field(..., description="Job creation timestamp")
+    estimated_completion: Optional[datetime] = Field(None, description="Estimated completion time")
+    coalesced_with: Optional[str] = Field(None, description="Job whose identical in-flight research this job shares")
+    cached_from: Optional[str] = Field(None, description="Completed job whose fresh result was reused")
+    
+    class Config:
+        # ✅ FIXED: Updated for Pydantic V2
+        json_schema_extra = {
+            "example": {
+                "job_id": "news_20250928_210000_abc123",
+                "status": "running",
+                "message": "Research in progress...",
+                "created_at": "2025-09-28T21:00:00Z",
+                "estimated_completion": "2025-09-28T21:05:00Z"
+            }
+        }
+
+class ProgressEvent(BaseModel):
+    type: str = Field(..., description="Event type (stage_started, tool_started, tool_finished, llm_iteration, task_completed)")
+    message: str
+    progress: float = Field(..., description="Pipeline progress when the event was emitted (0-100)")
+    tokens: Optional[int] = Field(None, description="Tokens used so far")
+    timestamp: datetime
+    data: Dict[str, Any] = Field(default_factory=dict)
+
+class StatusResponse(BaseModel):
+    job_id: str
+    status: JobStatus
+    progress: Optional[float] = Field(None, description="Progress percentage (0-100)")
+    current_step: Optional[str] = Field(None, description="Current processing step")
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    error_message: Optional[str] = None
+    tokens_used: Optional[int] = Field(None, description="Tokens consumed by the crew so far")
+    queue_position: Optional[int] = Field(None, description="Position in the job queue while pending (1 = next)")
+    estimated_start: Optional[datetime] = Field(None, description="Estimated start time while pending")
+    coalesced_with: Optional[str] = Field(None, description="Job whose identical in-flight research this job shares")
+    cached_from: Optional[str] = Field(None, description="Completed job whose fresh result was reused")
+    recent_events: List[ProgressEvent] = Field(default_factory=list, description="Most recent progress events")
+    version: Optional[str] = Field(None, description="Changes whenever this status does (also sent as the ETag)")
+    
+class StatusBatchRequest(BaseModel):
+    job_ids: List[str] = Field(..., description="Jobs to report on", min_length=1, max_length=1000)
+    versions: Dict[str, str] = Field(default_factory=dict, description="Last seen version per job id; unchanged jobs are left out")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "job_ids": ["news_20240101_120000_ab12cd34", "news_20240101_120500_ef56ab78"],
+                "versions": {"news_20240101_120000_ab12cd34": "14"}
+            }
+        }
+
+class JobStatusSummary(BaseModel):
+    job_id: str
+    status: JobStatus
+    version: str
+    progress: Optional[float] = None
+    current_step: Optional[str] = None
+    tokens_used: Optional[int] = None
+    queue_position: Optional[int] = None
+    error_message: Optional[str] = None
+    completed_at: Optional[datetime] = None
+
+class StatusBatchResponse(BaseModel):
+    statuses: List[JobStatusSummary] = Field(default_factory=list, description="Jobs whose status changed (or had no version given)")
+    unchanged: List[str] = Field(default_factory=list, description="Jobs still at the version given")
+    not_found: List[str] = Field(default_factory=list)
+
+class ResultsResponse(BaseModel):
+    job_id: str
+    status: JobStatus
+    topic: str
+    research_summary: Optional[str] = None
+    final_report: Optional[str] = None
+    research_file: Optional[str] = Field(None, description="Path to research markdown file")
+    report_file: Optional[str] = Field(None, description="Path to final report markdown file")
+    metadata: Optional[Dict[str, Any]] = None
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+
+class ConfigResponse(BaseModel):
+    current_llm: LLMProvider
+    available_llms: List[LLMProvider]
+    newsdata_configured: bool
+    google_configured: bool
+    ollama_available: bool
+    
+class LLMSwitchRequest(BaseModel):
+    provider: LLMProvider = Field(..., description="LLM provider to switch to")
+    
+    class Config:
+        # ✅ FIXED: Updated for Pydantic V2
+        json_schema_extra = {
+            "example": {
+                "provider": "google"
+            }
+        }
+
+class ErrorResponse(BaseModel):
+    error: str
+    message: str
+    timestamp: datetime
+    
+    class Config:
+        # ✅ FIXED: Updated for Pydantic V2
+        json_schema_extra = {
+            "example": {
+                "error": "validation_error",
+                "message": "Topic is required and cannot be empty",
+                "timestamp": "2025-09-28T21:00:00Z"
+            }
+        }
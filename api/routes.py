@@ -1,211 +1,643 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends
-from fastapi.responses import FileResponse
-import os
-from datetime import datetime, timedelta  # ✅ Add timedelta import
-from typing import List
-
-from .models import (
-    NewsRequest, NewsResponse, StatusResponse, ResultsResponse, 
-    ConfigResponse, LLMSwitchRequest, ErrorResponse, JobStatus, LLMProvider
-)
-from .background_tasks import JobManager
-
-router = APIRouter()
-
-# Global job manager instance
-job_manager = JobManager()
-
-@router.post("/research", response_model=NewsResponse)
-async def start_research(
-    request: NewsRequest,
-    background_tasks: BackgroundTasks
-):
-    """Start a new news research job"""
-    
-    # Check if we can start a new job
-    if not job_manager.can_start_new_job():
-        raise HTTPException(
-            status_code=429,
-            detail="Too many concurrent jobs. Please try again later."
-        )
-    
-    # Validate configuration
-    if not os.getenv('NEWSDATA_API_KEY'):
-        raise HTTPException(
-            status_code=500,
-            detail="NewsData.io API key not configured"
-        )
-    
-    if request.llm_provider == LLMProvider.google and not os.getenv('GOOGLE_API_KEY'):
-        raise HTTPException(
-            status_code=500,
-            detail="Google API key not configured"
-        )
-    
-    # Create job
-    job_id = job_manager.create_job(
-        topic=request.topic,
-        llm_provider=request.llm_provider.value
-    )
-    
-    # Start background task
-    background_tasks.add_task(job_manager.execute_job, job_id)
-    
-    # ✅ FIXED: Use timedelta for proper datetime arithmetic
-    return NewsResponse(
-        job_id=job_id,
-        status=JobStatus.pending,
-        message="Research job created and queued for processing",
-        created_at=datetime.now(),
-        estimated_completion=datetime.now() + timedelta(minutes=5)  # ✅ Proper way
-    )
-
-@router.get("/status/{job_id}", response_model=StatusResponse)
-async def get_job_status(job_id: str):
-    """Get current status of a research job"""
-    
-    job = job_manager.get_job_status(job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    return StatusResponse(
-        job_id=job["id"],
-        status=job["status"],
-        progress=job["progress"],
-        current_step=job["current_step"],
-        created_at=job["created_at"],
-        started_at=job["started_at"],
-        completed_at=job["completed_at"],
-        error_message=job["error_message"]
-    )
-
-@router.get("/results/{job_id}", response_model=ResultsResponse)
-async def get_job_results(job_id: str):
-    """Get results of a completed research job"""
-    
-    job = job_manager.get_job_results(job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    return ResultsResponse(
-        job_id=job["id"],
-        status=job["status"],
-        topic=job["topic"],
-        research_summary=job.get("research_content"),
-        final_report=job.get("report_content"),
-        research_file=job["research_file"],
-        report_file=job["report_file"],
-        metadata={
-            "llm_provider": job["llm_provider"],
-            "progress": job["progress"],
-            "current_step": job["current_step"]
-        },
-        created_at=job["created_at"],
-        completed_at=job["completed_at"]
-    )
-
-@router.get("/download/{job_id}/{file_type}")
-async def download_file(job_id: str, file_type: str):
-    """Download generated files (research or report)"""
-    
-    job = job_manager.get_job_status(job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    if job["status"] != JobStatus.completed:
-        raise HTTPException(status_code=400, detail="Job not completed yet")
-    
-    if file_type == "research" and job["research_file"]:
-        file_path = job["research_file"]
-    elif file_type == "report" and job["report_file"]:
-        file_path = job["report_file"]
-    else:
-        raise HTTPException(status_code=404, detail="File not found")
-    
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail="File not found on disk")
-    
-    return FileResponse(
-        path=file_path,
-        filename=os.path.basename(file_path),
-        media_type='text/markdown'
-    )
-
-@router.get("/config", response_model=ConfigResponse)
-async def get_config():
-    """Get current configuration"""
-    
-    current_llm = LLMProvider(os.getenv('LLM_PROVIDER', 'google'))
-    
-    return ConfigResponse(
-        current_llm=current_llm,
-        available_llms=[LLMProvider.google, LLMProvider.ollama],
-        newsdata_configured=bool(os.getenv('NEWSDATA_API_KEY')),
-        google_configured=bool(os.getenv('GOOGLE_API_KEY')),
-        ollama_available=True  # Assume available for now
-    )
-
-@router.post("/config/llm")
-async def switch_llm(request: LLMSwitchRequest):
-    """Switch LLM provider"""
-    
-    if request.provider == LLMProvider.google and not os.getenv('GOOGLE_API_KEY'):
-        raise HTTPException(
-            status_code=400,
-            detail="Google API key not configured"
-        )
-    
-    os.environ['LLM_PROVIDER'] = request.provider.value
-    
-    return {
-        "message": f"Switched to {request.provider.value}",
-        "current_llm": request.provider.value,
-        "timestamp": datetime.now()
-    }
-
-@router.get("/jobs")
-async def list_jobs():
-    """List all jobs (for admin/debugging)"""
-    
-    jobs = []
-    for job_id, job in job_manager.jobs.items():
-        jobs.append({
-            "job_id": job_id,
-            "topic": job["topic"],
-            "status": job["status"],
-            "created_at": job["created_at"],
-            "llm_provider": job["llm_provider"]
-        })
-    
-    return {
-        "jobs": jobs,
-        "running_count": job_manager.get_running_jobs_count(),
-        "total_count": len(jobs)
-    }
-
-@router.delete("/jobs/{job_id}")
-async def cancel_job(job_id: str):
-    """Cancel a running job"""
-    
-    job = job_manager.get_job_status(job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    if job["status"] == JobStatus.running:
-        job["status"] = JobStatus.failed
-        job["error_message"] = "Job cancelled by user"
-        job["completed_at"] = datetime.now()
-    
-    return {"message": "Job cancelled", "job_id": job_id}
-
-@router.post("/cleanup")
-async def cleanup_old_jobs():
-    """Clean up old completed jobs"""
-    
-    removed_count = job_manager.cleanup_old_jobs(max_age_hours=24)
-    
-    return {
-        "message": f"Cleaned up {removed_count} old jobs",
-        "removed_count": removed_count,
-        "timestamp": datetime.now()
-    }
+from fastapi import (
+    APIRouter, HTTPException, BackgroundTasks, Depends, Header, Query, Request, Response, WebSocket, WebSocketDisconnect
+)
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
+import asyncio
+import base64
+import json
+import os
+from datetime import datetime, timedelta  # ✅ Add timedelta import
+from typing import Dict, List, Optional, Tuple
+
+from .models import (
+    NewsRequest, NewsResponse, StatusResponse, ResultsResponse, 
+    ConfigResponse, LLMSwitchRequest, ErrorResponse, JobStatus, LLMProvider,
+    BatchRequest, BatchResponse, StatusBatchRequest, StatusBatchResponse, JobStatusSummary
+)
+from .background_tasks import JobManager, QueueFull
+from .content_cache import LargeFile
+from .job_store import JOB_FIELDS
+from .metrics import route_template
+from src import profiling, tracing
+
+router = APIRouter()
+
+# Global job manager instance
+job_manager = JobManager()
+
+def _request_span(http_request: Request):
+    """Server span for a request that queues jobs; their executions continue its trace
+    
+    A caller sending a W3C traceparent header gets the job traced as part of its own trace.
+    """
+    return tracing.span(
+        f"{http_request.method} {route_template(http_request.scope)}",
+        parent=http_request.headers.get("traceparent"),
+        kind="server",
+        attributes={"http.method": http_request.method, "http.target": http_request.url.path},
+    )
+
+@router.post("/research", response_model=NewsResponse)
+async def start_research(request: NewsRequest, http_request: Request):
+    """Queue a new news research job"""
+    
+    # Validate configuration
+    if not os.getenv('NEWSDATA_API_KEY'):
+        raise HTTPException(
+            status_code=500,
+            detail="NewsData.io API key not configured"
+        )
+    
+    if request.llm_provider == LLMProvider.google and not os.getenv('GOOGLE_API_KEY'):
+        raise HTTPException(
+            status_code=500,
+            detail="Google API key not configured"
+        )
+    
+    # Create job
+    with _request_span(http_request):
+        try:
+            job_id = job_manager.create_job(
+                topic=request.topic,
+                llm_provider=request.llm_provider.value,
+                parallel_angles=request.parallel_angles,
+                incremental=request.incremental,
+                priority=request.priority,
+                max_articles=request.max_articles,
+                force_refresh=request.force_refresh,
+                profile=request.profile
+            )
+        except QueueFull as e:
+            raise queue_full_error(e)
+        tracing.set_attributes({"job.id": job_id})
+    
+    job_manager.submit()
+    
+    job = job_manager.get_job_status(job_id)
+    queue = job_manager.get_queue_info(job)
+    if job["cached_from"]:
+        message = f"Fresh result reused ({job['current_step']})"
+    elif job["coalesced_with"]:
+        message = "Identical research already in progress - this job will share its result"
+    elif queue["queue_position"]:
+        message = f"Research job queued at position {queue['queue_position']}"
+    else:
+        message = "Research job started"
+    
+    return NewsResponse(
+        job_id=job_id,
+        status=job["status"],
+        message=message,
+        created_at=job["created_at"],
+        estimated_completion=queue["estimated_completion"] or datetime.now() + timedelta(seconds=job_manager.avg_job_seconds),
+        coalesced_with=job["coalesced_with"],
+        cached_from=job["cached_from"]
+    )
+
+def queue_full_error(error: QueueFull) -> HTTPException:
+    """503 telling clients when the queue should have drained enough to retry"""
+    return HTTPException(
+        status_code=503,
+        detail=str(error),
+        headers={"Retry-After": str(int(job_manager.avg_job_seconds))}
+    )
+
+@router.post("/research/batch", response_model=BatchResponse)
+async def start_batch(
+    request: BatchRequest,
+    background_tasks: BackgroundTasks,
+    http_request: Request
+):
+    """Start research jobs for many topics with a shared concurrency limit"""
+    
+    topics = [topic.strip() for topic in request.topics if topic.strip()]
+    if not topics:
+        raise HTTPException(status_code=422, detail="At least one non-empty topic is required")
+    if any(len(topic) > 200 for topic in topics):
+        raise HTTPException(status_code=422, detail="Topics must be at most 200 characters")
+    
+    # Validate configuration
+    if not os.getenv('NEWSDATA_API_KEY'):
+        raise HTTPException(
+            status_code=500,
+            detail="NewsData.io API key not configured"
+        )
+    
+    if request.llm_provider == LLMProvider.google and not os.getenv('GOOGLE_API_KEY'):
+        raise HTTPException(
+            status_code=500,
+            detail="Google API key not configured"
+        )
+    
+    with _request_span(http_request):
+        try:
+            batch = job_manager.create_batch(
+                topics,
+                llm_provider=request.llm_provider.value,
+                parallel_angles=request.parallel_angles,
+                incremental=request.incremental,
+                concurrency=request.concurrency,
+                priority=request.priority,
+                force_refresh=request.force_refresh
+            )
+        except QueueFull as e:
+            raise queue_full_error(e)
+        tracing.set_attributes({"batch.id": batch["id"], "batch.size": len(batch["job_ids"])})
+    
+    background_tasks.add_task(job_manager.execute_batch, batch["id"])
+    
+    return BatchResponse(
+        batch_id=batch["id"],
+        job_ids=batch["job_ids"],
+        message=f"Batch of {len(topics)} topics queued with concurrency {batch['concurrency']}",
+        created_at=batch["created_at"]
+    )
+
+@router.get("/batches/{batch_id}")
+async def get_batch(batch_id: str):
+    """Get per-topic status and aggregate throughput of a batch"""
+    
+    summary = job_manager.get_batch_summary(batch_id)
+    if not summary:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    
+    return summary
+
+# Longest a status request may wait for a change (?wait=)
+MAX_STATUS_WAIT_SECONDS = 60
+
+def _etag_values(header: Optional[str]) -> List[str]:
+    """Versions listed in an If-None-Match header (weak or strong)"""
+    if not header:
+        return []
+    return [tag.strip().removeprefix("W/").strip('"') for tag in header.split(",")]
+
+@router.get("/status/{job_id}", response_model=StatusResponse)
+async def get_job_status(
+    job_id: str,
+    response: Response,
+    wait: Optional[float] = Query(None, ge=0, le=MAX_STATUS_WAIT_SECONDS,
+                                  description="Seconds to hold the request until the status changes"),
+    if_none_match: Optional[str] = Header(None)
+):
+    """Get current status of a research job
+    
+    The ETag changes with the status, so If-None-Match gets a 304 while nothing changed.
+    With ?wait=N the request is held until the status differs from If-None-Match (or from
+    the status when the request arrived) or N seconds pass.
+    """
+    
+    job = job_manager.get_job_status(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    known = _etag_values(if_none_match)
+    queue = job_manager.get_queue_info(job)
+    version = job_manager.status_version(job, queue)
+    
+    if wait and (not known or version in known):
+        job = await job_manager.wait_for_status_change(job_id, version, wait)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        queue = job_manager.get_queue_info(job)
+        version = job_manager.status_version(job, queue)
+    
+    headers = {"ETag": f'"{version}"', "Cache-Control": "no-cache"}
+    if version in known or "*" in known:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    
+    return StatusResponse(
+        job_id=job["id"],
+        status=job["status"],
+        progress=job["progress"],
+        current_step=job["current_step"],
+        created_at=job["created_at"],
+        started_at=job["started_at"],
+        completed_at=job["completed_at"],
+        error_message=job["error_message"],
+        tokens_used=job["tokens_used"],
+        recent_events=job["events"][-10:],
+        queue_position=queue["queue_position"],
+        estimated_start=queue["estimated_start"],
+        coalesced_with=job["coalesced_with"],
+        cached_from=job["cached_from"],
+        version=version
+    )
+
+@router.post("/status:batch", response_model=StatusBatchResponse, response_model_exclude_none=True)
+async def get_job_statuses(request: StatusBatchRequest):
+    """Compact statuses of many jobs in one request
+    
+    Jobs whose version still matches the one given in `versions` are only listed in
+    `unchanged`, so dashboards can refresh dozens of jobs cheaply.
+    """
+    
+    job_ids = list(dict.fromkeys(request.job_ids))
+    jobs = job_manager.get_job_statuses(job_ids)
+    
+    response = StatusBatchResponse()
+    for job_id in job_ids:
+        job = jobs.get(job_id)
+        if job is None:
+            response.not_found.append(job_id)
+            continue
+        
+        queue = job_manager.get_queue_info(job)
+        version = job_manager.status_version(job, queue)
+        if request.versions.get(job_id) == version:
+            response.unchanged.append(job_id)
+            continue
+        
+        response.statuses.append(JobStatusSummary(
+            job_id=job_id,
+            status=job["status"],
+            version=version,
+            progress=job["progress"],
+            current_step=job["current_step"],
+            tokens_used=job["tokens_used"],
+            queue_position=queue["queue_position"],
+            error_message=job["error_message"],
+            completed_at=job["completed_at"]
+        ))
+    
+    return response
+
+# Seconds between SSE keep-alive comments while a job is quiet
+SSE_KEEPALIVE_SECONDS = 15
+
+@router.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """Server-Sent Events stream of a job's progress, ending when the job finishes"""
+    
+    if not job_manager.store.get(job_id, events=0):
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    async def event_stream():
+        async with job_manager.broadcaster.subscribe(job_id) as queue:
+            message_id = 0
+            while True:
+                try:
+                    message = await asyncio.wait_for(queue.get(), SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if message is None:
+                    return
+                
+                name, data = message
+                message_id += 1
+                yield f"event: {name}\nid: {message_id}\ndata: {json.dumps(jsonable_encoder(data))}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/jobs/{job_id}/trace")
+async def get_job_trace(job_id: str):
+    """Spans of a job's trace, with the critical path and time breakdown of its latest execution"""
+    trace = job_manager.get_job_trace(job_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if not trace["trace_ids"]:
+        raise HTTPException(status_code=404, detail="No trace recorded for this job (tracing disabled when it was queued)")
+    return trace
+
+@router.get("/jobs/{job_id}/profile")
+async def get_job_profile(job_id: str):
+    """Summary of a profiled job's crew run and the profile files that can be downloaded"""
+    job = job_manager.store.get(job_id, events=0)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if not job["profile"]:
+        raise HTTPException(status_code=404, detail="Job was not profiled (submit it with profile=true)")
+    
+    summary = profiling.load_summary(job_id)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="Profile not available until the job's run ends")
+    
+    return {
+        "job_id": job_id,
+        "files": [name for name in profiling.PROFILE_FILES if profiling.profile_path(job_id, name)],
+        "summary": summary,
+    }
+
+@router.get("/jobs/{job_id}/profile/{name}")
+async def download_job_profile(job_id: str, name: str):
+    """Download a profile file: cpu (pstats), cpu_text, flame (collapsed stacks) or summary"""
+    if name not in profiling.PROFILE_FILES:
+        raise HTTPException(status_code=404, detail=f"Unknown profile file, use one of: {', '.join(profiling.PROFILE_FILES)}")
+    
+    path = profiling.profile_path(job_id, name)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Profile file not found")
+    
+    return FileResponse(
+        path=path,
+        filename=f"{job_id}_{os.path.basename(path)}",
+        media_type=profiling.PROFILE_FILES[name][1],
+    )
+
+@router.websocket("/jobs/{job_id}/ws")
+async def job_events_websocket(websocket: WebSocket, job_id: str):
+    """WebSocket variant of /jobs/{job_id}/events: one {"event", "data"} JSON message per update"""
+    
+    await websocket.accept()
+    if not job_manager.store.get(job_id, events=0):
+        await websocket.close(code=4404, reason="Job not found")
+        return
+    
+    try:
+        async with job_manager.broadcaster.subscribe(job_id) as queue:
+            while (message := await queue.get()) is not None:
+                name, data = message
+                await websocket.send_json({"event": name, "data": jsonable_encoder(data)})
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+
+# Outputs of a completed job never change, so clients and proxies may keep them
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+@router.get("/results/{job_id}", response_model=ResultsResponse)
+async def get_job_results(
+    job_id: str,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. final_report"),
+    if_none_match: Optional[str] = Header(None)
+):
+    """Get results of a completed research job
+    
+    Completed results are immutable: they carry a weak ETag per field selection
+    (If-None-Match gets a 304) and long-lived caching headers. ?fields= skips the documents a client doesn't need, and
+    documents too large for the content cache are streamed from disk.
+    """
+    
+    selected = None
+    if fields:
+        selected = set(field.strip() for field in fields.split(",") if field.strip())
+        unknown = selected - set(ResultsResponse.model_fields)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+        selected.add("job_id")
+    
+    job = job_manager.store.get(job_id, events=0)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    # Each field selection is its own document, and the body may be compressed or not
+    headers = {"Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if job["status"] == JobStatus.completed:
+        etag = str(job["version"]) if selected is None else f'{job["version"]}-{"+".join(sorted(selected))}'
+        headers.update({"ETag": f'W/"{etag}"', "Cache-Control": IMMUTABLE_CACHE_CONTROL})
+        if job["version"] is not None and etag in _etag_values(if_none_match):
+            return Response(status_code=304, headers=headers)
+    
+    job = job_manager.get_job_results(
+        job_id,
+        research=selected is None or "research_summary" in selected,
+        report=selected is None or "final_report" in selected
+    )
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    documents = {"research_summary": job.get("research_content"), "final_report": job.get("report_content")}
+    large = {field: content for field, content in documents.items() if isinstance(content, LargeFile)}
+    
+    results = ResultsResponse(
+        job_id=job["id"],
+        status=job["status"],
+        topic=job["topic"],
+        research_summary=None if "research_summary" in large else documents["research_summary"],
+        final_report=None if "final_report" in large else documents["final_report"],
+        research_file=job["research_file"],
+        report_file=job["report_file"],
+        metadata={
+            "llm_provider": job["llm_provider"],
+            "progress": job["progress"],
+            "current_step": job["current_step"]
+        },
+        created_at=job["created_at"],
+        completed_at=job["completed_at"]
+    )
+    body = jsonable_encoder(results, include=selected)
+    if large:
+        return StreamingResponse(_stream_json(body, large), media_type="application/json", headers=headers)
+    return JSONResponse(body, headers=headers)
+
+def _stream_json(body: Dict, large: Dict[str, LargeFile]):
+    """JSON of `body` with the string values of `large` fields read from their files chunk by chunk"""
+    yield "{"
+    for index, (field, value) in enumerate(body.items()):
+        yield f'{"," if index else ""}{json.dumps(field)}:'
+        if field in large:
+            yield '"'
+            for chunk in large[field].chunks():
+                yield json.dumps(chunk, ensure_ascii=False)[1:-1]
+            yield '"'
+        else:
+            yield json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    yield "}"
+
+@router.get("/download/{job_id}/{file_type}")
+async def download_file(job_id: str, file_type: str, if_none_match: Optional[str] = Header(None)):
+    """Download generated files (research or report)
+    
+    Supports Range requests for resuming, and ETag/If-None-Match revalidation.
+    """
+    
+    job = job_manager.store.get(job_id, events=0)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if job["status"] != JobStatus.completed:
+        raise HTTPException(status_code=400, detail="Job not completed yet")
+    
+    if file_type == "research" and job["research_file"]:
+        file_path = job["research_file"]
+    elif file_type == "report" and job["report_file"]:
+        file_path = job["report_file"]
+    else:
+        raise HTTPException(status_code=404, detail="File not found")
+    
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
+        raise HTTPException(status_code=404, detail="File not found on disk")
+    
+    etag = f"{job_id}-{file_type}-{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"
+    headers = {"ETag": f'"{etag}"', "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    if etag in _etag_values(if_none_match):
+        return Response(status_code=304, headers=headers)
+    
+    return FileResponse(
+        path=file_path,
+        filename=os.path.basename(file_path),
+        media_type='text/markdown',
+        headers=headers,
+        stat_result=stat_result
+    )
+
+@router.get("/config", response_model=ConfigResponse)
+async def get_config():
+    """Get current configuration"""
+    
+    current_llm = LLMProvider(os.getenv('LLM_PROVIDER', 'google'))
+    
+    return ConfigResponse(
+        current_llm=current_llm,
+        available_llms=[LLMProvider.google, LLMProvider.ollama],
+        newsdata_configured=bool(os.getenv('NEWSDATA_API_KEY')),
+        google_configured=bool(os.getenv('GOOGLE_API_KEY')),
+        ollama_available=True  # Assume available for now
+    )
+
+@router.post("/config/llm")
+async def switch_llm(request: LLMSwitchRequest):
+    """Switch LLM provider"""
+    
+    if request.provider == LLMProvider.google and not os.getenv('GOOGLE_API_KEY'):
+        raise HTTPException(
+            status_code=400,
+            detail="Google API key not configured"
+        )
+    
+    os.environ['LLM_PROVIDER'] = request.provider.value
+    
+    return {
+        "message": f"Switched to {request.provider.value}",
+        "current_llm": request.provider.value,
+        "timestamp": datetime.now()
+    }
+
+# Fields /jobs can return (?fields=) and those it returns by default
+JOB_LIST_FIELDS = ("job_id",) + tuple(field for field in JOB_FIELDS if field != "id")
+DEFAULT_JOB_LIST_FIELDS = ("job_id", "topic", "status", "created_at", "llm_provider")
+
+def _encode_cursor(job: Dict) -> str:
+    key = json.dumps([job["created_at"].isoformat(), job["id"]])
+    return base64.urlsafe_b64encode(key.encode()).decode().rstrip("=")
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        created_at, job_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return datetime.fromisoformat(created_at), job_id
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def _local_time(value: Optional[datetime]) -> Optional[datetime]:
+    """Job times are naive local times; convert timezone-aware filters to match"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+@router.get("/jobs")
+async def list_jobs(
+    status: Optional[JobStatus] = None,
+    llm_provider: Optional[LLMProvider] = None,
+    topic_prefix: Optional[str] = Query(None, description="Topics starting with this text (case and punctuation ignored)"),
+    created_after: Optional[datetime] = Query(None, description="Jobs created at or after this time"),
+    created_before: Optional[datetime] = Query(None, description="Jobs created before this time"),
+    sort: str = Query("-created_at", pattern="^-?created_at$", description="created_at (oldest first) or -created_at (newest first)"),
+    fields: Optional[str] = Query(None, description=f"Comma-separated fields to return (default: {','.join(DEFAULT_JOB_LIST_FIELDS)})"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=1000)
+):
+    """Page through jobs (for admin/debugging); pass next_cursor back as ?cursor= for the next page"""
+    
+    selected = DEFAULT_JOB_LIST_FIELDS
+    if fields:
+        selected = tuple(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+        unknown = [field for field in selected if field not in JOB_LIST_FIELDS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    
+    # One extra row tells whether another page follows
+    page = job_manager.list_jobs(
+        status=status,
+        llm_provider=llm_provider.value if llm_provider else None,
+        topic_prefix=topic_prefix,
+        created_after=_local_time(created_after),
+        created_before=_local_time(created_before),
+        newest_first=sort.startswith("-"),
+        after=_decode_cursor(cursor) if cursor else None,
+        fields=["id" if field == "job_id" else field for field in selected],
+        limit=limit + 1
+    )
+    next_cursor = _encode_cursor(page[limit - 1]) if len(page) > limit else None
+    
+    jobs = [
+        {field: job["id"] if field == "job_id" else job.get(field) for field in selected}
+        for job in page[:limit]
+    ]
+    
+    return {
+        "jobs": jobs,
+        "next_cursor": next_cursor,
+        "running_count": job_manager.get_running_jobs_count(),
+        "total_count": job_manager.store.count()
+    }
+
+@router.get("/workers")
+async def list_workers():
+    """API processes and standalone workers currently running jobs from the queue"""
+    
+    workers = job_manager.list_workers()
+    return {
+        "workers": workers,
+        "total_capacity": sum(worker["concurrency"] for worker in workers),
+        "running_count": job_manager.get_running_jobs_count(),
+        "queued_count": job_manager.store.count(JobStatus.pending)
+    }
+
+@router.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str, force: bool = False):
+    """Cancel a pending or running job (force=true kills its worker process)"""
+    
+    job = job_manager.get_job_status(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    if not job_manager.cancel_job(job_id, force=force):
+        return {"message": f"Job already {job['status'].value}", "job_id": job_id}
+    
+    return {"message": "Job cancellation requested", "job_id": job_id}
+
+@router.post("/jobs/{job_id}/resume", response_model=NewsResponse)
+async def resume_job(job_id: str):
+    """Re-queue a failed or cancelled job to resume from its last completed stage"""
+    
+    try:
+        resumed = job_manager.resume_job(job_id)
+    except QueueFull as e:
+        raise queue_full_error(e)
+    
+    if not resumed:
+        if job_manager.get_job_status(job_id):
+            raise HTTPException(status_code=409, detail="Only failed or cancelled jobs can be resumed")
+        raise HTTPException(status_code=404, detail="No checkpoints found for job")
+    
+    job_manager.submit()
+    
+    job = job_manager.get_job_status(job_id)
+    return NewsResponse(
+        job_id=job_id,
+        status=job["status"],
+        message="Job queued to resume from its last checkpoint",
+        created_at=job["created_at"],
+        estimated_completion=job_manager.get_queue_info(job)["estimated_completion"]
+    )
+
+@router.post("/cleanup")
+async def cleanup_old_jobs():
+    """Clean up old completed jobs"""
+    
+    removed_count = job_manager.cleanup_old_jobs(max_age_hours=24)
+    
+    return {
+        "message": f"Cleaned up {removed_count} old jobs",
+        "removed_count": removed_count,
+        "timestamp": datetime.now()
+    }
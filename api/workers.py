@@ -0,0 +1,278 @@
+import asyncio
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import traceback
+from typing import Any, Callable, Dict, Optional
+
+from src.crew import NewsResearchCrew
+from src.cancellation import CancellationToken, JobCancelled
+from src.llm_config import LLMConfig
+from src.tools import get_shared_search_cache
+from src import profiling, tracing
+from src.metrics import REGISTRY
+
+def run_crew_job(spec: Dict[str, Any], on_event: Callable, cancel_token: CancellationToken) -> Dict[str, Any]:
+    """Run the research crew for a job spec (shared by every worker backend)
+
+    Returns the final report text with the exact research/report files of this run.
+    """
+    # Set LLM provider
+    os.environ['LLM_PROVIDER'] = spec["llm_provider"]
+
+    # Batch jobs share one LLM client and search cache per worker process
+    shared = {}
+    if spec.get("shared_resources"):
+        shared = {"llm": LLMConfig.get_shared_llm(), "search_cache": get_shared_search_cache()}
+
+    crew = NewsResearchCrew(
+        spec["topic"],
+        parallel_angles=spec.get("parallel_angles", 1),
+        on_event=on_event,
+        cancel_token=cancel_token,
+        run_id=spec.get("run_id"),
+        incremental=spec.get("incremental", False),
+        max_articles=spec.get("max_articles"),
+        **shared,
+    )
+    # Crew spans continue the job's trace, whichever process runs it
+    with tracing.attach(spec.get("trace_parent")), profiling.profile(spec["run_id"] if spec.get("profile") else None):
+        result = crew.run()
+    return {"result": str(result) if result else "Research completed", **crew.output_files()}
+
+class ThreadWorkerBackend:
+    """Runs crews on threads inside the API process"""
+
+    name = "thread"
+
+    async def run(self, job_id: str, spec: Dict[str, Any], on_event: Callable, token: CancellationToken) -> Dict[str, Any]:
+        return await asyncio.to_thread(run_crew_job, spec, on_event, token)
+
+    def kill(self, job_id: str) -> bool:
+        """Threads can't be killed - cancellation stays cooperative"""
+        return False
+
+    def shutdown(self):
+        pass
+
+# ===== PROCESS WORKERS =====
+# Seconds between metric updates a worker sends while a job runs
+METRICS_SEND_INTERVAL = 5.0
+
+def _worker_main(conn, cancel_event, max_tasks: int):
+    """Worker process loop: run jobs sent over `conn` until recycled"""
+    # Parallel-angle threads report progress at the same time; a Connection isn't thread-safe
+    send_lock = threading.Lock()
+    metrics_sent = time.monotonic()
+
+    def send(message):
+        with send_lock:
+            conn.send(message)
+
+    def send_metrics():
+        # Crew, LLM and NewsData metrics recorded here are exported by the API process
+        nonlocal metrics_sent
+        metrics_sent = time.monotonic()
+        values = REGISTRY.take()
+        if values:
+            send(("metrics", values))
+
+    def on_event(event):
+        send(("event", event))
+        if time.monotonic() - metrics_sent >= METRICS_SEND_INTERVAL:
+            send_metrics()
+
+    for _ in range(max_tasks):
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+
+        if message[0] == "stop":
+            return
+
+        _, job_id, spec, deadline = message
+        token = CancellationToken(deadline=deadline)
+
+        # Mirror the parent's cancel request onto the local token
+        done = threading.Event()
+        def watch_cancel():
+            while not done.is_set():
+                if cancel_event.wait(0.5):
+                    token.cancel("Job cancelled by user")
+                    return
+        watcher = threading.Thread(target=watch_cancel, daemon=True)
+        watcher.start()
+
+        try:
+            result = run_crew_job(spec, on_event, token)
+            outcome = ("done", result)
+        except JobCancelled as e:
+            outcome = ("cancelled", str(e))
+        except Exception as e:
+            outcome = ("error", str(e), traceback.format_exc())
+        finally:
+            done.set()
+            watcher.join()
+            tracing.flush()  # The process may be recycled before a batch would go out
+        send_metrics()  # Before the outcome, after which the parent stops reading
+        send(outcome)
+
+class _WorkerSlot:
+    """Parent-side handle for one worker process"""
+
+    def __init__(self, ctx, max_tasks: int):
+        self.conn, child_conn = ctx.Pipe()
+        self.cancel_event = ctx.Event()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self.cancel_event, max_tasks),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.tasks_done = 0
+        self.job_id: Optional[str] = None
+        self.killed = False
+
+class ProcessWorkerBackend:
+    """Runs crews in a pool of worker processes recycled after `max_tasks_per_child` jobs
+
+    Progress events, metrics and results come back over a pipe per worker. Cancellation is
+    forwarded to the worker and, if it doesn't stop within `kill_grace_seconds`
+    (or on kill()), the worker process is terminated and replaced.
+    """
+
+    name = "process"
+
+    def __init__(self, max_workers: int = 3, max_tasks_per_child: int = 10, kill_grace_seconds: float = 60.0):
+        self.max_workers = max_workers
+        self.max_tasks_per_child = max_tasks_per_child
+        self.kill_grace_seconds = kill_grace_seconds
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle: "queue.Queue[Optional[_WorkerSlot]]" = queue.Queue()
+        self._busy: Dict[str, _WorkerSlot] = {}
+        self._lock = threading.Lock()
+
+        # Workers are started lazily the first time a slot is needed
+        for _ in range(max_workers):
+            self._idle.put(None)
+
+    async def run(self, job_id: str, spec: Dict[str, Any], on_event: Callable, token: CancellationToken) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._run_blocking, job_id, spec, on_event, token)
+
+    def _run_blocking(self, job_id: str, spec: Dict[str, Any], on_event: Callable, token: CancellationToken) -> Dict[str, Any]:
+        slot = self._idle.get()
+        if slot is None or not slot.process.is_alive():
+            slot = _WorkerSlot(self._ctx, self.max_tasks_per_child)
+
+        with self._lock:
+            slot.job_id = job_id
+            self._busy[job_id] = slot
+
+        try:
+            slot.cancel_event.clear()
+            slot.conn.send(("run", job_id, spec, token.deadline))
+            return self._wait_for_result(slot, on_event, token)
+        finally:
+            with self._lock:
+                self._busy.pop(job_id, None)
+                slot.job_id = None
+            self._release(slot)
+
+    def _wait_for_result(self, slot: _WorkerSlot, on_event: Callable, token: CancellationToken) -> Dict[str, Any]:
+        cancelled_at = None
+
+        while True:
+            if token.cancelled and cancelled_at is None:
+                cancelled_at = time.time()
+                slot.cancel_event.set()
+
+            if cancelled_at and time.time() - cancelled_at > self.kill_grace_seconds:
+                self._terminate(slot)
+
+            try:
+                ready = slot.conn.poll(0.5)
+                message = slot.conn.recv() if ready else None
+            except (EOFError, OSError):
+                message = None
+                ready = False
+
+            if message is None:
+                if not slot.process.is_alive():
+                    if slot.killed:
+                        raise JobCancelled(token.reason or "Job killed")
+                    raise RuntimeError(f"Worker process exited unexpectedly (code {slot.process.exitcode})")
+                continue
+
+            kind = message[0]
+            if kind == "event":
+                on_event(message[1])
+            elif kind == "metrics":
+                REGISTRY.merge(message[1])
+            elif kind == "done":
+                slot.tasks_done += 1
+                return message[1]
+            elif kind == "cancelled":
+                slot.tasks_done += 1
+                raise JobCancelled(token.reason or message[1])
+            elif kind == "error":
+                slot.tasks_done += 1
+                print(message[2])
+                raise RuntimeError(message[1])
+
+    def _release(self, slot: _WorkerSlot):
+        """Return a slot to the pool, recycling its process when it is worn out or dead"""
+        if slot.killed or not slot.process.is_alive() or slot.tasks_done >= self.max_tasks_per_child:
+            if slot.process.is_alive():
+                slot.process.join(timeout=5)
+            slot.conn.close()
+            self._idle.put(None)
+        else:
+            self._idle.put(slot)
+
+    def _terminate(self, slot: _WorkerSlot):
+        slot.killed = True
+        if slot.process.is_alive():
+            slot.process.kill()
+
+    def kill(self, job_id: str) -> bool:
+        """Hard-kill the worker process running `job_id`"""
+        with self._lock:
+            slot = self._busy.get(job_id)
+        if not slot:
+            return False
+        self._terminate(slot)
+        return True
+
+    def shutdown(self):
+        with self._lock:
+            busy = list(self._busy.values())
+        for slot in busy:
+            self._terminate(slot)
+
+        while True:
+            try:
+                slot = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if slot is not None and slot.process.is_alive():
+                slot.conn.send(("stop",))
+                slot.process.join(timeout=5)
+
+def create_worker_backend(name: Optional[str] = None, max_workers: int = 3):
+    """Build the worker backend selected by JOB_WORKER_BACKEND (thread or process)"""
+    name = (name or os.getenv('JOB_WORKER_BACKEND', 'thread')).lower()
+
+    if name == 'thread':
+        return ThreadWorkerBackend()
+    elif name == 'process':
+        return ProcessWorkerBackend(
+            max_workers=max_workers,
+            max_tasks_per_child=int(os.getenv('JOB_WORKER_MAX_TASKS_PER_CHILD', '10')),
+            kill_grace_seconds=float(os.getenv('JOB_WORKER_KILL_GRACE_SECONDS', '60')),
+        )
+    else:
+        raise ValueError(f"Unsupported worker backend: {name}. Use 'thread' or 'process'")
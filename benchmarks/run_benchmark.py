@@ -0,0 +1,362 @@
+"""End-to-end throughput and latency benchmark
+
+Drives the real stack (POST /api/v1/research -> JobManager -> NewsResearchCrew -> tools)
+with the mock LLM and the offline NewsData stub, then saves a JSON report:
+
+    python benchmarks/run_benchmark.py --jobs 30 --llm-latency 0.5 --news-latency 0.2
+    python benchmarks/run_benchmark.py --compare benchmarks/results/<previous>.json
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.batch import percentile
+from src.newsdata_stub import NewsDataStub, start_stub_server
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+TERMINAL_STATUSES = {"completed", "failed", "cancelled"}
+TOPICS = [
+    "artificial intelligence regulation",
+    "climate policy",
+    "global markets",
+    "space exploration",
+    "electric vehicles",
+    "public health",
+]
+
+def latency_stats(values: List[float], scale: float = 1.0) -> Dict[str, Any]:
+    scaled = [v * scale for v in values]
+    return {
+        "count": len(scaled),
+        "mean": round(sum(scaled) / len(scaled), 2) if scaled else None,
+        "p50": percentile(scaled, 50),
+        "p95": percentile(scaled, 95),
+        "p99": percentile(scaled, 99),
+        "max": round(max(scaled), 2) if scaled else None,
+    }
+
+def rss_mb(pid: int) -> Optional[float]:
+    """Resident memory of a process in MB (Linux /proc only)"""
+    try:
+        with open(f"/proc/{pid}/status", 'r') as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+class ApiServer:
+    """uvicorn running app:app in a scratch directory, wired to the offline backends"""
+
+    def __init__(self, port: int, env: Dict[str, str], worker_backend: str):
+        self.base_url = f"http://127.0.0.1:{port}"
+        self.workdir = tempfile.mkdtemp(prefix="news_bench_")
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app:app", "--app-dir", ROOT,
+             "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+            cwd=self.workdir,
+            env={**os.environ, **env, "JOB_WORKER_BACKEND": worker_backend, "PYTHONPATH": ROOT},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def wait_until_ready(self, timeout: float = 60.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"API server exited with code {self.process.returncode}")
+            try:
+                if requests.get(f"{self.base_url}/health", timeout=2).ok:
+                    return
+            except requests.RequestException:
+                pass
+            time.sleep(0.5)
+        raise RuntimeError("API server did not become healthy in time")
+
+    def stop(self):
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+class Benchmark:
+    def __init__(self, args: argparse.Namespace, server: ApiServer):
+        self.args = args
+        self.server = server
+        self.api = f"{server.base_url}/api/v1"
+        self._local = threading.local()
+        self.lock = threading.Lock()
+
+        self.job_latencies: List[float] = []
+        self.service_times: List[float] = []
+        self.status_latencies: List[float] = []
+        self.statuses: Dict[str, int] = {}
+        self.rejected = 0
+        self.active_jobs: List[str] = []
+        self.memory: List[float] = []
+        self.done = threading.Event()
+
+    @property
+    def session(self) -> requests.Session:
+        """One pooled session per client thread"""
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def run(self) -> Dict[str, Any]:
+        for index in range(self.args.warmup):
+            self._run_job(f"warmup {index}", record=False)
+
+        samplers = [threading.Thread(target=self._sample_memory, daemon=True)]
+        samplers += [threading.Thread(target=self._poll_status, daemon=True) for _ in range(self.args.pollers)]
+        for thread in samplers:
+            thread.start()
+
+        start = time.time()
+        remaining = iter(range(self.args.jobs))
+        workers = [
+            threading.Thread(target=self._submit_loop, args=(remaining,))
+            for _ in range(self.args.concurrency)
+        ]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        wall_seconds = time.time() - start
+
+        time.sleep(1.0)  # Let the server settle before the last memory sample
+        self._record_memory()
+        self.done.set()
+        for thread in samplers:
+            thread.join(timeout=5)
+
+        return self._report(wall_seconds)
+
+    def _submit_loop(self, remaining):
+        while True:
+            with self.lock:
+                index = next(remaining, None)
+            if index is None:
+                return
+            self._run_job(f"job {index}")
+
+    def _run_job(self, label: str, record: bool = True):
+        # Every job must run its crew: a unique topic keeps it from coalescing with
+        # another in-flight job and force_refresh from reusing a cached report
+        payload = {
+            "topic": f"{random.choice(TOPICS)} {label}",
+            "llm_provider": "mock",
+            "parallel_angles": self.args.parallel_angles,
+            "force_refresh": True,
+        }
+
+        submitted = time.time()
+        while True:
+            response = self.session.post(f"{self.api}/research", json=payload, timeout=30)
+            if response.status_code not in (429, 503):
+                break
+            with self.lock:
+                self.rejected += record
+            time.sleep(0.2)
+        response.raise_for_status()
+        job_id = response.json()["job_id"]
+
+        with self.lock:
+            self.active_jobs.append(job_id)
+
+        while True:
+            time.sleep(self.args.poll_interval)
+            status = self._get_status(job_id, record)
+            if status and status["status"] in TERMINAL_STATUSES:
+                break
+
+        with self.lock:
+            self.active_jobs.remove(job_id)
+            if not record:
+                return
+            self.job_latencies.append(time.time() - submitted)
+            self.statuses[status["status"]] = self.statuses.get(status["status"], 0) + 1
+            if status.get("started_at") and status.get("completed_at"):
+                service = datetime.fromisoformat(status["completed_at"]) - datetime.fromisoformat(status["started_at"])
+                self.service_times.append(service.total_seconds())
+
+    def _get_status(self, job_id: str, record: bool = True) -> Optional[Dict[str, Any]]:
+        start = time.perf_counter()
+        try:
+            response = self.session.get(f"{self.api}/status/{job_id}", timeout=30)
+        except requests.RequestException:
+            return None
+        elapsed = time.perf_counter() - start
+        if record:
+            with self.lock:
+                self.status_latencies.append(elapsed)
+        return response.json() if response.ok else None
+
+    def _poll_status(self):
+        """Extra dashboard-style polling load on whichever jobs are in flight"""
+        session = self.session
+        while not self.done.is_set():
+            with self.lock:
+                job_id = random.choice(self.active_jobs) if self.active_jobs else None
+            if job_id:
+                start = time.perf_counter()
+                try:
+                    session.get(f"{self.api}/status/{job_id}", timeout=30)
+                    with self.lock:
+                        self.status_latencies.append(time.perf_counter() - start)
+                except requests.RequestException:
+                    pass
+            time.sleep(self.args.poll_interval)
+
+    def _sample_memory(self):
+        while not self.done.wait(0.5):
+            self._record_memory()
+
+    def _record_memory(self):
+        value = rss_mb(self.server.process.pid)
+        if value is not None:
+            with self.lock:
+                self.memory.append(value)
+
+    def _report(self, wall_seconds: float) -> Dict[str, Any]:
+        completed = self.statuses.get("completed", 0)
+        memory = {
+            "start_mb": self.memory[0] if self.memory else None,
+            "peak_mb": max(self.memory) if self.memory else None,
+            "end_mb": self.memory[-1] if self.memory else None,
+        }
+        if self.memory:
+            memory["growth_mb"] = round(self.memory[-1] - self.memory[0], 1)
+
+        return {
+            "benchmark": "e2e",
+            "timestamp": datetime.now().isoformat(),
+            "git_commit": git_commit(),
+            "config": {
+                "jobs": self.args.jobs,
+                "concurrency": self.args.concurrency,
+                "parallel_angles": self.args.parallel_angles,
+                "pollers": self.args.pollers,
+                "poll_interval": self.args.poll_interval,
+                "llm_latency": self.args.llm_latency,
+                "news_latency": self.args.news_latency,
+                "worker_backend": self.args.worker_backend,
+                "unique_topics": True,
+                "force_refresh": True,
+            },
+            "throughput": {
+                "wall_seconds": round(wall_seconds, 2),
+                "jobs_per_minute": round(completed / wall_seconds * 60, 2) if wall_seconds > 0 else None,
+                "statuses": self.statuses,
+                "rejected": self.rejected,
+            },
+            "job_latency_seconds": latency_stats(self.job_latencies),
+            "job_service_seconds": latency_stats(self.service_times),
+            "status_latency_ms": latency_stats(self.status_latencies, scale=1000),
+            "memory": memory,
+        }
+
+# Metrics compared by --compare, and whether higher is better
+KEY_METRICS = [
+    (("throughput", "jobs_per_minute"), True),
+    (("job_latency_seconds", "p50"), False),
+    (("job_latency_seconds", "p95"), False),
+    (("job_latency_seconds", "p99"), False),
+    (("status_latency_ms", "p50"), False),
+    (("status_latency_ms", "p99"), False),
+    (("memory", "growth_mb"), False),
+]
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]):
+    print(f"\n📈 Compared with {baseline.get('git_commit')} ({baseline.get('timestamp')})")
+    for path, higher_is_better in KEY_METRICS:
+        old = baseline.get(path[0], {}).get(path[1])
+        new = current.get(path[0], {}).get(path[1])
+        if old is None or new is None:
+            continue
+        change = (new - old) / old * 100 if old else 0.0
+        better = (change > 0) == higher_is_better or change == 0
+        print(f"   {'✅' if better else '⚠️ '} {'.'.join(path)}: {old} -> {new} ({change:+.1f}%)")
+
+def print_report(report: Dict[str, Any]):
+    throughput = report["throughput"]
+    print("\n📊 BENCHMARK RESULTS")
+    print("=" * 50)
+    print(f"Jobs/minute:        {throughput['jobs_per_minute']} ({throughput['statuses']}, {throughput['rejected']} rejected)")
+    for key, unit in (("job_latency_seconds", "s"), ("status_latency_ms", "ms")):
+        stats = report[key]
+        print(f"{key:<20}p50 {stats['p50']}{unit}  p95 {stats['p95']}{unit}  p99 {stats['p99']}{unit}  (n={stats['count']})")
+    memory = report["memory"]
+    print(f"Server memory:      {memory['start_mb']} -> {memory['end_mb']} MB (peak {memory['peak_mb']} MB)")
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end throughput and latency benchmark")
+    parser.add_argument("--jobs", type=int, default=20, help="Measured jobs")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured jobs run first")
+    parser.add_argument("--concurrency", type=int, default=3, help="Jobs kept in flight by the client")
+    parser.add_argument("--parallel-angles", type=int, default=1)
+    parser.add_argument("--pollers", type=int, default=10, help="Extra clients polling /status")
+    parser.add_argument("--poll-interval", type=float, default=0.25, help="Seconds between status polls")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="Mock LLM seconds per call")
+    parser.add_argument("--llm-jitter", type=float, default=0.1)
+    parser.add_argument("--news-latency", type=float, default=0.2, help="Stub NewsData seconds per request")
+    parser.add_argument("--news-jitter", type=float, default=0.05)
+    parser.add_argument("--worker-backend", choices=["thread", "process"], default="thread")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--output", help="Result file (default benchmarks/results/e2e_<timestamp>.json)")
+    parser.add_argument("--compare", help="Previous result file to compare against")
+    args = parser.parse_args()
+
+    stub_server = start_stub_server(stub=NewsDataStub(latency=args.news_latency, jitter=args.news_jitter))
+    server = ApiServer(args.port, {
+        "LLM_PROVIDER": "mock",
+        "MOCK_LLM_LATENCY_SECONDS": str(args.llm_latency),
+        "MOCK_LLM_JITTER_SECONDS": str(args.llm_jitter),
+        "NEWSDATA_BASE_URL": stub_server.base_url,
+        "NEWSDATA_API_KEY": "stub",
+    }, args.worker_backend)
+
+    print(f"🚀 Benchmarking {args.jobs} jobs (concurrency {args.concurrency}, {args.pollers} pollers)")
+    try:
+        server.wait_until_ready()
+        report = Benchmark(args, server).run()
+    finally:
+        server.stop()
+        stub_server.shutdown()
+
+    report["config"]["stub_requests"] = stub_server.stub.requests
+    print_report(report)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"e2e_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"📁 Results saved to {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare(json.load(f), report)
+
+if __name__ == "__main__":
+    main()
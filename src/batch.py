@@ -0,0 +1,188 @@
+import argparse
+import json
+import math
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from .crew import NewsResearchCrew
+from .llm_config import LLMConfig
+from .tasks import normalize_topic
+from .tools import SearchCache
+
+BATCH_DIR = os.path.join("outputs", "batches")
+
+def load_topics(path: str) -> List[str]:
+    """Read one topic per line, skipping blanks, # comments and repeats"""
+    topics, seen = [], set()
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            topic = line.strip()
+            if not topic or topic.startswith('#'):
+                continue
+            key = normalize_topic(topic)
+            if key in seen:
+                continue
+            seen.add(key)
+            topics.append(topic)
+    return topics
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return round(ordered[index], 2)
+
+def summarize_batch(results: List[Dict[str, Any]], wall_seconds: float, **extra) -> Dict[str, Any]:
+    """Aggregate throughput report for a batch of topic results"""
+    durations = [r["duration_seconds"] for r in results if r.get("duration_seconds") is not None]
+    completed = [r for r in results if r["status"] == "completed"]
+
+    return {
+        "total_topics": len(results),
+        "completed": len(completed),
+        "failed": len(results) - len(completed),
+        "wall_seconds": round(wall_seconds, 2),
+        "topics_per_minute": round(len(completed) / wall_seconds * 60, 2) if wall_seconds > 0 else None,
+        "duration_seconds": {
+            "mean": round(sum(durations) / len(durations), 2) if durations else None,
+            "p50": percentile(durations, 50),
+            "p95": percentile(durations, 95),
+            "max": round(max(durations), 2) if durations else None,
+        },
+        **extra,
+    }
+
+def write_batch_report(batch_id: str, results: List[Dict[str, Any]], summary: Dict[str, Any]) -> str:
+    """Write per-topic results and the aggregate report under outputs/batches/<batch_id>/"""
+    path = os.path.join(BATCH_DIR, batch_id)
+    os.makedirs(path, exist_ok=True)
+
+    with open(os.path.join(path, "results.jsonl"), 'w', encoding='utf-8') as f:
+        for result in results:
+            f.write(json.dumps(result, ensure_ascii=False, default=str) + "\n")
+
+    with open(os.path.join(path, "report.json"), 'w', encoding='utf-8') as f:
+        json.dump({"batch_id": batch_id, **summary}, f, indent=2, default=str)
+
+    return path
+
+class BatchRunner:
+    """Runs many topics with bounded concurrency, sharing one LLM client and search cache"""
+
+    def __init__(self, topics: List[str], concurrency: int = 3, parallel_angles: int = 1,
+                 incremental: bool = False, batch_id: Optional[str] = None):
+        self.topics = topics
+        self.concurrency = max(1, concurrency)
+        self.parallel_angles = parallel_angles
+        self.incremental = incremental
+        self.batch_id = batch_id or f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+        # Shared by every crew in the batch (the HTTP session is process-wide already)
+        self.llm = LLMConfig.get_shared_llm()
+        self.search_cache = SearchCache(ttl_seconds=float(os.getenv('NEWS_SEARCH_CACHE_TTL_SECONDS', '600')))
+
+    def run(self) -> Dict[str, Any]:
+        print(f"\n📦 Batch {self.batch_id}: {len(self.topics)} topics, concurrency {self.concurrency}")
+        print("=" * 70)
+
+        start = time.time()
+        results = []
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [
+                executor.submit(self._run_topic, index, topic)
+                for index, topic in enumerate(self.topics)
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                icon = "✅" if result["status"] == "completed" else "❌"
+                print(f"{icon} [{len(results)}/{len(self.topics)}] {result['topic']} ({result['duration_seconds']}s)")
+
+        results.sort(key=lambda r: r["index"])
+        summary = summarize_batch(
+            results,
+            time.time() - start,
+            concurrency=self.concurrency,
+            search_cache=self.search_cache.stats(),
+            total_tokens=self._tokens_used(),
+        )
+        path = write_batch_report(self.batch_id, results, summary)
+
+        print("=" * 70)
+        print(f"📊 {summary['completed']}/{summary['total_topics']} completed in {summary['wall_seconds']}s "
+              f"({summary['topics_per_minute']} topics/min)")
+        print(f"📁 Report: {path}/report.json")
+        return summary
+
+    def _run_topic(self, index: int, topic: str) -> Dict[str, Any]:
+        start = time.time()
+        result = {
+            "index": index,
+            "topic": topic,
+            "run_id": f"{self.batch_id}_{index:04d}",
+            "status": "failed",
+            "research_file": None,
+            "report_file": None,
+            "error": None,
+        }
+
+        try:
+            crew = NewsResearchCrew(
+                topic,
+                parallel_angles=self.parallel_angles,
+                run_id=result["run_id"],
+                incremental=self.incremental,
+                llm=self.llm,
+                search_cache=self.search_cache,
+            )
+            crew.run()
+
+            result.update(crew.output_files())
+            if result["report_file"]:
+                result["status"] = "completed"
+            else:
+                result["error"] = "Crew finished without a report"
+        except Exception as e:
+            result["error"] = str(e)
+
+        result["duration_seconds"] = round(time.time() - start, 2)
+        return result
+
+    def _tokens_used(self) -> Optional[int]:
+        try:
+            return self.llm.get_token_usage_summary().total_tokens
+        except Exception:
+            return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the news research crew over a file of topics")
+    parser.add_argument("topics_file", help="Text file with one topic per line")
+    parser.add_argument("--concurrency", type=int, default=3, help="Topics researched at the same time")
+    parser.add_argument("--parallel-angles", type=int, default=1, help="Research angles per topic")
+    parser.add_argument("--incremental", action="store_true", help="Only research news since each topic's previous run")
+    parser.add_argument("--provider", choices=["google", "ollama", "mock"], help="LLM provider (defaults to LLM_PROVIDER)")
+    args = parser.parse_args()
+
+    if args.provider:
+        os.environ['LLM_PROVIDER'] = args.provider
+
+    topics = load_topics(args.topics_file)
+    if not topics:
+        parser.error(f"No topics found in {args.topics_file}")
+
+    BatchRunner(
+        topics,
+        concurrency=args.concurrency,
+        parallel_angles=args.parallel_angles,
+        incremental=args.incremental,
+    ).run()
+
+if __name__ == "__main__":
+    main()
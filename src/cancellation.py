@@ -0,0 +1,40 @@
+import threading
+import time
+from typing import Optional
+
+class JobCancelled(Exception):
+    """Raised inside the crew pipeline when its job was cancelled or hit its deadline"""
+
+class CancellationToken:
+    """Cooperative cancellation flag with an optional deadline, checked between agent steps and tool calls"""
+
+    def __init__(self, deadline: Optional[float] = None):
+        self.deadline = deadline  # Unix timestamp
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+
+    @classmethod
+    def with_timeout(cls, minutes: float) -> "CancellationToken":
+        return cls(deadline=time.time() + minutes * 60)
+
+    def cancel(self, reason: str = "Job cancelled by user"):
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if not self._event.is_set() and self.deadline and time.time() >= self.deadline:
+            self.cancel("Job exceeded its deadline")
+        return self._event.is_set()
+
+    def wait(self, seconds: float) -> bool:
+        """Sleep up to `seconds`, returning True early if the token is cancelled"""
+        if self.deadline:
+            seconds = min(seconds, max(0.0, self.deadline - time.time()))
+        self._event.wait(seconds)
+        return self.cancelled
+
+    def raise_if_cancelled(self):
+        if self.cancelled:
+            raise JobCancelled(self.reason)
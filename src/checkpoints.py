@@ -0,0 +1,153 @@
+import json
+import os
+import shutil
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: only runs within one process are serialized
+    fcntl = None
+
+CHECKPOINT_DIR = os.path.join("outputs", "checkpoints")
+LATEST_RUNS_FILE = "latest_runs.json"
+
+# Every run updates the shared latest_runs.json, whichever CheckpointStore it uses
+_latest_runs_lock = threading.Lock()
+
+class CheckpointStore:
+    """Stage-level checkpoints for one crew run, stored under outputs/checkpoints/<run_id>/
+
+    manifest.json records the run parameters and completed stages, each stage's
+    output is kept as <stage>.md and every tool call is appended to tool_results.jsonl.
+    """
+
+    def __init__(self, run_id: str, base_dir: str = CHECKPOINT_DIR):
+        self.run_id = run_id
+        self.path = os.path.join(base_dir, run_id)
+        self._lock = threading.Lock()
+        os.makedirs(self.path, exist_ok=True)
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.path, "manifest.json")
+
+    def manifest(self) -> Dict[str, Any]:
+        return self.load_manifest(self.run_id, os.path.dirname(self.path)) or {
+            "run_id": self.run_id,
+            "stages": {},
+        }
+
+    def save_metadata(self, **fields):
+        """Record run parameters (topic, provider, ...) needed to resume later"""
+        with self._lock:
+            manifest = self.manifest()
+            manifest.update(fields)
+            self._write_manifest(manifest)
+
+    def save_stage(self, stage: str, content: str, **meta):
+        """Persist a completed stage's output"""
+        with self._lock:
+            self._write_file(f"{stage}.md", content)
+
+            manifest = self.manifest()
+            manifest["stages"][stage] = {
+                "completed_at": datetime.now().isoformat(),
+                "file": os.path.join(self.path, f"{stage}.md"),
+                **meta,
+            }
+            self._write_manifest(manifest)
+
+    def load_stage(self, stage: str) -> Optional[str]:
+        """Output of a completed stage, or None if it hasn't completed"""
+        if stage not in self.manifest()["stages"]:
+            return None
+
+        try:
+            with open(os.path.join(self.path, f"{stage}.md"), 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def record_tool_result(self, tool: str, query: str, result: str, articles: Optional[List[Dict]] = None):
+        """Append one tool call (and the raw articles it fetched) to the run log"""
+        entry = {
+            "tool": tool,
+            "query": query,
+            "timestamp": datetime.now().isoformat(),
+            "result": result,
+            "articles": articles or [],
+        }
+        with self._lock:
+            with open(os.path.join(self.path, "tool_results.jsonl"), 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def tool_results(self) -> List[Dict[str, Any]]:
+        try:
+            with open(os.path.join(self.path, "tool_results.jsonl"), 'r', encoding='utf-8') as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def delete(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    @staticmethod
+    def load_manifest(run_id: str, base_dir: str = CHECKPOINT_DIR) -> Optional[Dict[str, Any]]:
+        """Manifest of a previous run, or None if it has no checkpoints"""
+        return _read_json(os.path.join(base_dir, run_id, "manifest.json"))
+
+    def mark_latest_for_topic(self, topic_key: str):
+        """Make this run the one incremental runs of `topic_key` build on"""
+        base_dir = os.path.dirname(self.path)
+        with _locked(os.path.join(base_dir, LATEST_RUNS_FILE)):
+            latest = _read_json(os.path.join(base_dir, LATEST_RUNS_FILE)) or {}
+            latest[topic_key] = self.run_id
+            _write_json_atomic(os.path.join(base_dir, LATEST_RUNS_FILE), latest)
+
+    @staticmethod
+    def latest_run_for_topic(topic_key: str, base_dir: str = CHECKPOINT_DIR) -> Optional[Dict[str, Any]]:
+        """Manifest of the most recent completed run for a normalized topic"""
+        latest = _read_json(os.path.join(base_dir, LATEST_RUNS_FILE)) or {}
+        run_id = latest.get(topic_key)
+        if not run_id:
+            return None
+
+        manifest = CheckpointStore.load_manifest(run_id, base_dir)
+        if not manifest or "report" not in manifest.get("stages", {}):
+            return None
+        return manifest
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        manifest["updated_at"] = datetime.now().isoformat()
+        _write_json_atomic(self.manifest_path, manifest)
+
+    def _write_file(self, name: str, content: str):
+        _write_text_atomic(os.path.join(self.path, name), content)
+
+@contextmanager
+def _locked(path: str) -> Iterator[None]:
+    """Exclusive access to `path` for threads of this process and other processes (worker pools)"""
+    with _latest_runs_lock, open(f"{path}.lock", 'a') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)  # Released when the file closes
+        yield
+
+def _read_json(path: str) -> Optional[Any]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+def _write_json_atomic(path: str, data: Any):
+    _write_text_atomic(path, json.dumps(data, indent=2, ensure_ascii=False))
+
+def _write_text_atomic(path: str, content: str):
+    # Write then rename so a crash never leaves a half-written checkpoint
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp, path)
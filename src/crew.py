@@ -1,180 +1,478 @@
-import os
-import time
-import sys
-from datetime import datetime
-from crewai import Crew, Process
-from .agents import NewsAgents
-from .tasks import NewsTasks
-from .llm_config import LLMConfig
-
-class NewsResearchCrew:
-    """Main crew orchestrator for news research and content creation"""
-    
-    def __init__(self, topic: str, include_trending: bool = False):
-        self.topic = topic
-        self.include_trending = include_trending
-        self.start_time = None
-        self.agents_manager = NewsAgents()
-        self.tasks_manager = NewsTasks()
-        
-        # Ensure outputs directory exists
-        os.makedirs("outputs", exist_ok=True)
-        
-        # Get LLM provider info for logging
-        self.llm_info = LLMConfig.get_provider_info()
-        
-        print(f"🤖 Initializing CrewAI with {self.llm_info.get('name', 'Unknown LLM')}")
-        print(f"📰 Topic: {self.topic}")
-        print(f"⚡ Speed: {self.llm_info.get('speed', 'Unknown')}")
-        print(f"💰 Cost: {self.llm_info.get('cost', 'Unknown')}")
-    
-    def run(self):
-        """Execute the complete news research crew workflow"""
-        
-        self.start_time = time.time()
-        
-        try:
-            print(f"\n🚀 Starting news research crew for: '{self.topic}'")
-            print("=" * 70)
-            
-            # Initialize agents
-            print("👥 Initializing agents...")
-            researcher = self.agents_manager.news_researcher()
-            writer = self.agents_manager.content_writer()
-            
-            # Initialize tasks
-            print("📋 Setting up tasks...")
-            research_task = self.tasks_manager.research_news_task(researcher, self.topic)
-            writing_task = self.tasks_manager.write_news_report_task(writer, self.topic)
-            
-            # Set task dependencies
-            writing_task.context = [research_task]
-            
-            # Task list
-            tasks = [research_task, writing_task]
-            agents = [researcher, writer]
-            
-            # Create crew with correct boolean verbose
-            crew = Crew(
-                agents=agents,
-                tasks=tasks,
-                process=Process.sequential, ## Parallel if parallel execution is needed
-                verbose=True,  # ✅ FIXED: Changed from verbose=2 to verbose=True
-                max_rpm=15,  # Conservative rate limiting
-            )
-            
-            # Execute the crew
-            print(f"⚙️  Executing crew with {len(tasks)} tasks...")
-            print("⏳ This may take 2-5 minutes depending on topic complexity...")
-            print("-" * 70)
-            
-            result = crew.kickoff()
-            
-            # Process completion
-            self._handle_completion(result)
-            
-            return result
-            
-        except KeyboardInterrupt:
-            print("\n❌ Execution interrupted by user")
-            self._cleanup()
-            return None
-            
-        except Exception as e:
-            print(f"\n❌ Error during crew execution: {str(e)}")
-            
-            # Handle specific error types
-            if "rate" in str(e).lower() or "limit" in str(e).lower():
-                print("🔄 Rate limit detected. Implementing retry logic...")
-                return self._handle_rate_limit_retry()
-            elif "api" in str(e).lower() or "key" in str(e).lower():
-                print("🔑 API error detected. Check your API keys and try again.")
-                return None
-            elif "connection" in str(e).lower():
-                print("🌐 Connection error. Check your internet connection.")
-                return None
-            else:
-                print(f"🐛 Unexpected error: {str(e)}")
-                raise e  # Re-raise for debugging
-    
-    def _handle_completion(self, result):
-        """Handle successful crew completion"""
-        end_time = time.time()
-        duration = end_time - self.start_time
-        
-        print("\n" + "=" * 70)
-        print("✅ NEWS RESEARCH CREW COMPLETED SUCCESSFULLY!")
-        print("=" * 70)
-        
-        # Execution summary
-        print(f"⏱️  Execution time: {duration:.1f} seconds ({duration/60:.1f} minutes)")
-        print(f"🤖 LLM used: {self.llm_info.get('name', 'Unknown')}")
-        print(f"📰 Topic researched: {self.topic}")
-        print(f"💰 Cost: {self.llm_info.get('cost', 'Unknown')}")
-        
-        # Output files
-        print("\n📁 Generated files:")
-        timestamp = self.tasks_manager.timestamp
-        topic_clean = self.topic.replace(' ', '_').lower()
-        
-        files = [
-            f"outputs/{topic_clean}_research_{timestamp}.md",
-            f"outputs/{topic_clean}_final_report_{timestamp}.md"
-        ]
-        
-        for file_path in files:
-            if os.path.exists(file_path):
-                size = os.path.getsize(file_path) / 1024  # KB
-                print(f"   📄 {file_path} ({size:.1f} KB)")
-            else:
-                print(f"   ⚠️  {file_path} (not found)")
-        
-        print("\n💡 Tips:")
-        print("   - Review the research file for source material")
-        print("   - The final report is SEO-optimized and ready for publication")
-        print("   - Check outputs/ directory for all generated files")
-        
-        # LLM-specific tips
-        if self.llm_info.get('local'):
-            print("   - Ollama results are completely private and local")
-        else:
-            print("   - Results processed using cloud LLM - review for sensitive content")
-        
-        print("=" * 70)
-    
-    def _handle_rate_limit_retry(self):
-        """Handle rate limit errors with intelligent retry"""
-        provider = os.getenv('LLM_PROVIDER', 'google').lower()
-        
-        if provider == 'groq':
-            delay = 120  # 2 minutes for Groq
-        elif provider == 'google':
-            delay = 60   # 1 minute for Google
-        else:
-            delay = 30   # 30 seconds for others
-        
-        print(f"⏳ Waiting {delay} seconds before retry...")
-        time.sleep(delay)
-        
-        print("🔄 Retrying crew execution...")
-        return self.run()  # Retry once
-    
-    def _cleanup(self):
-        """Cleanup resources on interruption"""
-        if self.start_time:
-            duration = time.time() - self.start_time
-            print(f"\n🧹 Cleanup: Ran for {duration:.1f} seconds before interruption")
-        
-        # Check for partial outputs
-        timestamp = self.tasks_manager.timestamp
-        topic_clean = self.topic.replace(' ', '_').lower()
-        research_file = f"outputs/{topic_clean}_research_{timestamp}.md"
-        
-        if os.path.exists(research_file):
-            print(f"📄 Partial research saved: {research_file}")
-
-# Utility function for quick crew execution
-def run_news_crew(topic: str, include_trending: bool = False):
-    """Quick utility function to run news crew"""
-    crew = NewsResearchCrew(topic, include_trending)
-    return crew.run()
+import contextvars
+import os
+import re
+import time
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+from crewai import Crew, Process
+from .agents import NewsAgents
+from .tasks import NewsTasks, normalize_topic, output_paths, topic_slug
+from .tools import parse_pub_date
+from .llm_config import LLMConfig
+from .progress import ProgressTracker
+from .cancellation import CancellationToken, JobCancelled
+from .checkpoints import CheckpointStore
+from .metrics import JOB_STAGE_SECONDS
+from . import profiling, tracing
+
+class NewsResearchCrew:
+    """Main crew orchestrator for news research and content creation"""
+    
+    def __init__(self, topic: str, include_trending: bool = False, parallel_angles: int = 1,
+                 on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 cancel_token: Optional[CancellationToken] = None,
+                 run_id: Optional[str] = None, incremental: bool = False,
+                 llm=None, search_cache=None, max_articles: Optional[int] = None):
+        self.topic = topic
+        self.topic_key = normalize_topic(topic)
+        self.include_trending = include_trending
+        self.parallel_angles = max(1, parallel_angles)
+        self.max_articles = max_articles
+        self.start_time = None
+        self.rate_limit_retries = 0
+        self.max_rate_limit_retries = int(os.getenv('RATE_LIMIT_MAX_RETRIES', '1'))
+        self.cancel_token = cancel_token or CancellationToken()
+        self.tracker = ProgressTracker(on_event=on_event)
+        self._agent_steps: Dict[Optional[int], tracing.AgentSteps] = {}  # Traced steps per progress slot
+        self.tasks_manager = NewsTasks(run_tag=run_id)
+        
+        # Stage checkpoints let a failed or interrupted run resume where it stopped
+        self.run_id = run_id or f"{topic_slug(topic)}_{self.tasks_manager.run_tag}"
+        self.checkpoints = CheckpointStore(self.run_id)
+        self.files = output_paths(topic, self.tasks_manager.run_tag)
+        
+        # Incremental runs only research news published after the previous run's watermark
+        self.incremental = incremental
+        self.previous_run = self._find_previous_run() if incremental else None
+        self.since = None
+        if self.previous_run:
+            self.since = parse_pub_date(self.previous_run.get("watermark"))
+        
+        self.agents_manager = NewsAgents(
+            tool_event_callback=self._on_tool_event,
+            cancel_token=self.cancel_token,
+            published_after=self.since,
+            max_articles=max_articles,
+            llm=llm,
+            search_cache=search_cache,
+        )
+        self.tracker.token_counter = self.agents_manager.tokens_used
+        
+        # Ensure outputs directory exists
+        os.makedirs("outputs", exist_ok=True)
+        
+        # Get LLM provider info for logging
+        self.llm_info = LLMConfig.get_provider_info()
+        
+        print(f"🤖 Initializing CrewAI with {self.llm_info.get('name', 'Unknown LLM')}")
+        print(f"📰 Topic: {self.topic}")
+        print(f"⚡ Speed: {self.llm_info.get('speed', 'Unknown')}")
+        print(f"💰 Cost: {self.llm_info.get('cost', 'Unknown')}")
+    
+    def run(self):
+        """Execute the complete news research crew workflow"""
+        with tracing.span("NewsResearchCrew.run", attributes={
+            "crew.topic": self.topic,
+            "crew.run_id": self.run_id,
+            "crew.parallel_angles": self.parallel_angles,
+            "crew.incremental": self.incremental,
+        }):
+            return self._run()
+    
+    def _run(self):
+        self.start_time = time.time()
+        
+        try:
+            print(f"\n🚀 Starting news research crew for: '{self.topic}'")
+            print("=" * 70)
+            
+            self.tracker.reset_tasks()
+            self.tracker.stage("Initializing agents and tools...", progress=2.0)
+            
+            self.checkpoints.save_metadata(
+                topic=self.topic,
+                topic_key=self.topic_key,
+                parallel_angles=self.parallel_angles,
+                llm_provider=os.getenv('LLM_PROVIDER', 'google'),
+                incremental=self.incremental,
+                max_articles=self.max_articles,
+                previous_run_id=self.previous_run["run_id"] if self.previous_run else None,
+            )
+            
+            if self.since:
+                print(f"🔄 Incremental update: only news since {self.since.isoformat(sep=' ')}")
+            elif self.incremental:
+                print("🔄 No previous run for this topic - running full research")
+            
+            # Progress slots follow the pipeline order
+            angles = self.tasks_manager.split_topic(self.topic, self.parallel_angles)
+            if self.parallel_angles > 1:
+                research_slots = [self.tracker.add_task(f"Researching {angle}") for angle in angles]
+            else:
+                research_slots = [self.tracker.add_task("Researching news articles")]
+            writer_slot = self.tracker.add_task("Writing final report", 2)
+            
+            report = self.checkpoints.load_stage("report")
+            if report is not None:
+                print("♻️  Final report already checkpointed - nothing to rerun")
+                self._handle_completion(report)
+                return report
+            
+            # Stage 1: research (skipped when a previous attempt checkpointed it)
+            research = self.checkpoints.load_stage("research")
+            if research is None:
+                with self._stage("research"):
+                    if self.parallel_angles > 1:
+                        research = self._run_parallel_research(angles, research_slots)
+                    else:
+                        research = self._run_research(research_slots[0])
+                self.checkpoints.save_stage("research", research)
+            else:
+                print("♻️  Resuming from research checkpoint")
+                self._write_research_file(research)
+                for slot in research_slots:
+                    self.tracker.skip_task(slot)
+                self.tracker.stage("Resuming from research checkpoint...")
+            
+            self.cancel_token.raise_if_cancelled()
+            
+            # Stage 2: final report
+            with self._stage("writer"):
+                result = self._run_writer(research, writer_slot)
+            self.checkpoints.save_stage("report", str(result))
+            self._record_watermark()
+            
+            # Process completion
+            self._handle_completion(result)
+            
+            return result
+            
+        except KeyboardInterrupt:
+            print("\n❌ Execution interrupted by user")
+            self._cleanup()
+            return None
+            
+        except JobCancelled as e:
+            print(f"\n🛑 Execution cancelled: {str(e)}")
+            self._cleanup()
+            raise
+            
+        except Exception as e:
+            print(f"\n❌ Error during crew execution: {str(e)}")
+            
+            # Handle specific error types
+            if "rate" in str(e).lower() or "limit" in str(e).lower():
+                print("🔄 Rate limit detected. Implementing retry logic...")
+                return self._handle_rate_limit_retry(e)
+            elif "api" in str(e).lower() or "key" in str(e).lower():
+                print("🔑 API error detected. Check your API keys and try again.")
+                return None
+            elif "connection" in str(e).lower():
+                print("🌐 Connection error. Check your internet connection.")
+                return None
+            else:
+                print(f"🐛 Unexpected error: {str(e)}")
+                raise e  # Re-raise for debugging
+    
+    def _run_research(self, slot: int) -> str:
+        """Research stage with a single researcher"""
+        print("👥 Initializing research agent...")
+        researcher = self.agents_manager.news_researcher()
+        research_task = self.tasks_manager.research_news_task(researcher, self.topic, since=self._since_text())
+        
+        # Create crew with correct boolean verbose
+        crew = Crew(
+            agents=[researcher],
+            tasks=[research_task],
+            process=Process.sequential,
+            verbose=True,  # ✅ FIXED: Changed from verbose=2 to verbose=True
+            max_rpm=15,  # Conservative rate limiting
+            step_callback=self._step_callback(slot),
+            task_callback=self._task_callback(slot),
+        )
+        
+        print("⏳ This may take 2-5 minutes depending on topic complexity...")
+        print("-" * 70)
+        
+        self.tracker.stage("Researching news articles...", progress=self.tracker.START_PROGRESS)
+        self.cancel_token.raise_if_cancelled()
+        
+        result = crew.kickoff()
+        return str(result) if result else ""
+    
+    def _run_parallel_research(self, angles: List[str], slots: List[int]) -> str:
+        """Research stage with one crew per sub-angle, merged into one document"""
+        print(f"🔀 Researching {len(angles)} angles in parallel:")
+        for angle in angles:
+            print(f"   • {angle}")
+        
+        # Split the rate limit budget across the parallel crews
+        max_rpm = max(1, 15 // len(angles))
+        
+        self.tracker.stage(f"Researching {len(angles)} angles in parallel...", progress=self.tracker.START_PROGRESS)
+        
+        # Each angle runs in a copy of this thread's context so its spans nest under the stage
+        with ThreadPoolExecutor(max_workers=len(angles)) as executor:
+            futures = [
+                executor.submit(contextvars.copy_context().run, self._research_angle, index, angle, max_rpm, slot)
+                for index, (angle, slot) in enumerate(zip(angles, slots))
+            ]
+            findings = [future.result() for future in futures]
+        
+        merged = merge_research_findings(self.topic, angles, findings)
+        self._write_research_file(merged)
+        
+        return merged
+    
+    def _research_angle(self, index: int, angle: str, max_rpm: int, slot: int) -> str:
+        """Run a single-researcher crew for one angle and return its findings"""
+        stage = f"research_angle_{index}"
+        findings = self.checkpoints.load_stage(stage)
+        if findings is not None:
+            self.tracker.skip_task(slot)
+            return findings
+        
+        self.cancel_token.raise_if_cancelled()
+        with profiling.profile_thread(), self._stage("research_angle", angle=angle):
+            researcher = self.agents_manager.news_researcher()
+            task = self.tasks_manager.research_angle_task(researcher, self.topic, angle, since=self._since_text())
+            
+            crew = Crew(
+                agents=[researcher],
+                tasks=[task],
+                process=Process.sequential,
+                verbose=True,
+                max_rpm=max_rpm,
+                step_callback=self._step_callback(slot),
+                task_callback=self._task_callback(slot),
+            )
+            
+            result = crew.kickoff()
+        findings = str(result) if result else ""
+        self.checkpoints.save_stage(stage, findings, angle=angle)
+        return findings
+    
+    def _run_writer(self, research: str, slot: int):
+        """Report stage: write the final report from the research findings"""
+        print("✍️  Writing final report...")
+        self.tracker.stage("Writing final report...")
+        writer = self.agents_manager.content_writer()
+        previous_report = None
+        if self.previous_run:
+            previous_report = CheckpointStore(self.previous_run["run_id"]).load_stage("report")
+        
+        writing_task = self.tasks_manager.write_news_report_task(
+            writer, self.topic, research_context=research,
+            previous_report=previous_report, since=self._since_text(),
+        )
+        
+        crew = Crew(
+            agents=[writer],
+            tasks=[writing_task],
+            process=Process.sequential,
+            verbose=True,
+            max_rpm=15,
+            step_callback=self._step_callback(slot),
+            task_callback=self._task_callback(slot),
+        )
+        
+        return crew.kickoff()
+    
+    def _find_previous_run(self) -> Optional[Dict[str, Any]]:
+        """Run an incremental update builds on (pinned in the manifest so resumes stay consistent)"""
+        pinned = self.checkpoints.manifest().get("previous_run_id")
+        if pinned:
+            return CheckpointStore.load_manifest(pinned)
+        
+        previous = CheckpointStore.latest_run_for_topic(self.topic_key)
+        if previous and previous.get("run_id") != self.run_id:
+            return previous
+        return None
+    
+    def _since_text(self) -> Optional[str]:
+        return f"{self.since.isoformat(sep=' ')} UTC" if self.since else None
+    
+    def _record_watermark(self):
+        """Store the newest article date seen so the next incremental run starts there"""
+        dates = [
+            parse_pub_date(article.get('pubDate'))
+            for entry in self.checkpoints.tool_results()
+            for article in entry["articles"]
+        ]
+        dates = [d for d in dates if d]
+        if self.since:
+            dates.append(self.since)
+        
+        watermark = max(dates) if dates else datetime.now(timezone.utc).replace(tzinfo=None)
+        
+        self.checkpoints.save_metadata(watermark=watermark.isoformat(sep=' '))
+        self.checkpoints.mark_latest_for_topic(self.topic_key)
+    
+    def _write_research_file(self, research: str):
+        """Write research produced outside a crew task to this run's research file"""
+        with open(self.files["research_file"], 'w', encoding='utf-8') as f:
+            f.write(research)
+    
+    def output_files(self) -> Dict[str, Optional[str]]:
+        """Paths of the files this run has written so far (None for those it hasn't)"""
+        return {name: path if os.path.exists(path) else None for name, path in self.files.items()}
+    
+    def _on_tool_event(self, event_type: str, tool: str, **data):
+        """Checkpoint tool results, then forward a slim event to the tracker"""
+        result = data.pop("result", None)
+        articles = data.pop("articles", None)
+        if event_type == "tool_finished" and result is not None:
+            self.checkpoints.record_tool_result(tool, data.get("query", ""), result, articles)
+        self.tracker.tool_event(event_type, tool, **data)
+    
+    @contextmanager
+    def _stage(self, stage: str, **attributes):
+        """Time a pipeline stage and trace it (crews built inside nest their spans under it)"""
+        with JOB_STAGE_SECONDS.time(stage=stage), tracing.span(f"crew.{stage}", attributes={
+            f"crew.{name}": value for name, value in attributes.items()
+        }):
+            yield
+    
+    def _step_callback(self, slot: Optional[int] = None) -> Callable:
+        """Progress step callback that also stops the crew once the job is cancelled"""
+        on_step = self.tracker.step_callback(slot)
+        task = self.tracker.tasks[slot]["name"] if slot is not None else None
+        steps = self._agent_steps[slot] = tracing.AgentSteps({"agent.task": task})
+        
+        def _callback(step):
+            steps.step(step)
+            on_step(step)
+            self.cancel_token.raise_if_cancelled()
+        
+        return _callback
+    
+    def _task_callback(self, slot: Optional[int] = None) -> Callable:
+        """Progress task callback that also stops the crew once the job is cancelled"""
+        on_task = self.tracker.task_callback(slot)
+        
+        def _callback(output):
+            steps = self._agent_steps.pop(slot, None)
+            if steps:
+                steps.close()
+            on_task(output)
+            self.cancel_token.raise_if_cancelled()
+        
+        return _callback
+    
+    def _handle_completion(self, result):
+        """Handle successful crew completion"""
+        end_time = time.time()
+        duration = end_time - self.start_time
+        
+        print("\n" + "=" * 70)
+        print("✅ NEWS RESEARCH CREW COMPLETED SUCCESSFULLY!")
+        print("=" * 70)
+        
+        # Execution summary
+        print(f"⏱️  Execution time: {duration:.1f} seconds ({duration/60:.1f} minutes)")
+        print(f"🤖 LLM used: {self.llm_info.get('name', 'Unknown')}")
+        print(f"📰 Topic researched: {self.topic}")
+        print(f"💰 Cost: {self.llm_info.get('cost', 'Unknown')}")
+        
+        # Output files
+        print("\n📁 Generated files:")
+        for file_path in self.files.values():
+            if os.path.exists(file_path):
+                size = os.path.getsize(file_path) / 1024  # KB
+                print(f"   📄 {file_path} ({size:.1f} KB)")
+            else:
+                print(f"   ⚠️  {file_path} (not found)")
+        
+        print("\n💡 Tips:")
+        print("   - Review the research file for source material")
+        print("   - The final report is SEO-optimized and ready for publication")
+        print("   - Check outputs/ directory for all generated files")
+        
+        # LLM-specific tips
+        if self.llm_info.get('local'):
+            print("   - Ollama results are completely private and local")
+        else:
+            print("   - Results processed using cloud LLM - review for sensitive content")
+        
+        print("=" * 70)
+    
+    def _handle_rate_limit_retry(self, error: Exception):
+        """Handle rate limit errors with intelligent retry (at most max_rate_limit_retries times)"""
+        if self.rate_limit_retries >= self.max_rate_limit_retries:
+            print(f"❌ Still rate limited after {self.rate_limit_retries} retries - giving up")
+            raise error
+        self.cancel_token.raise_if_cancelled()
+        self.rate_limit_retries += 1
+        
+        provider = os.getenv('LLM_PROVIDER', 'google').lower()
+        
+        if provider == 'groq':
+            delay = 120  # 2 minutes for Groq
+        elif provider == 'google':
+            delay = 60   # 1 minute for Google
+        else:
+            delay = 30   # 30 seconds for others
+        
+        print(f"⏳ Waiting {delay} seconds before retry...")
+        if self.cancel_token.wait(delay):
+            raise JobCancelled(self.cancel_token.reason)
+        
+        print(f"🔄 Retrying crew execution ({self.rate_limit_retries}/{self.max_rate_limit_retries})...")
+        return self.run()
+    
+    def _cleanup(self):
+        """Cleanup resources on interruption"""
+        if self.start_time:
+            duration = time.time() - self.start_time
+            print(f"\n🧹 Cleanup: Ran for {duration:.1f} seconds before interruption")
+        
+        # Check for partial outputs
+        research_file = self.files["research_file"]
+        if os.path.exists(research_file):
+            print(f"📄 Partial research saved: {research_file}")
+        
+        print(f"💾 Checkpoints saved: {self.checkpoints.path} (resume with run_id='{self.run_id}')")
+
+def _dedup_key(line: str):
+    """Normalize a line for duplicate detection (None for lines too short to compare)"""
+    words = re.findall(r"[a-z0-9]+", line.lower())
+    if len(words) < 5:
+        return None
+    return " ".join(words)
+
+def merge_research_findings(topic: str, angles: List[str], findings: List[str]) -> str:
+    """Merge per-angle findings into one research document, dropping duplicate lines"""
+    seen = set()
+    sections = []
+    
+    for angle, text in zip(angles, findings):
+        kept = []
+        for line in (text or "").splitlines():
+            key = _dedup_key(line)
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            kept.append(line)
+        
+        body = "\n".join(kept).strip() or "_No findings for this angle._"
+        sections.append(f"## 🔎 {angle}\n\n{body}")
+    
+    header = (
+        f"# 📊 MERGED NEWS RESEARCH REPORT\n"
+        f"## {topic.upper()}\n\n"
+        f"**🔀 Angles researched:** {len(angles)}\n\n---\n\n"
+    )
+    return header + "\n\n---\n\n".join(sections) + "\n"
+
+# Utility function for quick crew execution
+def run_news_crew(topic: str, include_trending: bool = False, parallel_angles: int = 1,
+                  on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+                  run_id: Optional[str] = None, incremental: bool = False):
+    """Quick utility function to run news crew (pass a previous run_id to resume it)"""
+    crew = NewsResearchCrew(topic, include_trending, parallel_angles, on_event,
+                            run_id=run_id, incremental=incremental)
+    return crew.run()
@@ -0,0 +1,263 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Bucket upper bounds in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LLM_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0, 120.0)
+JOB_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 900.0, 1800.0)
+
+LabelValues = Tuple[str, ...]
+
+class _Metric:
+    """Labelled samples of one metric; `function` computes them at scrape time instead"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (),
+                 function: Optional[Callable[[], Dict[LabelValues, float]]] = None):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self.function = function
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(label, "")) for label in self.labels)
+
+    def samples(self) -> List[Tuple[str, LabelValues, float]]:
+        values = self.function() if self.function else self._values
+        with self._lock:
+            return [("", key, value) for key, value in list(values.items())]
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def take(self) -> Dict[LabelValues, float]:
+        """Counts recorded since the last take(), resetting them"""
+        with self._lock:
+            values, self._values = self._values, {}
+        return values
+
+    def merge(self, values: Dict[LabelValues, float]):
+        with self._lock:
+            for key, amount in values.items():
+                self._values[key] = self._values.get(key, 0.0) + amount
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (+Inf last), sum]
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def take(self) -> Dict[LabelValues, Tuple[List[int], List[float]]]:
+        """Observations recorded since the last take(), resetting them"""
+        with self._lock:
+            series, self._series = self._series, {}
+        return series
+
+    def merge(self, series: Dict[LabelValues, Tuple[List[int], List[float]]]):
+        with self._lock:
+            for key, (counts, total) in series.items():
+                mine = self._series.get(key)
+                if mine is None:
+                    mine = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+                for index, count in enumerate(counts):
+                    mine[0][index] += count
+                mine[1][0] += total[0]
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def samples(self) -> List[Tuple[str, LabelValues, float]]:
+        with self._lock:
+            series = [(key, list(counts), total[0]) for key, (counts, total) in self._series.items()]
+
+        samples = []
+        for key, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                samples.append(("_bucket", key + (_format_value(bound),), cumulative))
+            samples.append(("_sum", key, total))
+            samples.append(("_count", key, cumulative))
+        return samples
+
+class MetricsRegistry:
+    """Process-wide metrics rendered in the Prometheus text format
+
+    Recording a sample is a dict update under a per-metric lock, cheap enough for
+    the request and crew hot paths. Metrics are per process: each API process and
+    standalone worker exposes its own. Worker processes of the process backend hand
+    what they record to the API process with take() and merge().
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing  # Modules re-imported in worker processes get the same metric
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = (), function=None) -> Counter:
+        return self._register(Counter(name, help_text, labels, function))
+
+    def gauge(self, name: str, help_text: str, labels: Sequence[str] = (), function=None) -> Gauge:
+        return self._register(Gauge(name, help_text, labels, function))
+
+    def histogram(self, name: str, help_text: str, labels: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, labels, buckets))
+
+    def take(self) -> Dict[str, Dict]:
+        """Counter and histogram values recorded since the last take() by metric name, reset
+
+        Gauges and function metrics describe the process itself and are left out.
+        """
+        with self._lock:
+            metrics = [m for m in self._metrics.values() if isinstance(m, (Counter, Histogram)) and not m.function]
+        values = {metric.name: metric.take() for metric in metrics}
+        return {name: value for name, value in values.items() if value}
+
+    def merge(self, values: Dict[str, Dict]):
+        """Add values taken from another process's registry (metrics unknown here are dropped)"""
+        for name, value in values.items():
+            with self._lock:
+                metric = self._metrics.get(name)
+            if isinstance(metric, (Counter, Histogram)):
+                metric.merge(value)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            try:
+                samples = metric.samples()
+            except Exception as e:
+                print(f"⚠️  Metric {metric.name} failed: {str(e)}")
+                continue
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            names = metric.labels + ("le",) if metric.kind == "histogram" else metric.labels
+            for suffix, key, value in samples:
+                labels = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, key))
+                lines.append(f"{metric.name}{suffix}{{{labels}}} {_format_value(value)}" if labels
+                             else f"{metric.name}{suffix} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+REGISTRY = MetricsRegistry()
+
+# ===== CREW METRICS =====
+JOB_STAGE_SECONDS = REGISTRY.histogram(
+    "news_job_stage_duration_seconds", "Time spent in each crew stage", ["stage"], JOB_BUCKETS)
+LLM_CALL_SECONDS = REGISTRY.histogram(
+    "news_llm_call_duration_seconds", "LLM call latency", ["provider"], LLM_BUCKETS)
+LLM_CALL_ERRORS = REGISTRY.counter(
+    "news_llm_call_errors_total", "LLM calls that failed", ["provider"])
+LLM_TOKENS = REGISTRY.counter(
+    "news_llm_tokens_total", "Tokens used by LLM calls", ["provider", "kind"])
+NEWSDATA_SECONDS = REGISTRY.histogram(
+    "news_newsdata_request_duration_seconds", "NewsData.io request latency", ["outcome"])
+NEWSDATA_ERRORS = REGISTRY.counter(
+    "news_newsdata_errors_total", "NewsData.io requests that failed", ["reason"])
+SEARCH_CACHE_LOOKUPS = REGISTRY.counter(
+    "news_search_cache_lookups_total", "NewsData search cache lookups", ["result"])
+
+_llm_metrics_lock = threading.Lock()
+_llm_metrics_installed = False
+_llm_call_starts: Dict[str, float] = {}
+
+def llm_provider_name(llm) -> str:
+    """Provider label for an LLM ("gemini", "ollama", "mock", ...)"""
+    provider = getattr(llm, "provider", None)
+    if provider:
+        return str(provider)
+    return str(getattr(llm, "model", "") or "unknown").split("/")[0]
+
+def install_llm_metrics():
+    """Record LLM latency, errors and tokens from CrewAI's LLM call events (idempotent)"""
+    global _llm_metrics_installed
+    with _llm_metrics_lock:
+        if _llm_metrics_installed:
+            return
+        _llm_metrics_installed = True
+
+    from crewai.events import crewai_event_bus
+    from crewai.events.types.llm_events import LLMCallCompletedEvent, LLMCallFailedEvent, LLMCallStartedEvent
+
+    @crewai_event_bus.on(LLMCallStartedEvent)
+    def _on_started(source, event):
+        with _llm_metrics_lock:
+            if len(_llm_call_starts) > 10_000:
+                _llm_call_starts.clear()  # Calls that never finished
+            _llm_call_starts[event.call_id] = event.timestamp.timestamp()
+
+    def _duration(event) -> Optional[float]:
+        with _llm_metrics_lock:
+            started = _llm_call_starts.pop(event.call_id, None)
+        return None if started is None else max(0.0, event.timestamp.timestamp() - started)
+
+    @crewai_event_bus.on(LLMCallCompletedEvent)
+    def _on_completed(source, event):
+        provider = llm_provider_name(source)
+        duration = _duration(event)
+        if duration is not None:
+            LLM_CALL_SECONDS.observe(duration, provider=provider)
+        usage = event.usage or {}
+        for kind in ("prompt_tokens", "completion_tokens"):
+            if usage.get(kind):
+                LLM_TOKENS.inc(usage[kind], provider=provider, kind=kind.split("_")[0])
+
+    @crewai_event_bus.on(LLMCallFailedEvent)
+    def _on_failed(source, event):
+        _duration(event)
+        LLM_CALL_ERRORS.inc(provider=llm_provider_name(source))
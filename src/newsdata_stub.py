@@ -0,0 +1,152 @@
+import argparse
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .tasks import normalize_topic
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "newsdata")
+
+class NewsDataStub:
+    """Serves recorded NewsData.io responses from fixtures/newsdata/
+
+    A query is answered with the fixture whose file name words all appear in it
+    (artificial_intelligence.json matches "latest artificial intelligence news"),
+    falling back to default.json. Latency, jitter and an error rate can be injected.
+    Like the real API, a fixture's results are split into pages of at most `page_size`
+    articles, linked by `nextPage` tokens that a request passes back as `page`.
+    """
+
+    def __init__(self, fixture_dir: str = FIXTURE_DIR, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, fresh_dates: bool = False, page_size: int = 10):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.fresh_dates = fresh_dates
+        self.page_size = page_size
+        self.requests = 0
+        self._lock = threading.Lock()  # Requests are served on concurrent threads
+        self.fixtures = self._load_fixtures(fixture_dir)
+        if "default" not in self.fixtures:
+            raise ValueError(f"No default.json fixture in {fixture_dir}")
+
+    @staticmethod
+    def _load_fixtures(fixture_dir: str) -> Dict[str, Dict[str, Any]]:
+        fixtures = {}
+        for name in sorted(os.listdir(fixture_dir)):
+            if name.endswith(".json"):
+                with open(os.path.join(fixture_dir, name), 'r', encoding='utf-8') as f:
+                    fixtures[name[:-5]] = json.load(f)
+        return fixtures
+
+    def respond(self, query: str, size: int, page: Optional[str] = None) -> Tuple[int, Dict[str, Any]]:
+        """Status code and JSON body for a /news request (`page` is a previous response's nextPage)"""
+        with self._lock:
+            self.requests += 1
+
+        delay = self.latency + random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        if self.error_rate and random.random() < self.error_rate:
+            return 500, {"status": "error", "results": {"message": "Injected stub failure"}}
+
+        try:
+            start = int(page) if page else 0
+        except ValueError:
+            return 422, {"status": "error", "results": {"message": "Invalid page token"}}
+
+        data = dict(self.fixtures[self._match(query)])
+        articles = data.get("results", [])
+        end = start + min(size, self.page_size)
+        results = [dict(article) for article in articles[start:end]]
+
+        if self.fresh_dates:
+            # Re-date articles relative to now so incremental runs always see new items
+            now = datetime.utcnow()
+            for i, article in enumerate(results, start):
+                article["pubDate"] = (now - timedelta(hours=i * 3)).strftime("%Y-%m-%d %H:%M:%S")
+
+        data["results"] = results
+        data["totalResults"] = len(articles)
+        data["nextPage"] = str(end) if end < len(articles) else None
+        return 200, data
+
+    def _match(self, query: str) -> str:
+        words = set(normalize_topic(query).split())
+        for name in self.fixtures:
+            if name != "default" and set(name.split("_")) <= words:
+                return name
+        return "default"
+
+def _make_handler(stub: NewsDataStub):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if not url.path.rstrip("/").endswith("/news"):
+                self._send(404, {"status": "error", "results": {"message": "Not found"}})
+                return
+
+            params = parse_qs(url.query)
+            if not params.get("apikey"):
+                self._send(401, {"status": "error", "results": {"message": "API key missing"}})
+                return
+
+            try:
+                size = int(params.get("size", ["10"])[0])
+            except ValueError:
+                size = 10
+            self._send(*stub.respond(params.get("q", [""])[0], size, params.get("page", [None])[0]))
+
+        def _send(self, status: int, body: Dict[str, Any]):
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass  # Keep benchmark output readable
+
+    return Handler
+
+def start_stub_server(host: str = "127.0.0.1", port: int = 0, stub: Optional[NewsDataStub] = None) -> ThreadingHTTPServer:
+    """Start the stub on a background thread; its base URL is server.base_url"""
+    stub = stub or NewsDataStub()
+    server = ThreadingHTTPServer((host, port), _make_handler(stub))
+    server.daemon_threads = True
+    server.stub = stub
+    server.base_url = f"http://{host}:{server.server_address[1]}/api/1"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline NewsData.io-compatible stub server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", default=FIXTURE_DIR, help="Directory of recorded responses")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random +/- seconds around the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 500")
+    parser.add_argument("--fresh-dates", action="store_true", help="Re-date articles relative to now")
+    parser.add_argument("--page-size", type=int, default=10, help="Most articles per response page")
+    args = parser.parse_args()
+
+    stub = NewsDataStub(args.fixtures, args.latency, args.jitter, args.error_rate, args.fresh_dates, args.page_size)
+    server = ThreadingHTTPServer((args.host, args.port), _make_handler(stub))
+    print(f"📰 NewsData stub serving {len(stub.fixtures)} fixtures on http://{args.host}:{args.port}/api/1")
+    print(f"   export NEWSDATA_BASE_URL=http://{args.host}:{args.port}/api/1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stub server stopped")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import shutil
+import site
+import sys
+import sysconfig
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+PROFILE_DIR = os.path.join("outputs", "profiles")
+
+# Downloadable files of a profile: name -> (file name, media type)
+PROFILE_FILES = {
+    "cpu": ("cpu.pstats", "application/octet-stream"),
+    "cpu_text": ("cpu.txt", "text/plain"),
+    "flame": ("wall.collapsed", "text/plain"),
+    "summary": ("summary.json", "application/json"),
+}
+
+_session: ContextVar[Optional["ProfileSession"]] = ContextVar("profile_session", default=None)
+
+def profile_dir(job_id: str) -> str:
+    return os.path.join(os.getenv("PROFILE_DIR", PROFILE_DIR), job_id)
+
+def profile_path(job_id: str, name: str) -> Optional[str]:
+    """Path of a profile file of a job, None if it wasn't written"""
+    path = os.path.join(profile_dir(job_id), PROFILE_FILES[name][0])
+    return path if os.path.exists(path) else None
+
+def load_summary(job_id: str) -> Optional[Dict[str, Any]]:
+    path = profile_path(job_id, "summary")
+    if path is None:
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def delete_profile(job_id: str):
+    shutil.rmtree(profile_dir(job_id), ignore_errors=True)
+
+class ProfileSession:
+    """CPU profile and wall-clock stack samples of one crew run
+
+    Each thread working for the run is profiled with cProfile (profiles are per thread)
+    and its stack is sampled every `interval` seconds, including time spent waiting on
+    LLMs and NewsData. Samples are saved as collapsed stacks ("a;b;c <count>"), the
+    input of flamegraph.pl and speedscope.
+    """
+
+    def __init__(self, directory: str, interval: float = 0.01):
+        self.directory = directory
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+        self._profiles: List[cProfile.Profile] = []
+        self._threads: Dict[int, str] = {}
+        self._labels: Dict[Any, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler = threading.Thread(target=self._sample_loop, name="profile-sampler", daemon=True)
+        self._started = None
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._sampler.start()
+
+    def stop(self):
+        self._stop.set()
+        self._sampler.join()
+
+    @contextmanager
+    def thread(self) -> Iterator[None]:
+        """Profile the calling thread for the duration of the block"""
+        profile = cProfile.Profile(time.thread_time)  # CPU time: waiting on I/O is for the flame data
+        ident = threading.get_ident()
+        with self._lock:
+            self._threads[ident] = threading.current_thread().name
+        try:
+            profile.enable()
+        except ValueError as e:
+            # Pythons with a single process-wide profiler can't profile two threads at once
+            print(f"⚠️  CPU profiling unavailable for thread {threading.current_thread().name}: {str(e)}")
+            profile = None
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            with self._lock:
+                self._threads.pop(ident, None)
+                if profile is not None:
+                    self._profiles.append(profile)
+
+    def _sample_loop(self):
+        while not self._stop.wait(self.interval):
+            frames = sys._current_frames()
+            with self._lock:
+                threads = list(self._threads)
+            for ident in threads:
+                frame = frames.get(ident)
+                if frame is not None:
+                    self.samples[self._collapse(frame)] += 1
+                    self.sample_count += 1
+
+    def _collapse(self, frame) -> str:
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = self._labels[code] = f"{code.co_qualname} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+            labels.append(label)
+            frame = frame.f_back
+        return ";".join(reversed(labels))
+
+    def save(self) -> Dict[str, Any]:
+        """Write the profile files and return the summary"""
+        os.makedirs(self.directory, exist_ok=True)
+        duration = time.perf_counter() - self._started
+
+        stats = None
+        for profile in self._profiles:
+            if stats is None:
+                stats = pstats.Stats(profile)
+            else:
+                stats.add(profile)
+
+        summary = {
+            "duration_seconds": round(duration, 3),
+            "cpu_seconds": round(stats.total_tt, 3) if stats else 0.0,
+            "threads": len(self._profiles),
+            "sample_interval_ms": self.interval * 1000,
+            "samples": self.sample_count,
+            "top_cpu": _top_cpu(stats) if stats else [],
+            "top_wall": self._top_wall(),
+        }
+
+        if stats:
+            stats.dump_stats(os.path.join(self.directory, PROFILE_FILES["cpu"][0]))
+            text = io.StringIO()
+            stats.stream = text
+            stats.sort_stats("cumulative").print_stats(60)
+            stats.sort_stats("tottime").print_stats(60)
+            with open(os.path.join(self.directory, PROFILE_FILES["cpu_text"][0]), "w", encoding="utf-8") as f:
+                f.write(text.getvalue())
+        with open(os.path.join(self.directory, PROFILE_FILES["flame"][0]), "w", encoding="utf-8") as f:
+            f.writelines(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+        with open(os.path.join(self.directory, PROFILE_FILES["summary"][0]), "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        return summary
+
+    def _top_wall(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Functions the sampled threads were in most often (innermost frame)"""
+        leaves: Counter = Counter()
+        for stack, count in self.samples.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        total = sum(leaves.values()) or 1
+        return [
+            {"function": function, "samples": count, "share": round(count / total, 4)}
+            for function, count in leaves.most_common(limit)
+        ]
+
+def _top_cpu(stats: pstats.Stats, limit: int = 20) -> List[Dict[str, Any]]:
+    """Functions with the most CPU time of their own"""
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+    return [
+        {
+            "function": f"{name} ({_short_path(file)}:{line})",
+            "calls": calls,
+            "self_seconds": round(self_time, 4),
+            "cumulative_seconds": round(cumulative, 4),
+        }
+        for (file, line, name), (_, calls, self_time, cumulative, _) in rows
+    ]
+
+_LIBRARY_DIRS = sorted(
+    {p for p in site.getsitepackages() + [site.getusersitepackages(), sysconfig.get_paths()["stdlib"]] if p},
+    key=len, reverse=True,
+)
+
+def _short_path(path: str) -> str:
+    """File path relative to site-packages, the standard library or the working directory"""
+    for prefix in _LIBRARY_DIRS + [os.getcwd()]:
+        if path.startswith(prefix + os.sep):
+            return path[len(prefix) + 1:]
+    return path
+
+@contextmanager
+def profile(job_id: Optional[str]) -> Iterator[Optional[ProfileSession]]:
+    """Profile the block into profile_dir(job_id); does nothing when job_id is None
+
+    Threads the block hands work to join the profile through profile_thread().
+    """
+    if job_id is None:
+        yield None
+        return
+
+    session = ProfileSession(
+        profile_dir(job_id), interval=float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "10")) / 1000,
+    )
+    token = _session.set(session)
+    session.start()
+    try:
+        with session.thread():
+            yield session
+    finally:
+        session.stop()
+        _session.reset(token)
+        try:
+            summary = session.save()
+            print(f"🔬 Profile saved to {session.directory} ({summary['cpu_seconds']}s CPU of {summary['duration_seconds']}s)")
+        except Exception as e:
+            print(f"⚠️  Could not save profile: {str(e)}")
+
+@contextmanager
+def profile_thread() -> Iterator[None]:
+    """Add the calling thread to the profile of the run it works for, if that run is profiled
+
+    The session is found through the context, so call this in threads started with a
+    copy of the profiled thread's context.
+    """
+    session = _session.get()
+    if session is None:
+        yield
+        return
+    with session.thread():
+        yield
@@ -0,0 +1,140 @@
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+class ProgressTracker:
+    """Turns CrewAI step/task callbacks and tool calls into structured progress events"""
+
+    # Progress range covered by task execution (setup and wrap-up take the rest)
+    START_PROGRESS = 5.0
+    END_PROGRESS = 95.0
+    # Characters of each task's output included in its task_completed event
+    preview_chars = 500
+
+    def __init__(self, on_event: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 token_counter: Optional[Callable[[], int]] = None):
+        self.on_event = on_event
+        self.token_counter = token_counter
+        self.tasks: List[Dict[str, Any]] = []
+        self.progress = 0.0
+        self._lock = threading.Lock()
+
+    def reset_tasks(self):
+        """Forget registered tasks (progress never moves backwards)"""
+        with self._lock:
+            self.tasks = []
+
+    def add_task(self, name: str, max_iter: int = 3) -> int:
+        """Register a task in the pipeline and return its slot index"""
+        with self._lock:
+            self.tasks.append({"name": name, "max_iter": max_iter, "iterations": 0, "done": False})
+            return len(self.tasks) - 1
+
+    def emit(self, event_type: str, message: str, **data) -> Dict[str, Any]:
+        """Build an event with the current pipeline position and forward it"""
+        event = {
+            "type": event_type,
+            "message": message,
+            "progress": round(self.progress, 1),
+            "tokens": self._tokens_used(),
+            "timestamp": datetime.now().isoformat(),
+            "data": data,
+        }
+
+        if self.on_event:
+            try:
+                self.on_event(event)
+            except Exception as e:
+                print(f"⚠️  Progress callback failed: {str(e)}")
+
+        return event
+
+    def stage(self, message: str, progress: Optional[float] = None) -> Dict[str, Any]:
+        """Report a pipeline stage change, optionally moving progress forward"""
+        if progress is not None:
+            with self._lock:
+                self.progress = max(self.progress, progress)
+        return self.emit("stage_started", message)
+
+    def step_callback(self, slot: Optional[int] = None) -> Callable:
+        """CrewAI step_callback; without a slot, steps count against the current task"""
+        def _on_step(step):
+            with self._lock:
+                index = self._current_slot() if slot is None else slot
+                if index is None:
+                    return
+                task = self.tasks[index]
+                task["iterations"] += 1
+                iteration = task["iterations"]
+                self._recompute()
+
+            tool = getattr(step, "tool", None)
+            if tool:
+                message = f"{task['name']}: used {tool} (iteration {iteration})"
+            else:
+                message = f"{task['name']}: reasoning (iteration {iteration})"
+
+            self.emit("llm_iteration", message, task=task["name"], iteration=iteration, tool=tool)
+
+        return _on_step
+
+    def task_callback(self, slot: Optional[int] = None) -> Callable:
+        """CrewAI task_callback marking a task as completed"""
+        def _on_task(output):
+            with self._lock:
+                index = self._current_slot() if slot is None else slot
+                if index is None:
+                    return
+                task = self.tasks[index]
+                task["done"] = True
+                self._recompute()
+
+            raw = str(getattr(output, "raw", output) or "")
+            # A preview lets live clients show the writer's draft before the job finishes
+            self.emit("task_completed", f"Completed: {task['name']}", task=task["name"], output_chars=len(raw),
+                      preview=raw[:self.preview_chars])
+
+        return _on_task
+
+    def skip_task(self, slot: int):
+        """Mark a task restored from a checkpoint as completed"""
+        with self._lock:
+            self.tasks[slot]["done"] = True
+            self._recompute()
+
+    def tool_event(self, event_type: str, tool: str, **data):
+        """Callback handed to tools to report tool_started/tool_finished"""
+        if event_type == "tool_started":
+            message = f"Calling {tool}..."
+        else:
+            message = f"{tool} finished"
+        self.emit(event_type, message, tool=tool, **data)
+
+    def _current_slot(self) -> Optional[int]:
+        for index, task in enumerate(self.tasks):
+            if not task["done"]:
+                return index
+        return None
+
+    def _recompute(self):
+        if not self.tasks:
+            return
+
+        completed = 0.0
+        for task in self.tasks:
+            if task["done"]:
+                completed += 1.0
+            else:
+                # Cap in-flight tasks below 1 so progress only jumps on completion
+                completed += min(task["iterations"] / (task["max_iter"] + 1), 0.9)
+
+        span = self.END_PROGRESS - self.START_PROGRESS
+        self.progress = max(self.progress, self.START_PROGRESS + span * completed / len(self.tasks))
+
+    def _tokens_used(self) -> Optional[int]:
+        if not self.token_counter:
+            return None
+        try:
+            return self.token_counter()
+        except Exception:
+            return None
@@ -1,133 +1,324 @@
-import os
-import requests
-from typing import Type
-from crewai.tools import BaseTool, tool
-from pydantic import BaseModel, Field
-
-# ===== CUSTOM NEWSDATA.IO TOOL =====
-class NewsSearchInput(BaseModel):
-    """Input schema for basic news search."""
-    query: str = Field(..., description="Search query for news articles")
-    max_results: int = Field(default=8, description="Maximum number of results to return (1-10)")
-
-class BasicNewsSearchTool(BaseTool):
-    name: str = "news_search"
-    description: str = "Search for recent news articles on any topic using NewsData.io API"
-    args_schema: Type[BaseModel] = NewsSearchInput
-
-    def _run(self, query: str, max_results: int = 8) -> str:
-        """Search for news articles using NewsData.io"""
-        
-        api_key = os.getenv('NEWSDATA_API_KEY')
-        if not api_key:
-            return "❌ NewsData API key not found"
-        
-        url = f"https://newsdata.io/api/1/news?apikey={api_key}&q={query}&size={min(max_results, 10)}"
-        
-        try:
-            print(f"🔍 Searching news for: '{query}'")
-            response = requests.get(url, timeout=20)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get('status') != 'success':
-                return f"❌ API Error: {data.get('message', 'Unknown error')}"
-            
-            articles = data.get('results', [])
-            
-            if not articles:
-                return f"No articles found for '{query}'"
-            
-            result = f"📰 Found {len(articles)} news articles for '{query}':\n\n"
-            
-            for i, article in enumerate(articles, 1):
-                title = article.get('title', 'No title')
-                source = article.get('source_name', article.get('source_id', 'Unknown'))
-                date = article.get('pubDate', 'Unknown date')
-                description = article.get('description', 'No description')
-                
-                result += f"**{i}. {title}**\n"
-                result += f"   📰 Source: {source}\n" 
-                result += f"   📅 Date: {date}\n"
-                result += f"   📝 {description[:150]}...\n\n"
-            
-            return result
-            
-        except Exception as e:
-            return f"❌ News search failed: {str(e)}"
-
-# ===== FREE WEB SEARCH TOOL =====
-# @tool("Web Search")
-# def web_search(query: str) -> str:
-#     """Search the web for information using DuckDuckGo (free, no API key needed)"""
-    
-#     try:
-#         # Try to import and use DuckDuckGo
-#         from duckduckgo_search import DDGS
-        
-#         print(f"🌐 Searching web for: '{query}'")
-        
-#         with DDGS() as ddgs:
-#             results = list(ddgs.text(query, max_results=5))
-        
-#         if not results:
-#             return f"No web results found for '{query}'"
-        
-#         output = f"🌐 Web search results for '{query}':\n\n"
-        
-#         for i, result in enumerate(results, 1):
-#             title = result.get('title', 'No title')
-#             url = result.get('href', 'No URL')
-#             snippet = result.get('body', 'No description')
-            
-#             output += f"**{i}. {title}**\n"
-#             output += f"   🔗 {url}\n"
-#             output += f"   📝 {snippet[:150]}...\n\n"
-        
-#         return output
-        
-#     except ImportError:
-#         return "❌ DuckDuckGo search not available. Install with: pip install duckduckgo-search"
-#     except Exception as e:
-#         return f"❌ Web search failed: {str(e)}"
-
-# ===== TOOL COLLECTION FUNCTION =====
-def get_available_tools():
-    """Get list of available tools that work with CrewAI"""
-    
-    tools = []
-    
-    # Always add custom news search tool
-    news_tool = BasicNewsSearchTool()
-    tools.append(news_tool)
-    print("✅ Added: NewsData.io Search Tool (custom)")
-    
-    # Add web search tool (using @tool decorator)
-    # tools.append(web_search)
-    # print("✅ Added: DuckDuckGo Web Search Tool (free)")
-    
-    print(f"🔧 Total tools available: {len(tools)}")
-    return tools
-
-# ===== TEST FUNCTION =====
-def test_all_tools():
-    """Test all available tools"""
-    print("🧪 Testing Available Tools...")
-    print("=" * 50)
-    
-    # Test 1: Custom news search
-    print("1. Testing NewsData.io Tool:")
-    news_tool = BasicNewsSearchTool()
-    result = news_tool._run("artificial intelligence", 3)
-    print(f"   Result: {result[:150]}...\n")
-    
-    # Test 2: Web search
-    # print("2. Testing Web Search Tool:")
-    # result = web_search("latest technology news")
-    # print(f"   Result: {result[:150]}...\n")
-    
-    print("✅ All tools tested!")
-
-if __name__ == "__main__":
-    test_all_tools()
+import os
+import time
+import threading
+import requests
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+from crewai.tools import BaseTool, tool
+from pydantic import BaseModel, Field
+from .metrics import NEWSDATA_ERRORS, NEWSDATA_SECONDS, SEARCH_CACHE_LOOKUPS
+from . import tracing
+
+# ===== SHARED RESOURCES =====
+# Point at a local stub (python -m src.newsdata_stub) to run without the real API
+NEWSDATA_BASE_URL = os.getenv('NEWSDATA_BASE_URL', 'https://newsdata.io/api/1')
+# Result pages an incremental search reads while they still hold only new articles
+MAX_INCREMENTAL_PAGES = int(os.getenv('NEWS_INCREMENTAL_MAX_PAGES', '3'))
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+def get_http_session() -> requests.Session:
+    """Process-wide HTTP session so NewsData calls reuse pooled connections"""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _http_session = session
+        return _http_session
+
+class SearchCache:
+    """Thread-safe TTL cache of NewsData responses, shared by crews running the same searches"""
+    
+    def __init__(self, ttl_seconds: float = 600, max_entries: int = 1000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Tuple) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.time() - entry[0] < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry:
+                del self._entries[key]
+            self.misses += 1
+            return None
+    
+    def put(self, key: Tuple, value: Dict):
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+_shared_search_cache: Optional[SearchCache] = None
+
+def get_shared_search_cache() -> SearchCache:
+    """Process-wide search cache (TTL from NEWS_SEARCH_CACHE_TTL_SECONDS)"""
+    global _shared_search_cache
+    with _http_session_lock:
+        if _shared_search_cache is None:
+            ttl = float(os.getenv('NEWS_SEARCH_CACHE_TTL_SECONDS', '600'))
+            _shared_search_cache = SearchCache(ttl_seconds=ttl)
+        return _shared_search_cache
+
+# ===== CUSTOM NEWSDATA.IO TOOL =====
+class NewsSearchInput(BaseModel):
+    """Input schema for basic news search."""
+    query: str = Field(..., description="Search query for news articles")
+    max_results: int = Field(default=8, description="Maximum number of results to return (1-10)")
+
+class BasicNewsSearchTool(BaseTool):
+    name: str = "news_search"
+    description: str = "Search for recent news articles on any topic using NewsData.io API"
+    args_schema: Type[BaseModel] = NewsSearchInput
+    event_callback: Optional[Callable] = Field(default=None, exclude=True)
+    cancel_token: Optional[Any] = Field(default=None, exclude=True)
+    published_after: Optional[datetime] = Field(default=None, exclude=True)
+    search_cache: Optional[SearchCache] = Field(default=None, exclude=True)
+    max_articles: Optional[int] = Field(default=None, exclude=True)  # Cap on results per search
+
+    def _run(self, query: str, max_results: int = 8) -> str:
+        """Search for news articles using NewsData.io"""
+        
+        # Don't spend API quota on a job that is being cancelled
+        if self.cancel_token and self.cancel_token.cancelled:
+            return f"❌ Search skipped: {self.cancel_token.reason}"
+        
+        if self.max_articles:
+            max_results = min(max_results, self.max_articles)
+        
+        self._emit("tool_started", query=query)
+        start = time.time()
+        with tracing.span(f"tool.{self.name}", attributes={"tool.query": query, "tool.max_results": max_results}):
+            result, articles = self._search(query, max_results)
+            tracing.set_attributes({"tool.articles": len(articles), "tool.ok": not result.startswith("❌")})
+        self._emit(
+            "tool_finished",
+            query=query,
+            duration=round(time.time() - start, 3),
+            ok=not result.startswith("❌"),
+            result=result,
+            articles=articles,
+        )
+        return result
+    
+    def _emit(self, event_type: str, **data):
+        if self.event_callback:
+            self.event_callback(event_type, self.name, **data)
+    
+    def _search(self, query: str, max_results: int) -> Tuple[str, List[Dict]]:
+        """Formatted results for the agent plus the raw articles"""
+        api_key = os.getenv('NEWSDATA_API_KEY')
+        if not api_key:
+            return "❌ NewsData API key not found", []
+        
+        try:
+            size = min(max_results, 10)
+            data = self._fetch(api_key, query, size)
+            
+            if data.get('status') != 'success':
+                return f"❌ API Error: {data.get('message', 'Unknown error')}", []
+            
+            articles = data.get('results', [])
+            
+            # Incremental runs only care about articles newer than the previous run
+            if self.published_after:
+                articles = self._new_articles(api_key, query, size, data)
+                if not articles:
+                    return f"No new articles for '{query}' since {self.published_after.isoformat(sep=' ')}", []
+            
+            if not articles:
+                return f"No articles found for '{query}'", []
+            
+            result = f"📰 Found {len(articles)} news articles for '{query}':\n\n"
+            
+            for i, article in enumerate(articles, 1):
+                title = article.get('title', 'No title')
+                source = article.get('source_name', article.get('source_id', 'Unknown'))
+                date = article.get('pubDate', 'Unknown date')
+                description = article.get('description', 'No description')
+                
+                result += f"**{i}. {title}**\n"
+                result += f"   📰 Source: {source}\n" 
+                result += f"   📅 Date: {date}\n"
+                result += f"   📝 {description[:150]}...\n\n"
+            
+            return result, articles
+            
+        except Exception as e:
+            return f"❌ News search failed: {str(e)}", []
+    
+    def _new_articles(self, api_key: str, query: str, size: int, data: Dict) -> List[Dict]:
+        """Up to `size` articles published after the watermark, starting from the first page
+        
+        NewsData lists the newest articles first, so further pages are read only while
+        every article on the current one is new (up to MAX_INCREMENTAL_PAGES pages).
+        """
+        articles = []
+        for page in range(1, MAX_INCREMENTAL_PAGES + 1):
+            results = data.get('results', [])
+            new = [
+                a for a in results
+                if (parse_pub_date(a.get('pubDate')) or datetime.max) > self.published_after
+            ]
+            articles.extend(new)
+            next_page = data.get('nextPage')
+            if len(articles) >= size or len(new) < len(results) or not next_page or page == MAX_INCREMENTAL_PAGES:
+                break
+            data = self._fetch(api_key, query, size, page=next_page)
+            if data.get('status') != 'success':
+                break
+        return articles[:size]
+    
+    def _fetch(self, api_key: str, query: str, size: int, page: Optional[str] = None) -> Dict:
+        """NewsData response for a query (page token from a previous response's nextPage), cached when possible"""
+        cache_key = (" ".join(query.lower().split()), size, page)
+        if self.search_cache:
+            cached = self.search_cache.get(cache_key)
+            SEARCH_CACHE_LOOKUPS.inc(result="hit" if cached is not None else "miss")
+            tracing.set_attributes({"news.cache": "hit" if cached is not None else "miss"})
+            if cached is not None:
+                print(f"♻️  Cached news results for: '{query}'")
+                return cached
+        
+        url = f"{NEWSDATA_BASE_URL}/news?apikey={api_key}&q={query}&size={size}"
+        if page:
+            url += f"&page={page}"
+        
+        print(f"🔍 Searching news for: '{query}'")
+        start = time.perf_counter()
+        try:
+            with tracing.span("newsdata.request", attributes={"news.query": query, "news.size": size}):
+                response = get_http_session().get(url, timeout=20)
+                tracing.set_attributes({"http.status_code": response.status_code})
+                response.raise_for_status()
+                data = response.json()
+        except Exception as e:
+            NEWSDATA_SECONDS.observe(time.perf_counter() - start, outcome="error")
+            NEWSDATA_ERRORS.inc(reason=_newsdata_error_reason(e))
+            raise
+        
+        NEWSDATA_SECONDS.observe(time.perf_counter() - start, outcome="ok")
+        if data.get('status') != 'success':
+            NEWSDATA_ERRORS.inc(reason="api_error")
+        if self.search_cache and data.get('status') == 'success':
+            self.search_cache.put(cache_key, data)
+        return data
+
+def _newsdata_error_reason(error: Exception) -> str:
+    """Metric label for a failed NewsData request"""
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return f"http_{error.response.status_code}"
+    if isinstance(error, requests.Timeout):
+        return "timeout"
+    if isinstance(error, requests.ConnectionError):
+        return "connection"
+    return type(error).__name__
+
+def parse_pub_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse a NewsData.io pubDate ('2025-09-28 14:30:00', UTC)"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', ''))
+    except ValueError:
+        return None
+
+# ===== FREE WEB SEARCH TOOL =====
+# @tool("Web Search")
+# def web_search(query: str) -> str:
+#     """Search the web for information using DuckDuckGo (free, no API key needed)"""
+    
+#     try:
+#         # Try to import and use DuckDuckGo
+#         from duckduckgo_search import DDGS
+        
+#         print(f"🌐 Searching web for: '{query}'")
+        
+#         with DDGS() as ddgs:
+#             results = list(ddgs.text(query, max_results=5))
+        
+#         if not results:
+#             return f"No web results found for '{query}'"
+        
+#         output = f"🌐 Web search results for '{query}':\n\n"
+        
+#         for i, result in enumerate(results, 1):
+#             title = result.get('title', 'No title')
+#             url = result.get('href', 'No URL')
+#             snippet = result.get('body', 'No description')
+            
+#             output += f"**{i}. {title}**\n"
+#             output += f"   🔗 {url}\n"
+#             output += f"   📝 {snippet[:150]}...\n\n"
+        
+#         return output
+        
+#     except ImportError:
+#         return "❌ DuckDuckGo search not available. Install with: pip install duckduckgo-search"
+#     except Exception as e:
+#         return f"❌ Web search failed: {str(e)}"
+
+# ===== TOOL COLLECTION FUNCTION =====
+def get_available_tools(event_callback: Optional[Callable] = None, cancel_token=None,
+                        published_after: Optional[datetime] = None,
+                        search_cache: Optional[SearchCache] = None,
+                        max_articles: Optional[int] = None):
+    """Get list of available tools that work with CrewAI"""
+    
+    tools = []
+    
+    # Always add custom news search tool
+    news_tool = BasicNewsSearchTool(
+        event_callback=event_callback,
+        cancel_token=cancel_token,
+        published_after=published_after,
+        search_cache=search_cache,
+        max_articles=max_articles,
+    )
+    tools.append(news_tool)
+    print("✅ Added: NewsData.io Search Tool (custom)")
+    
+    # Add web search tool (using @tool decorator)
+    # tools.append(web_search)
+    # print("✅ Added: DuckDuckGo Web Search Tool (free)")
+    
+    print(f"🔧 Total tools available: {len(tools)}")
+    return tools
+
+# ===== TEST FUNCTION =====
+def test_all_tools():
+    """Test all available tools"""
+    print("🧪 Testing Available Tools...")
+    print("=" * 50)
+    
+    # Test 1: Custom news search
+    print("1. Testing NewsData.io Tool:")
+    news_tool = BasicNewsSearchTool()
+    result = news_tool._run("artificial intelligence", 3)
+    print(f"   Result: {result[:150]}...\n")
+    
+    # Test 2: Web search
+    # print("2. Testing Web Search Tool:")
+    # result = web_search("latest technology news")
+    # print(f"   Result: {result[:150]}...\n")
+    
+    print("✅ All tools tested!")
+
+if __name__ == "__main__":
+    test_all_tools()
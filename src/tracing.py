@@ -0,0 +1,438 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    from opentelemetry import context as otel_context, trace
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExportResult
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+    from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+except ImportError:  # Optional: without OpenTelemetry nothing is traced
+    trace = None
+
+TRACE_DIR = os.path.join("outputs", "traces")
+
+_lock = threading.Lock()
+_tracer = None
+_provider = None
+_configured = False
+
+def exporter_names() -> List[str]:
+    """Exporters from TRACE_EXPORTER: "file" (default), "otlp", both ("file,otlp") or "none" """
+    names = [name.strip().lower() for name in os.getenv("TRACE_EXPORTER", "file").split(",")]
+    return [name for name in names if name and name != "none"]
+
+def trace_dir() -> str:
+    return os.getenv("TRACE_DIR", TRACE_DIR)
+
+class FileSpanExporter:
+    """Appends finished spans as JSON lines to <directory>/<trace_id>.jsonl
+
+    One file per trace lets the API show a job's trace without a collector, even
+    when its spans come from several processes.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def export(self, spans) -> "SpanExportResult":
+        lines: Dict[str, List[str]] = {}
+        for span in spans:
+            record = span_record(span)
+            lines.setdefault(record["trace_id"], []).append(json.dumps(record, default=str))
+        try:
+            with self._lock:
+                for trace_id, records in lines.items():
+                    with open(os.path.join(self.directory, f"{trace_id}.jsonl"), "a", encoding="utf-8") as f:
+                        f.write("\n".join(records) + "\n")
+        except OSError as e:
+            print(f"⚠️  Could not write trace spans: {str(e)}")
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self):
+        pass
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+def span_record(span) -> Dict[str, Any]:
+    """Plain-dict form of a finished SDK span"""
+    parent = span.parent
+    return {
+        "trace_id": format(span.context.trace_id, "032x"),
+        "span_id": format(span.context.span_id, "016x"),
+        "parent_id": format(parent.span_id, "016x") if parent else None,
+        "name": span.name,
+        "kind": span.kind.name.lower(),
+        "start": span.start_time / 1e9,
+        "end": span.end_time / 1e9,
+        "duration_ms": round((span.end_time - span.start_time) / 1e6, 3),
+        "status": "error" if span.status.status_code == StatusCode.ERROR else "ok",
+        "error": span.status.description,
+        "attributes": dict(span.attributes or {}),
+    }
+
+def _create_provider():
+    """Tracer provider for the configured exporters (None when tracing is off)
+
+    Both exporters get spans in batches from a background thread, so ending a span
+    never waits on disk or the network: the file exporter, and the OTLP exporter
+    (OTEL_EXPORTER_OTLP_ENDPOINT, default http://localhost:4318). flush() exports
+    what is still queued.
+    """
+    names = exporter_names()
+    if trace is None or not names:
+        return None
+
+    provider = TracerProvider(resource=Resource.create({
+        "service.name": os.getenv("OTEL_SERVICE_NAME", "news-research"),
+    }))
+    for name in names:
+        if name == "file":
+            provider.add_span_processor(BatchSpanProcessor(FileSpanExporter(trace_dir())))
+        elif name == "otlp":
+            try:
+                from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+            except ImportError:
+                print("⚠️  TRACE_EXPORTER=otlp needs opentelemetry-exporter-otlp-proto-http")
+                continue
+            provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+        else:
+            print(f"⚠️  Unknown trace exporter '{name}' ignored")
+    return provider
+
+def get_tracer():
+    """Tracer of this process, or None when tracing is disabled
+
+    Uses a provider of its own rather than OpenTelemetry's global one, which
+    CrewAI's telemetry may already have claimed.
+    """
+    global _tracer, _provider, _configured
+    if not _configured:
+        with _lock:
+            if not _configured:
+                _provider = _create_provider()
+                _tracer = _provider.get_tracer("news-research") if _provider else None
+                _configured = True
+    return _tracer
+
+def flush():
+    """Export spans still waiting in batch processors"""
+    if _provider is not None:
+        _provider.force_flush()
+
+@contextmanager
+def span(name: str, parent: Optional[str] = None, attributes: Optional[Dict[str, Any]] = None,
+         kind: str = "internal") -> Iterator[Any]:
+    """Run the block in a new current span
+
+    The span is a child of the current span, or of the `parent` traceparent when one is
+    given. Exceptions leaving the block are recorded on it. Yields None when tracing is off.
+    """
+    tracer = get_tracer()
+    if tracer is None:
+        yield None
+        return
+
+    context = _extract(parent) if parent else None
+    with tracer.start_as_current_span(
+        name, context=context, kind=SpanKind[kind.upper()], attributes=_clean(attributes),
+    ) as current:
+        yield current
+
+def record_span(name: str, start: float, end: float, parent: Optional[str] = None,
+                attributes: Optional[Dict[str, Any]] = None, context=None, error: Optional[str] = None):
+    """Record a span that has already happened (`start`/`end` are epoch seconds)
+
+    Its parent is the `parent` traceparent, else the OpenTelemetry `context`, else the
+    current span.
+    """
+    tracer = get_tracer()
+    if tracer is None:
+        return
+
+    if parent:
+        context = _extract(parent)
+    recorded = tracer.start_span(
+        name, context=context, attributes=_clean(attributes), start_time=int(start * 1e9),
+    )
+    if error:
+        recorded.set_status(Status(StatusCode.ERROR, error))
+    recorded.end(end_time=int(max(start, end) * 1e9))
+
+def set_attributes(attributes: Dict[str, Any]):
+    """Add attributes to the current span"""
+    if get_tracer() is None:
+        return
+    current = trace.get_current_span()
+    if current.is_recording():
+        current.set_attributes(_clean(attributes))
+
+def current_traceparent() -> Optional[str]:
+    """W3C traceparent of the current span, for continuing the trace elsewhere"""
+    if get_tracer() is None:
+        return None
+    carrier: Dict[str, str] = {}
+    TraceContextTextMapPropagator().inject(carrier)
+    return carrier.get("traceparent")
+
+@contextmanager
+def attach(traceparent: Optional[str]) -> Iterator[None]:
+    """Make spans started in the block children of `traceparent` (e.g. in a worker process)"""
+    if not traceparent or get_tracer() is None:
+        yield
+        return
+
+    token = otel_context.attach(_extract(traceparent))
+    try:
+        yield
+    finally:
+        otel_context.detach(token)
+
+def _extract(traceparent: str):
+    return TraceContextTextMapPropagator().extract({"traceparent": traceparent})
+
+def _clean(attributes: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Drop None values and stringify what OpenTelemetry can't store"""
+    cleaned = {}
+    for key, value in (attributes or {}).items():
+        if value is None:
+            continue
+        cleaned[key] = value if isinstance(value, (str, bool, int, float)) else str(value)
+    return cleaned
+
+def trace_id_of(traceparent: Optional[str]) -> Optional[str]:
+    """Trace id part of a traceparent ("00-<trace_id>-<span_id>-<flags>")"""
+    parts = (traceparent or "").split("-")
+    return parts[1] if len(parts) == 4 else None
+
+class AgentSteps:
+    """Spans for an agent's steps: reasoning until a tool call, the tool call, and so on
+
+    A step ends at the step callback for the agent's action (CrewAI reports the tool
+    result just before it) and the final answer ends at close(), from the task
+    callback. The open step is made the current span, so the LLM calls and tool
+    searches made during it nest under it.
+    """
+
+    def __init__(self, attributes: Optional[Dict[str, Any]] = None):
+        self.attributes = attributes or {}
+        self.iteration = 0
+        self._span = None
+        self._token = None
+        self._context = otel_context.get_current() if get_tracer() is not None else None
+        self._start_next()
+
+    def _start_next(self):
+        tracer = get_tracer()
+        if tracer is None:
+            return
+        self.iteration += 1
+        self._span = tracer.start_span(
+            "agent.step", context=self._context,
+            attributes=_clean({**self.attributes, "agent.iteration": self.iteration}),
+        )
+        self._token = otel_context.attach(trace.set_span_in_context(self._span, self._context))
+
+    def step(self, step):
+        tool = getattr(step, "tool", None)
+        if self._span is None or (tool is None and not hasattr(step, "output")):
+            return  # Tool results are followed by the action that asked for them
+        finished = tool is None
+        self._end({"agent.step": "final_answer" if finished else "tool", "agent.tool": tool})
+        if not finished:
+            self._start_next()
+
+    def close(self):
+        self._end({"agent.step": "final_answer"})
+
+    def _end(self, attributes: Dict[str, Any]):
+        if self._span is not None:
+            self._span.set_attributes(_clean(attributes))
+            self._span.end()
+            self._span = None
+        if self._token is not None:
+            _detach(self._token)
+            self._token = None
+
+def _detach(token):
+    """Detach a context attached with `token` when that happened in the current context
+
+    CrewAI runs step and task callbacks in copies of the executor's context, so a step
+    may end in another context than it started in; the attachment then lasts until
+    that context is discarded or the enclosing span's exit resets it.
+    """
+    var = getattr(token, "var", None)
+    if var is None:  # Not the contextvars runtime context
+        otel_context.detach(token)
+        return
+    try:
+        var.reset(token)
+    except ValueError:
+        pass  # Created in a different Context
+
+# ===== LLM CALLS =====
+_llm_tracing_lock = threading.Lock()
+_llm_tracing_installed = False
+_llm_calls: Dict[str, Any] = {}
+
+def install_llm_tracing():
+    """Record a span for every LLM call from CrewAI's LLM call events (idempotent)
+
+    CrewAI runs event handlers with a copy of the caller's context, so each call
+    nests under the agent step that made it.
+    """
+    global _llm_tracing_installed
+    if get_tracer() is None:
+        return
+    with _llm_tracing_lock:
+        if _llm_tracing_installed:
+            return
+        _llm_tracing_installed = True
+
+    from crewai.events import crewai_event_bus
+    from crewai.events.types.llm_events import LLMCallCompletedEvent, LLMCallFailedEvent, LLMCallStartedEvent
+    from .metrics import llm_provider_name
+
+    @crewai_event_bus.on(LLMCallStartedEvent)
+    def _on_started(source, event):
+        with _llm_tracing_lock:
+            if len(_llm_calls) > 10_000:
+                _llm_calls.clear()  # Calls that never finished
+            _llm_calls[event.call_id] = (event.timestamp.timestamp(), otel_context.get_current())
+
+    def _record(source, event, error: Optional[str] = None):
+        with _llm_tracing_lock:
+            started = _llm_calls.pop(event.call_id, None)
+        if started is None:
+            return
+        usage = getattr(event, "usage", None) or {}
+        record_span(
+            "llm.call", started[0], event.timestamp.timestamp(), context=started[1], error=error,
+            attributes={
+                "llm.provider": llm_provider_name(source),
+                "llm.model": getattr(event, "model", None),
+                "llm.prompt_tokens": usage.get("prompt_tokens"),
+                "llm.completion_tokens": usage.get("completion_tokens"),
+            },
+        )
+
+    @crewai_event_bus.on(LLMCallCompletedEvent)
+    def _on_completed(source, event):
+        _record(source, event)
+
+    @crewai_event_bus.on(LLMCallFailedEvent)
+    def _on_failed(source, event):
+        _record(source, event, error=str(getattr(event, "error", "LLM call failed")))
+
+# ===== READING TRACES =====
+def load_spans(trace_id: str) -> List[Dict[str, Any]]:
+    """Spans the file exporter wrote for a trace, oldest first"""
+    flush()  # Include this process's spans still waiting for their batch
+    path = os.path.join(trace_dir(), f"{trace_id}.jsonl")
+    if not trace_id or not os.path.exists(path):
+        return []
+
+    spans = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                spans.append(json.loads(line))
+            except ValueError:
+                continue  # Line cut short by a crash
+    return sorted(spans, key=lambda s: s["start"])
+
+def critical_path(spans: List[Dict[str, Any]], root_id: str) -> List[Dict[str, Any]]:
+    """Spans that determined how long the root took
+
+    Starting at the root, takes the child that finished last, then the child that
+    finished last before that one started, and so on, descending into each.
+    """
+    by_id = {s["span_id"]: s for s in spans}
+    root = by_id.get(root_id)
+    if root is None:
+        return []
+    children: Dict[str, List[Dict[str, Any]]] = {}
+    for s in spans:
+        children.setdefault(s["parent_id"], []).append(s)
+
+    path = []
+
+    def visit(current: Dict[str, Any]):
+        path.append(current)
+        cursor = current["end"]
+        for child in sorted(children.get(current["span_id"], []), key=lambda s: s["end"], reverse=True):
+            if child["end"] <= cursor:
+                visit(child)
+                cursor = child["start"]
+
+    visit(root)
+    return [
+        {
+            "name": s["name"],
+            "span_id": s["span_id"],
+            "offset_ms": round((s["start"] - root["start"]) * 1000, 3),
+            "duration_ms": s["duration_ms"],
+        }
+        for s in sorted(path, key=lambda s: s["start"])
+    ]
+
+def _covered_seconds(intervals: List[tuple]) -> float:
+    """Total time covered by possibly overlapping (start, end) intervals"""
+    total, cursor = 0.0, None
+    for start, end in sorted(intervals):
+        if cursor is None or start > cursor:
+            total += end - start
+            cursor = end
+        elif end > cursor:
+            total += end - cursor
+            cursor = end
+    return total
+
+def time_breakdown(spans: List[Dict[str, Any]], root: Dict[str, Any]) -> Dict[str, float]:
+    """Milliseconds of the root span spent waiting on LLMs, on NewsData and everything else
+
+    Overlapping calls (parallel angles) are counted once; "other_ms" is CrewAI and
+    application overhead between them.
+    """
+    def within(name: str) -> List[tuple]:
+        return [
+            (max(s["start"], root["start"]), min(s["end"], root["end"]))
+            for s in spans
+            if s["name"] == name and s["end"] > root["start"] and s["start"] < root["end"]
+        ]
+
+    llm, newsdata = within("llm.call"), within("newsdata.request")
+    total = root["end"] - root["start"]
+    return {
+        "total_ms": round(total * 1000, 3),
+        "llm_ms": round(_covered_seconds(llm) * 1000, 3),
+        "newsdata_ms": round(_covered_seconds(newsdata) * 1000, 3),
+        "other_ms": round(max(0.0, total - _covered_seconds(llm + newsdata)) * 1000, 3),
+    }
+
+def prune_traces(max_age_hours: float) -> int:
+    """Delete trace files not written to for `max_age_hours`"""
+    directory = trace_dir()
+    if not os.path.isdir(directory):
+        return 0
+
+    cutoff = time.time() - max_age_hours * 3600
+    removed = 0
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        try:
+            if name.endswith(".jsonl") and os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+        except OSError:
+            continue
+    return removed
@@ -0,0 +1,206 @@
+import asyncio
+import os
+from datetime import datetime, timedelta
+
+os.environ.setdefault("TRACE_EXPORTER", "none")
+
+import pytest
+
+from api.background_tasks import JobManager, QueueFull
+from api.models import JobPriority, JobStatus
+from src.cancellation import JobCancelled
+from src.checkpoints import CheckpointStore
+
+class StubBackend:
+    """Worker backend whose executions finish when the test says so"""
+
+    name = "stub"
+
+    def __init__(self, outcome=None):
+        self.outcome = outcome or {"result": "Report", "research_file": None, "report_file": None}
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.specs = []
+
+    async def run(self, job_id, spec, on_event, token):
+        self.specs.append(spec)
+        on_event({"type": "step", "message": "Researching", "progress": 50.0, "tokens": 10})
+        self.started.set()
+        await self.release.wait()
+        if token.cancelled:
+            raise JobCancelled(token.reason)
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+    def kill(self, job_id):
+        return False
+
+    def shutdown(self):
+        pass
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # Checkpoints and outputs are written under the working directory
+    manager = JobManager(job_store="memory", concurrency=1)
+    manager.backend = StubBackend()
+    yield manager
+    manager.shutdown()
+
+def run_next(manager):
+    """Claim the next queued job and run it to the end on the stub backend"""
+    async def run():
+        manager._wakeup = asyncio.Event()
+        manager.backend.release.set()
+        await manager._run_job(manager.store.claim_next(manager.worker_id))
+    asyncio.run(run())
+
+def test_new_job_is_queued(manager):
+    job_id = manager.create_job("AI news", "mock")
+
+    job = manager.store.get(job_id)
+    assert job["status"] == JobStatus.pending
+    assert job["coalesced_with"] is None and job["cached_from"] is None
+    assert manager.store.queue_position(job) == 1
+
+def test_full_queue_rejects_jobs(manager):
+    manager.max_queue_depth = 1
+    manager.create_job("AI news", "mock")
+
+    with pytest.raises(QueueFull):
+        manager.create_job("Climate news", "mock")
+
+def test_fresh_result_is_served_from_cache(manager, tmp_path):
+    report = tmp_path / "report.md"
+    report.write_text("Report")
+    first = manager.create_job("AI news", "mock")
+    manager.update_job(first, status=JobStatus.completed, completed_at=datetime.now(),
+                       result="Report", report_file=str(report))
+
+    cached = manager.store.get(manager.create_job("ai  NEWS", "mock"))
+    assert cached["status"] == JobStatus.completed
+    assert cached["cached_from"] == first and cached["report_file"] == str(report)
+
+    refreshed = manager.store.get(manager.create_job("AI news", "mock", force_refresh=True))
+    assert refreshed["status"] == JobStatus.pending and refreshed["cached_from"] is None
+
+    # Too old to reuse
+    manager.update_job(first, completed_at=datetime.now() - timedelta(minutes=manager.result_cache_minutes + 1))
+    assert manager.store.get(manager.create_job("AI news", "mock"))["cached_from"] is None
+
+def test_identical_request_joins_inflight_job(manager):
+    owner = manager.create_job("AI news", "mock", priority=JobPriority.low)
+    follower = manager.create_job("AI news", "mock", priority=JobPriority.high)
+    other = manager.create_job("AI news", "mock", max_articles=3)
+
+    assert manager.store.get(follower)["coalesced_with"] == owner
+    assert manager.store.get(other)["coalesced_with"] is None
+    # The shared execution runs at the most urgent priority that asked for it
+    assert manager.store.get(owner)["priority"] == manager.store.get(follower)["priority"]
+
+    # Followers report the owner's progress while they wait
+    manager.update_job(owner, status=JobStatus.running, progress=40.0)
+    assert manager.get_job_status(follower)["progress"] == 40.0
+
+def test_followers_get_the_owner_outcome(manager):
+    owner = manager.create_job("AI news", "mock")
+    follower = manager.create_job("AI news", "mock")
+
+    run_next(manager)
+
+    assert manager.store.claim_next(manager.worker_id) is None  # The follower never ran a crew
+    assert len(manager.backend.specs) == 1
+    owner_job, follower_job = manager.store.get(owner), manager.store.get(follower)
+    for job in (owner_job, follower_job):
+        assert job["status"] == JobStatus.completed and job["result"] == "Report"
+    assert follower_job["started_at"] == owner_job["started_at"]
+    assert owner_job["tokens_used"] == 10
+
+def test_followers_share_a_failure(manager):
+    manager.backend.outcome = RuntimeError("LLM unavailable")
+    owner = manager.create_job("AI news", "mock")
+    follower = manager.create_job("AI news", "mock")
+
+    run_next(manager)
+
+    for job_id in (owner, follower):
+        job = manager.store.get(job_id)
+        assert job["status"] == JobStatus.failed and job["error_message"] == "LLM unavailable"
+
+def test_cancelling_a_follower_detaches_it(manager):
+    owner = manager.create_job("AI news", "mock")
+    follower = manager.create_job("AI news", "mock")
+
+    assert manager.cancel_job(follower)
+
+    assert manager.store.get(follower)["status"] == JobStatus.cancelled
+    assert manager.store.get(owner)["status"] == JobStatus.pending
+    assert manager.store.followers(owner) == []
+
+def test_cancelling_a_pending_owner_hands_over(manager):
+    owner = manager.create_job("AI news", "mock")
+    second = manager.create_job("AI news", "mock")
+    third = manager.create_job("AI news", "mock")
+
+    assert manager.cancel_job(owner)
+
+    assert manager.store.get(owner)["status"] == JobStatus.cancelled
+    new_owner = manager.store.get(second)
+    assert new_owner["status"] == JobStatus.pending and new_owner["coalesced_with"] is None
+    assert manager.store.get(third)["coalesced_with"] == second
+
+    run_next(manager)
+    assert manager.store.get(second)["status"] == JobStatus.completed
+    assert manager.store.get(third)["status"] == JobStatus.completed
+    assert manager.store.get(owner)["status"] == JobStatus.cancelled
+
+def test_cancelling_a_running_owner_hands_over(manager):
+    owner = manager.create_job("AI news", "mock")
+    follower = manager.create_job("AI news", "mock")
+
+    async def run():
+        manager._wakeup = asyncio.Event()
+        execution = asyncio.create_task(manager._run_job(manager.store.claim_next(manager.worker_id)))
+        await manager.backend.started.wait()
+
+        assert manager.cancel_job(owner)
+        taken_over = manager.store.get(follower)
+        assert taken_over["status"] == JobStatus.running and taken_over["coalesced_with"] is None
+
+        manager.backend.release.set()
+        await execution
+    asyncio.run(run())
+
+    assert manager.store.get(owner)["status"] == JobStatus.cancelled
+    assert manager.store.get(follower)["status"] == JobStatus.completed
+
+def test_cancelling_a_lone_running_job_stops_its_crew(manager):
+    job_id = manager.create_job("AI news", "mock")
+
+    async def run():
+        manager._wakeup = asyncio.Event()
+        execution = asyncio.create_task(manager._run_job(manager.store.claim_next(manager.worker_id)))
+        await manager.backend.started.wait()
+        assert manager.cancel_job(job_id, "Not needed")
+        manager.backend.release.set()
+        await execution
+    asyncio.run(run())
+
+    job = manager.store.get(job_id)
+    assert job["status"] == JobStatus.cancelled and job["error_message"] == "Not needed"
+
+def test_resume_rebuilds_a_lost_job_from_its_manifest(manager):
+    job_id = manager.create_job("AI news", "mock", priority=JobPriority.high, max_articles=3)
+    run_next(manager)
+    # What the crew records when it starts
+    CheckpointStore(job_id).save_metadata(topic="AI news", llm_provider="mock", parallel_angles=1,
+                                          incremental=False, max_articles=3)
+
+    # Lost in a restart
+    assert manager.store.delete_completed_before(datetime.now() + timedelta(minutes=1)) == [job_id]
+    assert manager.resume_job(job_id)
+
+    job = manager.store.get(job_id)
+    assert job["status"] == JobStatus.pending
+    assert job["max_articles"] == 3
+    assert job["priority"] == manager.store.get(manager.create_job("Other", "mock", priority=JobPriority.high))["priority"]
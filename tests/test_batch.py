@@ -0,0 +1,13 @@
+from src.batch import percentile
+
+def test_percentile_nearest_rank():
+    assert percentile([5, 1, 4, 2, 3], 50) == 3
+    assert percentile(list(range(1, 22)), 50) == 11
+    assert percentile(list(range(1, 21)), 95) == 19
+    assert percentile([1, 2, 3, 4], 50) == 2
+
+def test_percentile_bounds():
+    assert percentile([], 50) is None
+    assert percentile([7.0], 95) == 7.0
+    assert percentile([1, 2, 3], 0) == 1
+    assert percentile([1, 2, 3], 100) == 3
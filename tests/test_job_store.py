@@ -0,0 +1,140 @@
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from api.job_store import JOB_FIELDS, InMemoryJobStore, SQLiteJobStore
+from api.models import JobStatus
+
+START = datetime(2026, 1, 1, 12, 0)
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    store = InMemoryJobStore() if request.param == "memory" else SQLiteJobStore(str(tmp_path / "jobs.db"))
+    yield store
+    store.close()
+
+def make_job(store, job_id, minutes=0, **fields):
+    job = {field: None for field in JOB_FIELDS}
+    job.update(
+        id=job_id, topic="AI news", topic_key="ai news", llm_provider="mock", max_articles=8,
+        parallel_angles=1, incremental=False, priority=1, status=JobStatus.pending, progress=0.0,
+        created_at=START + timedelta(minutes=minutes), attempts=0, version=0, profile=False,
+    )
+    job.update(fields)
+    store.create(job)
+    return job
+
+def test_claim_heartbeat_and_orphan_recovery(store):
+    make_job(store, "a")
+    make_job(store, "b", minutes=1)
+    make_job(store, "c", minutes=2, priority=2)
+
+    claimed = store.claim_next("w1")
+    assert claimed["id"] == "c"  # Highest priority first
+    assert claimed["status"] == JobStatus.running and claimed["attempts"] == 1
+    assert store.claim_next("w1")["id"] == "a"  # Then oldest first
+    assert store.claim_next("w2")["id"] == "b"
+    assert store.claim_next("w2") is None
+
+    store.update("c", cancel_requested="Stop")
+    assert store.heartbeat("w1", concurrency=2) == {"c": "Stop"}
+    assert [w["id"] for w in store.list_workers(START)] == ["w1"]
+    assert store.capacity(START) == 2
+
+    # w1 keeps heartbeating, w2 went silent; b has used up its attempts
+    store.update("b", attempts=2)
+    stale_before = datetime.now() + timedelta(seconds=1)
+    store.heartbeat("w2", concurrency=1)
+    store.update("a", heartbeat_at=stale_before + timedelta(hours=1))
+    store.update("c", heartbeat_at=stale_before + timedelta(hours=1))
+    make_job(store, "follower", minutes=3, coalesced_with="b")
+
+    orphans = store.recover_orphans("Worker lost", stale_before, max_attempts=2)
+
+    assert orphans == {"b": JobStatus.failed}
+    failed = store.get("b", events=0)
+    assert failed["error_message"] == "Worker lost" and failed["completed_at"] is not None
+    assert store.get("a", events=0)["status"] == JobStatus.running
+    assert store.get("follower", events=0)["coalesced_with"] is None  # Released to queue on its own
+    assert store.list_workers(START) == []
+
+def test_orphans_below_max_attempts_are_requeued(store):
+    make_job(store, "a")
+    store.claim_next("w1")
+
+    orphans = store.recover_orphans("Worker lost", datetime.now() + timedelta(seconds=1), max_attempts=2)
+
+    assert orphans == {"a": JobStatus.pending}
+    job = store.get("a", events=0)
+    assert job["status"] == JobStatus.pending and job["worker_id"] is None
+    assert job["current_step"] == "Re-queued: Worker lost"
+    assert store.claim_next("w2")["attempts"] == 2
+
+def test_counts_follow_status_changes(store):
+    for index in range(3):
+        make_job(store, f"job{index}", minutes=index)
+    store.claim_next("w1")
+    store.update("job1", status=JobStatus.completed, completed_at=START)
+    store.update("job1", progress=100.0)  # No status change
+
+    assert store.count() == 3
+    assert store.count(JobStatus.pending) == 1
+    assert store.count(JobStatus.running) == 1
+    assert store.count(JobStatus.completed) == 1
+
+    assert store.delete_completed_before(START + timedelta(minutes=1)) == ["job1"]
+    assert store.count() == 2
+    assert store.count(JobStatus.completed) == 0
+
+def test_batch_concurrency_limits_claims(store):
+    store.create_batch({"id": "batch", "job_ids": ["x", "y"], "concurrency": 1, "created_at": START})
+    make_job(store, "x", batch_id="batch")
+    make_job(store, "y", minutes=1, batch_id="batch")
+    make_job(store, "z", minutes=2)
+
+    assert store.claim_next("w1")["id"] == "x"
+    assert store.claim_next("w1")["id"] == "z"  # y waits for its batch
+    assert store.claim_next("w1") is None
+    store.update("x", status=JobStatus.completed)
+    assert store.claim_next("w1")["id"] == "y"
+
+def test_page_keyset_order(store):
+    # Two jobs share a created_at, so the id breaks the tie
+    for job_id, minutes in (("a", 0), ("c", 1), ("b", 1), ("d", 2), ("e", 3)):
+        make_job(store, job_id, minutes=minutes)
+
+    def walk(newest_first):
+        ids, after = [], None
+        while True:
+            page = store.page(newest_first=newest_first, after=after, limit=2)
+            if not page:
+                return ids
+            ids += [job["id"] for job in page]
+            after = (page[-1]["created_at"], page[-1]["id"])
+
+    assert walk(newest_first=True) == ["e", "d", "c", "b", "a"]
+    assert walk(newest_first=False) == ["a", "b", "c", "d", "e"]
+
+    store.update("d", status=JobStatus.completed)
+    assert [job["id"] for job in store.page(status=JobStatus.pending, limit=10)] == ["e", "c", "b", "a"]
+
+def test_sqlite_migrates_older_databases(tmp_path):
+    # A jobs table from before any of the migrated columns existed
+    path = str(tmp_path / "old.db")
+    columns = [field for field in JOB_FIELDS if field not in SQLiteJobStore.MIGRATIONS]
+    conn = sqlite3.connect(path)
+    conn.execute(f"CREATE TABLE jobs ({', '.join(columns)})")
+    conn.execute(
+        "INSERT INTO jobs (id, topic, status, created_at) VALUES ('old', 'AI news', 'completed', ?)",
+        (START.isoformat(),),
+    )
+    conn.commit()
+    conn.close()
+
+    store = SQLiteJobStore(path)
+    job = store.get("old", events=0)
+    assert job["priority"] == 1 and job["attempts"] == 0 and job["profile"] is False
+    make_job(store, "new")
+    assert store.get("new", events=0)["max_articles"] == 8
+    store.close()
@@ -0,0 +1,51 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+import requests
+
+from src import tools
+from src.newsdata_stub import NewsDataStub, start_stub_server
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    server = start_stub_server(stub=NewsDataStub(page_size=2))
+    monkeypatch.setattr(tools, "NEWSDATA_BASE_URL", server.base_url)
+    monkeypatch.setenv("NEWSDATA_API_KEY", "stub")
+    yield server
+    server.shutdown()
+
+def test_stub_pages_through_a_fixture(stub_server):
+    url = f"{stub_server.base_url}/news?apikey=stub&q=markets&size=10"
+    first = requests.get(url).json()
+    second = requests.get(f"{url}&page={first['nextPage']}").json()
+    last = requests.get(f"{url}&page={second['nextPage']}").json()
+
+    assert [len(page["results"]) for page in (first, second, last)] == [2, 2, 1]
+    assert last["nextPage"] is None
+    titles = [a["title"] for page in (first, second, last) for a in page["results"]]
+    assert len(set(titles)) == 5
+
+def test_stub_counts_concurrent_requests(stub_server):
+    url = f"{stub_server.base_url}/news?apikey=stub&q=markets&size=1"
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda _: requests.get(url), range(40)))
+    assert stub_server.stub.requests == 40
+
+def test_incremental_search_reads_pages_until_an_old_article(stub_server):
+    # default.json holds five articles, newest first; three are newer than this
+    tool = tools.BasicNewsSearchTool(published_after=datetime(2025, 9, 27, 12, 0))
+
+    result, articles = tool._search("markets", max_results=5)
+
+    assert [a["pubDate"] for a in articles] == ["2025-09-28 14:30:00", "2025-09-28 11:05:00", "2025-09-27 19:45:00"]
+    assert stub_server.stub.requests == 2  # The second page held an older article
+    assert "3 news articles" in result
+
+def test_incremental_search_stops_once_it_has_enough(stub_server):
+    tool = tools.BasicNewsSearchTool(published_after=datetime(2025, 9, 1))
+
+    _, articles = tool._search("markets", max_results=2)
+
+    assert len(articles) == 2
+    assert stub_server.stub.requests == 1
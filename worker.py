@@ -0,0 +1,75 @@
+import argparse
+import asyncio
+import os
+import signal
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from dotenv import load_dotenv
+
+load_dotenv(override=True)
+
+from api.background_tasks import JobManager
+from api.metrics import install_job_metrics
+from src.metrics import REGISTRY
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip("/") != "/metrics":
+            self.send_error(404)
+            return
+        payload = REGISTRY.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes would flood the worker log
+
+def serve_metrics(port: int) -> ThreadingHTTPServer:
+    """Expose the worker's metrics at http://0.0.0.0:<port>/metrics on a background thread"""
+    server = ThreadingHTTPServer(("0.0.0.0", port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"📈 Metrics on http://0.0.0.0:{server.server_address[1]}/metrics")
+    return server
+
+async def run_worker(concurrency: int, metrics_port: Optional[int] = None):
+    """Run queued jobs from the shared job store until SIGINT/SIGTERM
+
+    The first signal drains: no new jobs are claimed and running ones finish. A second
+    signal exits at once; the jobs it was running are re-queued when their lease expires.
+    """
+    manager = JobManager(concurrency=concurrency)
+    if metrics_port is not None:
+        install_job_metrics(manager)
+        serve_metrics(metrics_port)
+    manager.start()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, lambda: os._exit(1) if stop.is_set() else stop.set())
+
+    await stop.wait()
+    print("🛑 Draining: finishing running jobs (signal again to exit now)...")
+    await manager.drain()
+    manager.shutdown()
+    print("👋 Worker stopped")
+
+def main():
+    parser = argparse.ArgumentParser(description="Standalone worker for jobs queued through the API")
+    parser.add_argument("--concurrency", type=int, default=int(os.getenv('JOB_CONCURRENCY', '3')),
+                        help="Crews run at the same time (defaults to JOB_CONCURRENCY)")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help="Serve Prometheus metrics on this port")
+    args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    asyncio.run(run_worker(args.concurrency, args.metrics_port))
+
+if __name__ == "__main__":
+    main()